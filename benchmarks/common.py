@@ -0,0 +1,216 @@
+'''Shared tools of the benchmark suite: timing, synthetic schemas, storages and result files.'''
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
+
+import json
+import time
+import random
+import sqlite3
+import platform
+import statistics
+import itertools
+import tempfile
+from typing import Any, Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime as Datetime, date as Date, timedelta as Timedelta
+
+from dbrequest import BaseDBRequest, AutoField
+from dbrequest.executors import SQLiteExecutor
+
+
+SEED = 20240101
+_memory_counter = itertools.count()
+
+
+class Result:
+    '''One benchmark measurement. `metrics` are additional numbers of the measurement (e.g. sizes), not compared.'''
+    def __init__(self, name: str, params: dict[str, Any], ops: int, samples: list[float], metrics: dict[str, float] | None = None) -> None:
+        self.name = name
+        self.params = params
+        self.ops = ops
+        self.samples = samples
+        self.metrics = metrics or {}
+
+    @property
+    def key(self) -> str:
+        '''Identity of the measurement used to compare result files.'''
+        params = ','.join(f'{name}={value}' for name, value in sorted(self.params.items()))
+        return f'{self.name}[{params}]'
+
+    @property
+    def seconds(self) -> float:
+        return min(self.samples)
+
+    @property
+    def us_per_op(self) -> float:
+        return self.seconds / self.ops * 1_000_000
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'key': self.key,
+            'name': self.name,
+            'params': self.params,
+            'ops': self.ops,
+            'seconds': self.seconds,
+            'median_seconds': statistics.median(self.samples),
+            'us_per_op': self.us_per_op,
+            'ops_per_sec': self.ops / self.seconds if self.seconds else None,
+            'metrics': self.metrics,
+        }
+
+    def __str__(self) -> str:
+        metrics = ''.join(f'  {name}={value:g}' for name, value in self.metrics.items())
+        return f'{self.key:<80} {self.us_per_op:>12.3f} us/op  ({self.ops} ops){metrics}'
+
+
+def measure(name: str, params: dict[str, Any], func: Callable[[], Any], *, ops: int, repeat: int = 3, setup: Callable[[], Any] | None = None, metrics: dict[str, float] | None = None) -> Result:
+    '''Run `func` `repeat` times (calling `setup` before every run) and keep all samples; `func` performs `ops` operations.'''
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+
+    return Result(name, params, ops, samples, metrics)
+
+
+# Synthetic schema
+
+class Row:
+    '''Model class of synthetic tables. Attributes are set by fields.'''
+    def __init__(self, id: int | None = None) -> None:
+        self.id = id
+
+# Column definitions: (python type, SQL type, value factory)
+COLUMN_KINDS: tuple[tuple[type, str, Callable[[random.Random, int], Any]], ...] = (
+    (int, 'INTEGER', lambda rnd, index: rnd.randint(0, 1 << 40)),
+    (float, 'REAL', lambda rnd, index: rnd.random() * 1000),
+    (str, 'TEXT', lambda rnd, index: f'text_{index}_{rnd.randint(0, 1 << 20)}'),
+    (bytes, 'BLOB', lambda rnd, index: rnd.randbytes(32)),
+    (bool, 'INTEGER', lambda rnd, index: rnd.random() < 0.5),
+    (list, 'TEXT', lambda rnd, index: [rnd.randint(0, 100) for _ in range(8)]),
+    (tuple, 'TEXT', lambda rnd, index: ('a', index, rnd.random())),
+    (dict, 'TEXT', lambda rnd, index: {'index': index, 'name': f'name_{index}', 'flags': [1, 2, 3]}),
+    (Datetime, 'INTEGER', lambda rnd, index: Datetime(2020, 1, 1) + Timedelta(seconds=index)),
+    (Date, 'INTEGER', lambda rnd, index: Date(2020, 1, 1) + Timedelta(days=index % 1000)),
+    (Timedelta, 'INTEGER', lambda rnd, index: Timedelta(seconds=rnd.randint(0, 100000))),
+)
+
+class Schema:
+    '''Synthetic table with `width` columns: integer primary key and columns of all built-in converted types.'''
+    def __init__(self, width: int, table_name: str = 'bench') -> None:
+        if width < 1:
+            raise ValueError('`width` must be positive.')
+
+        self.width = width
+        self.table_name = table_name
+        self.columns: list[tuple[str, type, str, Callable[[random.Random, int], Any]]] = [
+            (f'c{index}', *COLUMN_KINDS[index % len(COLUMN_KINDS)])
+            for index in range(width - 1)
+        ]
+
+    @property
+    def create_sql(self) -> str:
+        columns = ''.join(f', {name} {sql_type}' for name, _, sql_type, _ in self.columns)
+        return f'CREATE TABLE {self.table_name} (id INTEGER PRIMARY KEY{columns});'
+
+    def create_request(self, executor: SQLiteExecutor) -> BaseDBRequest[Row]:
+        id_field = AutoField[Row, int]('id', int, allowed_none=True)
+        fields = (id_field, ) + tuple(AutoField[Row, Any](name, python_type) for name, python_type, _, _ in self.columns)
+
+        return BaseDBRequest[Row](Row, self.table_name, fields, (id_field, ), executor=executor)
+
+    def create_object(self, rnd: random.Random, index: int, id: int | None = None) -> Row:
+        row = Row(id)
+        for name, _, _, factory in self.columns:
+            setattr(row, name, factory(rnd, index))
+        return row
+
+    def fill(self, connection: sqlite3.Connection, request: BaseDBRequest[Row], rows: int, *, batch: int = 10_000) -> None:
+        '''Insert rows directly with `executemany`, so setup of big tables stays fast.'''
+        rnd = random.Random(SEED)
+        serializer = request._serializer
+        columns = ', '.join(field.name for field in serializer.fields)
+        template = ', '.join('?' * len(serializer.fields))
+        sql = f'INSERT INTO {self.table_name} ({columns}) VALUES ({template});'
+
+        for start in range(0, rows, batch):
+            values = [
+                serializer.get_params_and_values(self.create_object(rnd, index, id=index + 1))[1]
+                for index in range(start, min(start + batch, rows))
+            ]
+            connection.executemany(sql, values)
+            connection.commit()
+
+
+# Storages
+
+STORAGES = ('memory', 'file')
+
+@contextmanager
+def open_storage(storage: str) -> Iterator[tuple[str, sqlite3.Connection]]:
+    '''
+    Yield database filename for `SQLiteExecutor` and a connection to it.
+
+    In-memory database is shared between connections by URI with `cache=shared`.
+    The yielded connection keeps it alive until the context ends.
+    '''
+    if storage == 'memory':
+        filename = f'file:dbrequest_bench_{os.getpid()}_{next(_memory_counter)}?mode=memory&cache=shared'
+        connection = sqlite3.connect(filename, uri=True)
+        try:
+            yield filename, connection
+        finally:
+            connection.close()
+    elif storage == 'file':
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'bench.db')
+            connection = sqlite3.connect(filename)
+            try:
+                yield filename, connection
+            finally:
+                connection.close()
+    else:
+        raise ValueError(f'Unknown storage "{storage}". Expected one of: {STORAGES}.')
+
+
+# Result files
+
+def write_results(path: str, results: list[Result]) -> None:
+    data = {
+        'meta': {
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform(),
+            'created': Datetime.now().isoformat(timespec='seconds'),
+        },
+        'results': [result.to_dict() for result in results],
+    }
+    with open(path, 'w') as file:
+        json.dump(data, file, indent=2)
+
+def read_results(path: str) -> dict[str, dict[str, Any]]:
+    with open(path, 'r') as file:
+        data = json.load(file)
+
+    return {result['key']: result for result in data['results']}
+
+def compare_results(baseline: dict[str, dict[str, Any]], results: list[Result], threshold: float) -> list[str]:
+    '''Print comparison table and return keys of measurements that are slower than baseline by more than `threshold`.'''
+    regressions = []
+    for result in results:
+        old = baseline.get(result.key)
+        if old is None:
+            print(f'{result.key:<80} {"new":>12}')
+            continue
+
+        change = result.us_per_op / old['us_per_op'] - 1 if old['us_per_op'] else 0.0
+        mark = ''
+        if change > threshold:
+            mark = '  REGRESSION'
+            regressions.append(result.key)
+        print(f'{result.key:<80} {old["us_per_op"]:>12.3f} -> {result.us_per_op:>12.3f} us/op ({change:+.1%}){mark}')
+
+    return regressions
@@ -0,0 +1,57 @@
+'''
+Import time benchmark of the `dbrequest` package.
+
+Every run starts a new interpreter with `-X importtime`, so the result does not depend on module caches.
+
+Usage:
+```
+$ python benchmarks/import_time.py --runs 20 --max-ms 15
+```
+The script exits with code 1 if the median import time is greater than `--max-ms`.
+'''
+import sys, os
+import argparse
+import statistics
+import subprocess
+
+
+SRC_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src')
+
+def measure_import_us(module: str = 'dbrequest') -> int:
+    '''Return cumulative import time of the module in microseconds.'''
+    env = dict(os.environ, PYTHONPATH=SRC_PATH)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        env = env,
+        capture_output = True,
+        text = True,
+        check = True,
+    )
+
+    for line in result.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        parts = [part.strip() for part in line.removeprefix('import time:').split('|')]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+
+    raise RuntimeError(f'Module "{module}" not found in `-X importtime` output.')
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10, help='Number of interpreter runs.')
+    parser.add_argument('--max-ms', type=float, default=None, help='Fail if the median import time is greater.')
+    args = parser.parse_args()
+
+    samples = [measure_import_us() / 1000 for _ in range(args.runs)]
+    median = statistics.median(samples)
+    print(f'import dbrequest: median {median:.2f} ms, min {min(samples):.2f} ms, max {max(samples):.2f} ms ({args.runs} runs)')
+
+    if args.max_ms is not None and median > args.max_ms:
+        print(f'Import time regression: {median:.2f} ms > {args.max_ms:.2f} ms')
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,76 @@
+'''
+Benchmark suite of dbrequest.
+
+Usage (from the repository root):
+```
+$ python -m benchmarks.run --output results.json
+$ python -m benchmarks.run --suites requests --rows 1000,1000000 --widths 4,32 --storages memory
+$ python -m benchmarks.run --compare results.json --threshold 0.1
+```
+Row counts from 1k up to 10M are supported; big tables are filled with `executemany` before measurements.
+With `--compare` the script exits with code 1 if any measurement is slower than baseline by more than `--threshold`.
+'''
+import sys
+import argparse
+from importlib import import_module
+
+from .common import STORAGES, Result, write_results, read_results, compare_results
+
+
+SUITES = ('import_time', 'converters', 'compression', 'binary', 'native_types', 'serializer', 'requests', 'relations', 'full_text')
+
+def _int_list(value: str) -> list[int]:
+    return [int(item.replace('_', '').replace('k', '000').replace('M', '000000')) for item in value.split(',')]
+
+def _str_list(value: str) -> list[str]:
+    return value.split(',')
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--suites', type=_str_list, default=list(SUITES), help=f'Comma-separated suites: {",".join(SUITES)}.')
+    parser.add_argument('--rows', type=_int_list, default=[1000, 100_000], help='Comma-separated table sizes, e.g. 1k,100k,10M.')
+    parser.add_argument('--widths', type=_int_list, default=[4, 16, 64], help='Comma-separated numbers of table columns.')
+    parser.add_argument('--storages', type=_str_list, default=list(STORAGES), help='Comma-separated storages: memory,file.')
+    parser.add_argument('--ops', type=int, default=500, help='Number of calls in single-object request benchmarks.')
+    parser.add_argument('--values', type=int, default=10_000, help='Number of values in converter and serializer benchmarks.')
+    parser.add_argument('--workers', type=int, default=4, help='Number of processes for `load_all_parallel`, 1 to skip.')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of runs of every benchmark, the best one is reported.')
+    parser.add_argument('--output', default=None, help='Write results to JSON file.')
+    parser.add_argument('--compare', default=None, help='Compare results with JSON file of previous run.')
+    parser.add_argument('--threshold', type=float, default=0.1, help='Allowed slowdown for `--compare`, 0.1 is 10%%.')
+
+    options = parser.parse_args(argv)
+    for suite in options.suites:
+        if suite not in SUITES:
+            parser.error(f'Unknown suite "{suite}".')
+    for storage in options.storages:
+        if storage not in STORAGES:
+            parser.error(f'Unknown storage "{storage}".')
+
+    return options
+
+def main(argv: list[str] | None = None) -> int:
+    options = parse_args(argv)
+    results: list[Result] = []
+
+    for suite in options.suites:
+        module = import_module(f'.suites.{suite}', __package__)
+        for result in module.run(options):
+            print(result, flush=True)
+            results.append(result)
+
+    if options.output:
+        write_results(options.output, results)
+
+    if options.compare:
+        print(f'\nComparison with {options.compare}:')
+        regressions = compare_results(read_results(options.compare), results, options.threshold)
+        if regressions:
+            print(f'\n{len(regressions)} regression(s) over {options.threshold:.0%}.')
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
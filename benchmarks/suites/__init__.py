@@ -0,0 +1,5 @@
+'''
+Benchmark suites. Every module defines `run(options) -> list[Result]`.
+
+`options` is the `argparse.Namespace` of `benchmarks/run.py`.
+'''
@@ -0,0 +1,65 @@
+'''Binary converters against JSON converters: round-trip speed and stored size of numeric-heavy and mixed values.'''
+import random
+from argparse import Namespace
+from array import array
+
+from dbrequest.core.type_converters import ListTypeConverter, DictTypeConverter
+from dbrequest.core.binary_type_converters import (
+    get_binary_codec,
+    BinaryListTypeConverter,
+    BinaryDictTypeConverter,
+    PackedListTypeConverter,
+    ArrayTypeConverter,
+)
+
+from ..common import SEED, Result, measure
+
+
+def _size(db_value: str | bytes) -> int:
+    return len(db_value.encode('utf-8') if isinstance(db_value, str) else db_value)
+
+def _run_converter(name: str, params: dict, converter, values: list, repeat: int) -> list[Result]:
+    db_values = [converter.to_database(value) for value in values]
+    count = len(values)
+
+    return [
+        measure(
+            f'binary.{name}.to_database', params,
+            lambda: [converter.to_database(value) for value in values],
+            ops=count, repeat=repeat, metrics={'bytes_per_value': round(sum(map(_size, db_values)) / count, 1)},
+        ),
+        measure(
+            f'binary.{name}.from_database', params,
+            lambda: [converter.from_database(db_value) for db_value in db_values],
+            ops=count, repeat=repeat,
+        ),
+    ]
+
+def run(options: Namespace) -> list[Result]:
+    results = []
+    count = options.values
+    default_codec = get_binary_codec().name
+
+    for length in (16, 1024):
+        rnd = random.Random(SEED)
+        floats = [[rnd.random() * 1000 for _ in range(length)] for _ in range(count)]
+        params = {'length': length, 'values': count}
+
+        converters = {
+            'json_list': ListTypeConverter(),
+            f'binary_list_{default_codec}': BinaryListTypeConverter(),
+            'packed_list_d': PackedListTypeConverter('d'),
+        }
+        for name, converter in converters.items():
+            results.extend(_run_converter(name, params, converter, floats, options.repeat))
+
+        arrays = [array('d', value) for value in floats]
+        results.extend(_run_converter('array_d', params, ArrayTypeConverter('d'), arrays, options.repeat))
+
+    rnd = random.Random(SEED)
+    dicts = [{'id': index, 'name': f'name_{index}', 'scores': [rnd.randint(0, 100) for _ in range(8)]} for index in range(count)]
+    params = {'values': count}
+    for name, converter in {'json_dict': DictTypeConverter(), f'binary_dict_{default_codec}': BinaryDictTypeConverter()}.items():
+        results.extend(_run_converter(name, params, converter, dicts, options.repeat))
+
+    return results
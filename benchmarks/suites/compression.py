@@ -0,0 +1,53 @@
+'''Compressed type converters: stored size and CPU cost of every codec against plain JSON.'''
+import random
+from argparse import Namespace
+
+from dbrequest.core.type_converters import DictTypeConverter
+from dbrequest.core.compressed_type_converters import CompressedDictTypeConverter, build_zlib_dictionary
+
+from ..common import SEED, Result, measure
+
+
+def _create_value(rnd: random.Random, index: int, size: int) -> dict:
+    return {
+        'id': index,
+        'user_name': f'user_{rnd.randint(0, 1000)}',
+        'status': rnd.choice(('active', 'blocked', 'deleted')),
+        'tags': [rnd.choice(('red', 'green', 'blue', 'black')) for _ in range(size // 16)],
+        'history': [{'event': rnd.choice(('login', 'logout', 'purchase')), 'amount': rnd.randint(0, 500)} for _ in range(size // 64)],
+    }
+
+def run(options: Namespace) -> list[Result]:
+    results = []
+    count = options.values
+
+    for size in (64, 1024, 16 * 1024):
+        rnd = random.Random(SEED)
+        values = [_create_value(rnd, index, size) for index in range(count)]
+        zdict = build_zlib_dictionary(DictTypeConverter().to_database(value) for value in values[:1000])
+
+        converters = {
+            'json': DictTypeConverter(),
+            'zlib': CompressedDictTypeConverter(codec='zlib', threshold=0),
+            'zlib_dict': CompressedDictTypeConverter(codec='zlib', threshold=0, zdict=zdict),
+            'lzma': CompressedDictTypeConverter(codec='lzma', threshold=0),
+            'bz2': CompressedDictTypeConverter(codec='bz2', threshold=0),
+        }
+        for codec, converter in converters.items():
+            db_values = [converter.to_database(value) for value in values]
+            stored = sum(len(db_value.encode('utf-8') if isinstance(db_value, str) else db_value) for db_value in db_values)
+            params = {'codec': codec, 'size': size, 'values': count}
+            metrics = {'bytes_per_value': round(stored / count, 1)}
+
+            results.append(measure(
+                'compression.to_database', params,
+                lambda: [converter.to_database(value) for value in values],
+                ops=count, repeat=options.repeat, metrics=metrics,
+            ))
+            results.append(measure(
+                'compression.from_database', params,
+                lambda: [converter.from_database(db_value) for db_value in db_values],
+                ops=count, repeat=options.repeat,
+            ))
+
+    return results
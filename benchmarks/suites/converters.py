@@ -0,0 +1,33 @@
+'''`to_database` and `from_database` of every built-in type converter.'''
+import random
+from argparse import Namespace
+
+from dbrequest.executors import SQLiteExecutor
+
+from ..common import SEED, COLUMN_KINDS, Result, measure
+
+
+def run(options: Namespace) -> list[Result]:
+    results = []
+    rnd = random.Random(SEED)
+    count = options.values
+
+    for converter in SQLiteExecutor().default_type_converters:
+        factory = next(factory for python_type, _, factory in COLUMN_KINDS if python_type is converter.source_type)
+        values = [factory(rnd, index) for index in range(count)]
+        db_values = [converter.to_database(value) for value in values]
+        name = type(converter).__name__
+        params = {'values': count}
+
+        results.append(measure(
+            f'converters.{name}.to_database', params,
+            lambda: [converter.to_database(value) for value in values],
+            ops=count, repeat=options.repeat,
+        ))
+        results.append(measure(
+            f'converters.{name}.from_database', params,
+            lambda: [converter.from_database(value) for value in db_values],
+            ops=count, repeat=options.repeat,
+        ))
+
+    return results
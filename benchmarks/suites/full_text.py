@@ -0,0 +1,58 @@
+'''
+Text search: `load_all` with Python substring matching against FTS5 `search` (ranked, with and without snippets).
+'''
+import random
+from argparse import Namespace
+
+from dbrequest import BaseDBRequest, AutoField
+from dbrequest.executors import SQLiteExecutor
+
+from ..common import SEED, Result, measure, open_storage
+
+
+WORDS = tuple(f'word{index}' for index in range(5000))
+QUERIES = 20
+
+class Document:
+    def __init__(self, id: int | None = None) -> None:
+        self.id = id
+        self.text: str | None = None
+
+def run(options: Namespace) -> list[Result]:
+    results = []
+
+    for storage in options.storages:
+        for rows in options.rows:
+            with open_storage(storage) as (filename, connection):
+                rnd = random.Random(SEED)
+                connection.execute('CREATE TABLE documents (id INTEGER PRIMARY KEY, text TEXT);')
+                connection.executemany(
+                    'INSERT INTO documents VALUES (?, ?);',
+                    ((index, ' '.join(rnd.choices(WORDS, k=30))) for index in range(1, rows + 1)),
+                )
+                connection.commit()
+
+                id_field = AutoField[Document, int]('id', int)
+                fields = (id_field, AutoField[Document, str]('text', str, full_text=True))
+                documents = BaseDBRequest[Document](Document, 'documents', fields, (id_field, ), executor=SQLiteExecutor(filename))
+                documents.create_full_text_index()
+                queries = rnd.choices(WORDS, k=QUERIES)
+
+                def substring() -> None:
+                    for query in queries:
+                        [document for document in documents.load_all(Document()) if query in document.text.split()]
+
+                def search() -> None:
+                    for query in queries:
+                        documents.search(Document(), query, limit=20)
+
+                def search_snippets() -> None:
+                    for query in queries:
+                        documents.search_snippets(Document(), query, 'text', limit=20)
+
+                params = {'storage': storage, 'rows': rows}
+                results.append(measure('full_text.substring', params, substring, ops=QUERIES, repeat=options.repeat))
+                results.append(measure('full_text.search', params, search, ops=QUERIES, repeat=options.repeat))
+                results.append(measure('full_text.search_snippets', params, search_snippets, ops=QUERIES, repeat=options.repeat))
+
+    return results
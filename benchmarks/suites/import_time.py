@@ -0,0 +1,11 @@
+'''Cold import time of the package (new interpreter per sample).'''
+from argparse import Namespace
+
+from ..common import Result
+from ..import_time import measure_import_us
+
+
+def run(options: Namespace) -> list[Result]:
+    samples = [measure_import_us() / 1_000_000 for _ in range(max(options.repeat, 5))]
+
+    return [Result('import.dbrequest', {}, 1, samples)]
@@ -0,0 +1,74 @@
+'''
+`load_all` and `save` with type conversion in `Serializer` (Python path) against `sqlite3` adapters and converters
+(`SQLiteExecutor(native_types=True)`) on a table of converted types only.
+'''
+import random
+from argparse import Namespace
+from datetime import datetime as Datetime, date as Date, timedelta as Timedelta
+
+from dbrequest import BaseDBRequest, AutoField
+from dbrequest.executors import SQLiteExecutor
+
+from ..common import SEED, Row, Result, measure, open_storage
+
+
+# (name, python type, declared type of the Python path, declared type of the native path, value factory)
+COLUMNS = (
+    ('flag', bool, 'INTEGER', 'BOOLEAN', lambda rnd, index: rnd.random() < 0.5),
+    ('items', list, 'TEXT', 'JSON_LIST', lambda rnd, index: [rnd.randint(0, 100) for _ in range(8)]),
+    ('data', dict, 'TEXT', 'JSON_DICT', lambda rnd, index: {'index': index, 'name': f'name_{index}'}),
+    ('created', Datetime, 'INTEGER', 'DATETIME_TS', lambda rnd, index: Datetime(2020, 1, 1) + Timedelta(seconds=index)),
+    ('day', Date, 'INTEGER', 'DATE_ORDINAL', lambda rnd, index: Date(2020, 1, 1) + Timedelta(days=index % 1000)),
+    ('duration', Timedelta, 'INTEGER', 'TIMEDELTA_SECONDS', lambda rnd, index: Timedelta(seconds=rnd.randint(0, 100000))),
+)
+
+def _create_request(table_name: str, executor: SQLiteExecutor) -> BaseDBRequest[Row]:
+    id_field = AutoField[Row, int]('id', int, allowed_none=True)
+    fields = (id_field, ) + tuple(AutoField[Row, python_type](name, python_type) for name, python_type, _, _, _ in COLUMNS)
+    return BaseDBRequest[Row](Row, table_name, fields, (id_field, ), executor=executor)
+
+def _create_object(rnd: random.Random, index: int) -> Row:
+    row = Row()
+    for name, _, _, _, factory in COLUMNS:
+        setattr(row, name, factory(rnd, index))
+    return row
+
+def run(options: Namespace) -> list[Result]:
+    results = []
+
+    for storage in options.storages:
+        for rows in options.rows:
+            with open_storage(storage) as (filename, connection):
+                for path, native_types in (('python', False), ('native', True)):
+                    table_name = f'{path}_table'
+                    columns = ''.join(
+                        f', {name} {native_type if native_types else python_type}'
+                        for name, _, python_type, native_type, _ in COLUMNS
+                    )
+                    connection.execute(f'CREATE TABLE {table_name} (id INTEGER PRIMARY KEY{columns});')
+                    connection.commit()
+
+                    request = _create_request(table_name, SQLiteExecutor(filename, native_types=native_types))
+                    rnd = random.Random(SEED)
+                    serializer = _create_request(table_name, SQLiteExecutor(filename))._serializer
+                    values = [serializer.get_params_and_values(_create_object(rnd, index))[1] for index in range(rows)]
+                    template = ', '.join('?' * (len(COLUMNS) + 1))
+                    connection.executemany(f'INSERT INTO {table_name} VALUES ({template});', values)
+                    connection.commit()
+
+                    params = {'path': path, 'storage': storage, 'rows': rows}
+                    results.append(measure(
+                        'native_types.load_all', params,
+                        lambda: request.load_all(Row()),
+                        ops=rows, repeat=options.repeat,
+                    ))
+
+                    ops = min(options.ops, rows)
+                    objects = [_create_object(rnd, index) for index in range(ops)]
+                    results.append(measure(
+                        'native_types.save', dict(params, rows=ops),
+                        lambda: [request.save(object) for object in objects],
+                        ops=ops, repeat=1,
+                    ))
+
+    return results
@@ -0,0 +1,72 @@
+'''
+Loading objects with their related objects: per-object `load` (N+1 queries),
+batched `prefetch` (one query per relation) and `join` (single SELECT).
+'''
+import random
+from argparse import Namespace
+
+from dbrequest import BaseDBRequest, AutoField, RelationField
+from dbrequest.executors import SQLiteExecutor
+
+from ..common import SEED, Result, measure, open_storage
+
+
+class User:
+    def __init__(self, id: int | None = None) -> None:
+        self.id = id
+        self.name: str | None = None
+
+class Order:
+    def __init__(self, id: int | None = None) -> None:
+        self.id = id
+        self.user_id: int | None = None
+        self.amount: float | None = None
+        self.user: User | None = None
+
+def run(options: Namespace) -> list[Result]:
+    results = []
+
+    for storage in options.storages:
+        for rows in options.rows:
+            with open_storage(storage) as (filename, connection):
+                users_count = max(1, rows // 10)
+                rnd = random.Random(SEED)
+                connection.executescript(
+                    'CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT);'
+                    'CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER, amount REAL);'
+                )
+                connection.executemany('INSERT INTO users VALUES (?, ?);', ((index, f'user_{index}') for index in range(1, users_count + 1)))
+                connection.executemany(
+                    'INSERT INTO orders VALUES (?, ?, ?);',
+                    ((index, rnd.randint(1, users_count), rnd.random() * 100) for index in range(1, rows + 1)),
+                )
+                connection.commit()
+
+                executor = SQLiteExecutor(filename)
+                user_id = AutoField[User, int]('id', int)
+                users = BaseDBRequest[User](User, 'users', (user_id, AutoField[User, str]('name', str)), (user_id, ), executor=executor)
+                order_id = AutoField[Order, int]('id', int)
+                user_field = RelationField[Order, int]('user_id', int, related_request=users, related_field=user_id, attribute='user')
+                orders = BaseDBRequest[Order](
+                    Order, 'orders', (order_id, user_field, AutoField[Order, float]('amount', float)), (order_id, ), executor=executor,
+                )
+
+                def per_object() -> None:
+                    for order in orders.load_all(Order()):
+                        order.user = User(order.user_id)
+                        users.load(order.user)
+
+                params = {'storage': storage, 'rows': rows}
+                results.append(measure('relations.per_object', params, per_object, ops=rows, repeat=options.repeat))
+                results.append(measure(
+                    'relations.prefetch', params,
+                    lambda: orders.load_all(Order(), prefetch=(user_field, )),
+                    ops=rows, repeat=options.repeat,
+                ))
+                results.append(measure(
+                    'relations.join', params,
+                    lambda: orders.load_all(Order(), join=(user_field, )),
+                    ops=rows, repeat=options.repeat,
+                ))
+
+    return results
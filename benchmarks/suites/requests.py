@@ -0,0 +1,95 @@
+'''
+`BaseDBRequest` paths on synthetic tables.
+
+Modes:
+- single: `--ops` separate calls of `save`, `load`, `update`, `delete` and `load_all(limit=50)` on a table of `rows` rows.
+- bulk: `load_all` and `load_all_parallel` of the whole table.
+'''
+import random
+from argparse import Namespace
+
+from dbrequest.executors import SQLiteExecutor
+
+from ..common import SEED, Row, Schema, Result, measure, open_storage
+
+
+def run(options: Namespace) -> list[Result]:
+    results = []
+
+    for storage in options.storages:
+        for width in options.widths:
+            for rows in options.rows:
+                results.extend(_run_table(options, storage, width, rows))
+
+    return results
+
+def _run_table(options: Namespace, storage: str, width: int, rows: int) -> list[Result]:
+    results = []
+    schema = Schema(width)
+    params = {'storage': storage, 'width': width, 'rows': rows}
+    ops = min(options.ops, rows)
+
+    with open_storage(storage) as (filename, connection):
+        connection.execute(schema.create_sql)
+        request = schema.create_request(SQLiteExecutor(filename))
+        schema.fill(connection, request, rows)
+
+        rnd = random.Random(SEED)
+        ids = [rnd.randint(1, rows) for _ in range(ops)]
+        new_objects = [schema.create_object(rnd, index) for index in range(ops)]
+
+        def load() -> None:
+            for id in ids:
+                request.load(Row(id))
+
+        loaded = [Row(id) for id in ids]
+        for object in loaded:
+            request.load(object)
+
+        def update() -> None:
+            for object in loaded:
+                request.update(object)
+
+        def save() -> None:
+            for object in new_objects:
+                object.id = None
+                request.save(object)
+
+        def delete() -> None:
+            for index in range(ops):
+                request.delete(Row(rows + index + 1))
+
+        single = dict(params, mode='single')
+        results.append(measure('requests.load', single, load, ops=ops, repeat=options.repeat))
+        results.append(measure('requests.update', single, update, ops=ops, repeat=options.repeat))
+        results.append(measure(
+            'requests.load_all_limit', single,
+            lambda: [request.load_all(Row(), sort_by='id', limit=50, reverse=True) for _ in range(ops)],
+            ops=ops, repeat=options.repeat,
+        ))
+        # Every `save` run is followed by `delete` of the same rows, so the table size stays the same
+        for _ in range(options.repeat):
+            results.append(measure('requests.save', single, save, ops=ops, repeat=1))
+            results.append(measure('requests.delete', single, delete, ops=ops, repeat=1))
+
+        bulk = dict(params, mode='bulk')
+        results.append(measure('requests.load_all', bulk, lambda: request.load_all(Row()), ops=rows, repeat=options.repeat))
+        if storage == 'file' and options.workers > 1:
+            results.append(measure(
+                'requests.load_all_parallel', dict(bulk, workers=options.workers),
+                lambda: list(request.load_all_parallel(Row(), workers=options.workers)),
+                ops=rows, repeat=options.repeat,
+            ))
+
+    return _merge_repeated(results)
+
+def _merge_repeated(results: list[Result]) -> list[Result]:
+    '''Join samples of results measured in separate `measure` calls.'''
+    merged: dict[str, Result] = {}
+    for result in results:
+        if result.key in merged:
+            merged[result.key].samples.extend(result.samples)
+        else:
+            merged[result.key] = result
+
+    return list(merged.values())
@@ -0,0 +1,33 @@
+'''`Serializer` of synthetic schemas of different width.'''
+import random
+from argparse import Namespace
+
+from dbrequest.executors import SQLiteExecutor
+
+from ..common import SEED, Row, Schema, Result, measure
+
+
+def run(options: Namespace) -> list[Result]:
+    results = []
+    count = options.values
+
+    for width in options.widths:
+        schema = Schema(width)
+        serializer = schema.create_request(SQLiteExecutor(':memory:'))._serializer
+        rnd = random.Random(SEED)
+        objects = [schema.create_object(rnd, index, id=index + 1) for index in range(count)]
+        rows = [serializer.get_params_and_values(object)[1] for object in objects]
+        params = {'width': width, 'objects': count}
+
+        results.append(measure(
+            'serializer.get_params_and_values', params,
+            lambda: [serializer.get_params_and_values(object) for object in objects],
+            ops=count, repeat=options.repeat,
+        ))
+        results.append(measure(
+            'serializer.set_values_to_object', params,
+            lambda: [serializer.set_values_to_object(Row(), row) for row in rows],
+            ops=count, repeat=options.repeat,
+        ))
+
+    return results
@@ -1,9 +1,51 @@
+from typing import TYPE_CHECKING, Any
+from importlib import import_module
+
 from .config.config import init
 from .interfaces import IDBRequest
 from .exceptions import BaseDBRequestError
-from .executors import UniversalExecutor
-from .core.requests import BaseDBRequest
-from .core.universal_requests import UniversalDBRequest
-from .core.fields import BaseField, AutoField
-from .core.type_converters import BaseTypeConverter, BaseJsonTypeConverter
 
+if TYPE_CHECKING:
+    from .executors import UniversalExecutor
+    from .core.requests import BaseDBRequest
+    from .core.universal_requests import UniversalDBRequest
+    from .core.sharded_requests import ShardedDBRequest
+    from .core.fields import BaseField, AutoField, BlobField, RelationField
+    from .core.cache import QueryCache
+    from .core.conditions import Column
+    from .core.indexes import JsonIndex
+    from .core.expiry import ExpiryPolicy, ExpiryPurger
+    from .core.type_converters import BaseTypeConverter, BaseJsonTypeConverter
+
+
+# Heavy submodules (sqlite3, json, datetime converters) are imported on first attribute access
+_LAZY_IMPORTS: dict[str, str] = {
+    'UniversalExecutor': '.executors',
+    'BaseDBRequest': '.core.requests',
+    'UniversalDBRequest': '.core.universal_requests',
+    'ShardedDBRequest': '.core.sharded_requests',
+    'BaseField': '.core.fields',
+    'AutoField': '.core.fields',
+    'BlobField': '.core.fields',
+    'RelationField': '.core.fields',
+    'QueryCache': '.core.cache',
+    'Column': '.core.conditions',
+    'JsonIndex': '.core.indexes',
+    'ExpiryPolicy': '.core.expiry',
+    'ExpiryPurger': '.core.expiry',
+    'BaseTypeConverter': '.core.type_converters',
+    'BaseJsonTypeConverter': '.core.type_converters',
+}
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
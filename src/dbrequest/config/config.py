@@ -11,6 +11,7 @@ Executor: TypeAlias = Literal['sqlite', ]
 DATABASE_FILENAME: str = 'database.db'
 EXECUTOR: Executor | IDatabaseExecutor = 'sqlite'
 LOGGER_NAME: str = 'database'
+SHARD_FILENAMES: tuple[str, ...] = ()
 
 def init(
         *,
@@ -18,19 +19,34 @@ def init(
         executor: Executor | IDatabaseExecutor = 'sqlite',
         logger_name: str = 'database',
         init_script: str | None = None,
+        shard_filenames: tuple[str, ...] = (),
     ) -> None:
+    '''
+    Set up the library.
+
+    Args:
+        `database_filename`: Database used by default executors.
+        `executor`: Name of the built-in executor or custom `IDatabaseExecutor` object.
+        `logger_name`: Name of the `logging` logger.
+        `init_script`: SQL file executed on start. With `shard_filenames` it is executed on every shard.
+        `shard_filenames`: Database files used by `ShardedDBRequest` by default.
+    '''
 
     global DATABASE_FILENAME
     global EXECUTOR
     global LOGGER_NAME
+    global SHARD_FILENAMES
 
     if database_filename == '': raise ConfigError(f'`database_filename` parameter can not be empty string.')
     if logger_name == '': raise ConfigError(f'`logger_name` parameter can not be empty string.')
     if init_script is not None and init_script == '': raise ConfigError(f'`init_script` parameter can not be empty string.')
+    if '' in shard_filenames: raise ConfigError(f'Every filename in `shard_filenames` parameter can not be empty string.')
+    if len(set(shard_filenames)) != len(shard_filenames): raise ConfigError(f'`shard_filenames` contains duplicates: {shard_filenames}.')
 
     EXECUTOR = executor
     DATABASE_FILENAME = database_filename
     LOGGER_NAME = logger_name
+    SHARD_FILENAMES = tuple(shard_filenames)
 
     if init_script is not None:
         from ..executors import UniversalExecutor
@@ -38,6 +54,10 @@ def init(
 
         request = SQLFile(file_name=init_script)
 
-        executor = UniversalExecutor()
-        executor.start(request)
+        if SHARD_FILENAMES:
+            for shard_filename in SHARD_FILENAMES:
+                UniversalExecutor(shard_filename).start(request)
+        else:
+            executor = UniversalExecutor()
+            executor.start(request)
 
@@ -0,0 +1,265 @@
+__all__ = [
+    'BinaryCodec',
+    'register_binary_codec',
+    'get_binary_codec',
+    'BaseBinaryTypeConverter',
+    'BinaryListTypeConverter',
+    'BinaryTupleTypeConverter',
+    'BinaryDictTypeConverter',
+    'PackedListTypeConverter',
+    'ArrayTypeConverter',
+    'StructTupleTypeConverter',
+]
+
+import sys
+import json
+import struct
+from array import array
+from typing import Any, Callable
+from functools import partial
+from importlib import import_module
+
+from ..exceptions import TypeConverterError
+from ..interfaces import SOURCE_TYPE
+from .type_converters import BaseTypeConverter
+
+
+class BinaryCodec:
+    '''
+    Functions encoding Python values (lists, tuples, dicts) to `bytes` and back.
+
+    `tag` is stored as the first byte of every value, so values stay readable after the default codec changes.
+    Codecs with the same `tag` must produce compatible data (e.g. orjson and stdlib json).
+    '''
+    def __init__(self, name: str, tag: bytes, dumps: Callable[[Any], bytes], loads: Callable[[bytes], Any]) -> None:
+        if len(tag) != 1:
+            raise TypeConverterError(f'Codec tag must be single byte, not {tag!r}.')
+
+        self.name = name
+        self.tag = tag
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.name!r})'
+
+
+# Module-level functions (not lambdas), so converters can be pickled and sent to worker processes
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def _json_loads(value: bytes) -> Any:
+    return json.loads(value)
+
+def _create_orjson_codec() -> BinaryCodec:
+    orjson = import_module('orjson')
+    return BinaryCodec('orjson', b'J', partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS), orjson.loads)
+
+def _create_msgpack_codec() -> BinaryCodec:
+    msgpack = import_module('msgpack')
+    return BinaryCodec(
+        'msgpack', b'M',
+        partial(msgpack.packb, use_bin_type=True),
+        partial(msgpack.unpackb, raw=False, strict_map_key=False),
+    )
+
+def _create_json_codec() -> BinaryCodec:
+    return BinaryCodec('json', b'J', _json_dumps, _json_loads)
+
+_CODEC_FACTORIES: dict[str, Callable[[], BinaryCodec]] = {
+    'orjson': _create_orjson_codec,
+    'msgpack': _create_msgpack_codec,
+    'json': _create_json_codec,
+}
+# Names in order of preference. Optional libraries are imported on first use.
+_preference: list[str] = list(_CODEC_FACTORIES)
+_codecs: dict[str, BinaryCodec | None] = {}
+
+def register_binary_codec(codec: BinaryCodec) -> None:
+    '''Add a codec (or replace a codec with the same name) with higher preference than the built-in ones.'''
+    _codecs[codec.name] = codec
+    if codec.name in _preference:
+        _preference.remove(codec.name)
+    _preference.insert(0, codec.name)
+
+def _load_codec(name: str) -> BinaryCodec | None:
+    if name not in _codecs:
+        try:
+            _codecs[name] = _CODEC_FACTORIES[name]()
+        except ImportError:
+            _codecs[name] = None
+    return _codecs[name]
+
+def get_binary_codec(name: str | None = None) -> BinaryCodec:
+    '''
+    Return codec by name: "orjson", "msgpack", "json" or a registered one.
+    Without name the first installed codec is returned (orjson, then msgpack, then stdlib json).
+    '''
+    if name is not None:
+        if name not in _preference:
+            raise TypeConverterError(f'Unknown binary codec "{name}". Expected one of: {tuple(_preference)}.')
+        codec = _load_codec(name)
+        if codec is None:
+            raise TypeConverterError(f'Binary codec "{name}" is not installed.')
+        return codec
+
+    for codec_name in _preference:
+        codec = _load_codec(codec_name)
+        if codec is not None:
+            return codec
+
+    raise TypeConverterError('No binary codec is available.')  # pragma: no cover
+
+def _get_decoder(tag: int) -> BinaryCodec:
+    for codec_name in _preference:
+        codec = _load_codec(codec_name)
+        if codec is not None and codec.tag[0] == tag:
+            return codec
+
+    raise TypeConverterError(f'Value is encoded by unknown or not installed binary codec (tag {bytes((tag, ))!r}).')
+
+
+def _binary_to_database(codec: BinaryCodec, value: Any) -> bytes:
+    return codec.tag + codec.dumps(value)
+
+def _binary_from_database(source_type: type[SOURCE_TYPE], value: bytes) -> SOURCE_TYPE:
+    if not value:
+        raise TypeConverterError('Binary value can not be empty.')
+    codec = _get_decoder(value[0])
+    return source_type.__call__(codec.loads(value[1:]))
+
+
+class BaseBinaryTypeConverter(BaseTypeConverter[SOURCE_TYPE, bytes]):
+    '''
+    Binary alternative of `BaseJsonTypeConverter`: values are stored as `bytes` encoded by `BinaryCodec`.
+
+    `codec` is a codec name or object, by default the fastest installed one (see `get_binary_codec`).
+    Values are readable by any converter while their codec is installed.
+
+    Generic[SOURCE_TYPE]
+    '''
+    def __init__(self, source_type: type[SOURCE_TYPE], *, codec: str | BinaryCodec | None = None) -> None:
+        if not isinstance(codec, BinaryCodec):
+            codec = get_binary_codec(codec)
+
+        super().__init__(
+            source_type = source_type,
+            db_type = bytes,
+            to_database_func = partial(_binary_to_database, codec),
+            from_database_func = partial(_binary_from_database, source_type),
+        )
+
+class BinaryListTypeConverter(BaseBinaryTypeConverter[list]):
+    def __init__(self, *, codec: str | BinaryCodec | None = None) -> None:
+        super().__init__(source_type=list, codec=codec)
+
+class BinaryTupleTypeConverter(BaseBinaryTypeConverter[tuple]):
+    def __init__(self, *, codec: str | BinaryCodec | None = None) -> None:
+        super().__init__(source_type=tuple, codec=codec)
+
+class BinaryDictTypeConverter(BaseBinaryTypeConverter[dict]):
+    def __init__(self, *, codec: str | BinaryCodec | None = None) -> None:
+        super().__init__(source_type=dict, codec=codec)
+
+
+# Packed numeric values. Bytes are always little-endian, so databases are portable between platforms.
+
+_IS_BIG_ENDIAN = sys.byteorder == 'big'
+
+def _check_typecode(typecode: str) -> None:
+    try:
+        array(typecode)
+    except (ValueError, TypeError) as e:
+        raise TypeConverterError(f'Invalid array typecode "{typecode}": {e}') from e
+
+def _array_to_bytes(value: array) -> bytes:
+    if _IS_BIG_ENDIAN:
+        value = array(value.typecode, value)
+        value.byteswap()
+    return value.tobytes()
+
+def _array_from_bytes(typecode: str, value: bytes) -> array:
+    result = array(typecode)
+    try:
+        result.frombytes(value)
+    except ValueError as e:
+        raise TypeConverterError(f'Can not unpack {len(value)} bytes to array of "{typecode}": {e}') from e
+    if _IS_BIG_ENDIAN:
+        result.byteswap()
+    return result
+
+def _list_to_packed(typecode: str, value: list) -> bytes:
+    try:
+        return _array_to_bytes(array(typecode, value))
+    except (TypeError, OverflowError) as e:
+        raise TypeConverterError(f'Can not pack list to array of "{typecode}": {e}') from e
+
+def _list_from_packed(typecode: str, value: bytes) -> list:
+    return _array_from_bytes(typecode, value).tolist()
+
+def _array_to_database(typecode: str, value: array) -> bytes:
+    if value.typecode != typecode:
+        raise TypeConverterError(f'Expected array of "{typecode}", got array of "{value.typecode}".')
+    return _array_to_bytes(value)
+
+def _struct_to_database(format: str, value: tuple) -> bytes:
+    try:
+        return struct.pack(format, *value)
+    except struct.error as e:
+        raise TypeConverterError(f'Can not pack tuple with format "{format}": {e}') from e
+
+def _struct_from_database(format: str, value: bytes) -> tuple:
+    try:
+        return struct.unpack(format, value)
+    except struct.error as e:
+        raise TypeConverterError(f'Can not unpack value with format "{format}": {e}') from e
+
+
+class PackedListTypeConverter(BaseTypeConverter[list, bytes]):
+    '''
+    Store homogeneous numeric list as packed `array.array` bytes, e.g. `typecode='d'` for floats, `'q'` for ints.
+    Prefer typecodes of fixed size (`'b'`, `'h'`, `'q'`, `'f'`, `'d'`): size of `'i'` and `'l'` depends on the platform.
+
+    Values must fit the typecode, otherwise `TypeConverterError` is raised.
+    '''
+    def __init__(self, typecode: str = 'd') -> None:
+        _check_typecode(typecode)
+        super().__init__(
+            source_type = list,
+            db_type = bytes,
+            to_database_func = partial(_list_to_packed, typecode),
+            from_database_func = partial(_list_from_packed, typecode),
+        )
+
+class ArrayTypeConverter(BaseTypeConverter[array, bytes]):
+    '''Store `array.array` of the given typecode as bytes without copying to Python lists.'''
+    def __init__(self, typecode: str = 'd') -> None:
+        _check_typecode(typecode)
+        super().__init__(
+            source_type = array,
+            db_type = bytes,
+            to_database_func = partial(_array_to_database, typecode),
+            from_database_func = partial(_array_from_bytes, typecode),
+        )
+
+class StructTupleTypeConverter(BaseTypeConverter[tuple, bytes]):
+    '''
+    Store fixed-shape tuple packed by `struct` format, e.g. `'dd'` for a point or `'qi?'`.
+
+    Little-endian standard sizes are used if the format has no byte order character.
+    '''
+    def __init__(self, format: str) -> None:
+        if format[:1] not in ('<', '>', '!', '=', '@'):
+            format = '<' + format
+        try:
+            struct.calcsize(format)
+        except struct.error as e:
+            raise TypeConverterError(f'Invalid struct format "{format}": {e}') from e
+
+        super().__init__(
+            source_type = tuple,
+            db_type = bytes,
+            to_database_func = partial(_struct_to_database, format),
+            from_database_func = partial(_struct_from_database, format),
+        )
@@ -0,0 +1,129 @@
+__all__ = ['QueryCache']
+
+import copy
+import threading
+from typing import Any, Hashable
+from collections import OrderedDict
+from datetime import datetime as Datetime, date as Date, timedelta as Timedelta
+
+from ..interfaces import ICacheValidator
+
+
+# Values of these types are shared by cached rows, others (e.g. dicts of `SQLiteExecutor` native types) are copied
+_IMMUTABLE_TYPES = (int, float, str, bytes, bool, type(None), Datetime, Date, Timedelta)
+
+class QueryCache:
+    '''
+    LRU cache of SELECT results for `BaseDBRequest`.
+
+    - Key is the table name and the compiled request (SQL string and values), so every query shape
+    (sort, limit, reverse, conditions) is cached separately.
+    - Any write through a `BaseDBRequest` with this cache invalidates all cached results of the table.
+    - Raw database rows are stored, so every cache hit creates new model objects and callers can't corrupt the cache.
+    Mutable values converted by the database library (e.g. `SQLiteExecutor` native types) are copied on `put` and `get`.
+    - Memory is limited by `max_entries` and by the total number of cached rows `max_rows`.
+    Least recently used entries are evicted first.
+
+    Writes made without `BaseDBRequest` (raw SQL, other processes) are detected only with `validator`,
+    e.g. `SQLiteCacheValidator`, which is checked on every lookup.
+    Share one cache object between all `BaseDBRequest` objects of the same database.
+
+    Usage:
+    ```
+    cache = QueryCache(max_entries=128, max_rows=50_000)
+    users = BaseDBRequest[User](..., cache=cache)
+    ```
+    '''
+    def __init__(self, *, max_entries: int = 256, max_rows: int = 100_000, validator: ICacheValidator | None = None) -> None:
+        if max_entries <= 0:
+            raise ValueError(f'`max_entries` must be positive int, not {max_entries}.')
+        if max_rows <= 0:
+            raise ValueError(f'`max_rows` must be positive int, not {max_rows}.')
+
+        self._max_entries = max_entries
+        self._max_rows = max_rows
+        self._validator = validator
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, Hashable], tuple[tuple[Any, ...], ...]] = OrderedDict()
+        self._versions: dict[str, int] = {}
+        self._epoch = 0
+        self._rows = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_version(self, table: str) -> tuple[int, int]:
+        '''Return write counters of the cache and of the table. Take it before the query and pass it to `put`.'''
+        with self._lock:
+            # Known tables are checked by the validator, including tables with queries in progress
+            version = self._versions.setdefault(table, 0)
+            return (self._epoch, version)
+
+    def get(self, table: str, key: Hashable) -> list[tuple[Any, ...]] | None:
+        '''Return cached rows or `None`.'''
+        if self._validator is not None:
+            for stale_table in self._validator.get_stale_tables(set(self._versions)):
+                self.invalidate(stale_table)
+
+        with self._lock:
+            rows = self._entries.get((table, key), None)
+            if rows is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end((table, key))
+            self._hits += 1
+
+        return [self._copy_row(row) for row in rows]
+
+    def put(self, table: str, key: Hashable, rows: list[tuple[Any, ...]], *, version: tuple[int, int]) -> None:
+        '''Cache rows if the table was not changed since `version` was taken.'''
+        if len(rows) > self._max_rows:
+            return
+
+        cached_rows = tuple(self._copy_row(row) for row in rows)
+        with self._lock:
+            if (self._epoch, self._versions.get(table, 0)) != version:
+                return
+
+            self._pop((table, key))
+            self._entries[(table, key)] = cached_rows
+            self._rows += len(rows)
+
+            while len(self._entries) > self._max_entries or self._rows > self._max_rows:
+                self._pop(next(iter(self._entries)))
+
+    def invalidate(self, table: str) -> None:
+        '''Drop all results of the table and reject results of queries started before.'''
+        with self._lock:
+            self._versions[table] = self._versions.get(table, 0) + 1
+            for entry_key in [entry_key for entry_key in self._entries if entry_key[0] == table]:
+                self._pop(entry_key)
+
+    def clear(self) -> None:
+        '''Drop all results.'''
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+            self._rows = 0
+
+    @staticmethod
+    def _copy_row(row: tuple[Any, ...]) -> tuple[Any, ...]:
+        if all(type(value) in _IMMUTABLE_TYPES for value in row):
+            return row
+        return copy.deepcopy(row)
+
+    def _pop(self, entry_key: tuple[str, Hashable]) -> None:
+        rows = self._entries.pop(entry_key, None)
+        if rows is not None:
+            self._rows -= len(rows)
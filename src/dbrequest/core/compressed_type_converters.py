@@ -0,0 +1,186 @@
+__all__ = [
+    'CompressedTypeConverter',
+    'CompressedListTypeConverter',
+    'CompressedDictTypeConverter',
+    'build_zlib_dictionary',
+]
+
+import re
+import bz2
+import lzma
+import zlib
+import struct
+from typing import override, Iterable, Literal, TypeAlias
+from collections import Counter
+
+from ..exceptions import TypeConverterError
+from ..interfaces import ITypeConverter, SOURCE_TYPE
+from .type_converters import BaseTypeConverter, ListTypeConverter, DictTypeConverter
+
+
+Codec: TypeAlias = Literal['zlib', 'lzma', 'bz2']
+
+# Stored value: header byte, [4 bytes of dictionary id], payload.
+# Header byte: format version (3 bits) | codec id (4 bits) | payload is UTF-8 text (1 bit).
+FORMAT_VERSION = 1
+_RAW, _ZLIB, _ZLIB_DICT, _LZMA, _BZ2 = range(5)
+_CODEC_IDS: dict[Codec, int] = {'zlib': _ZLIB, 'lzma': _LZMA, 'bz2': _BZ2}
+_DICT_ID = struct.Struct('>I')
+
+
+class CompressedTypeConverter(BaseTypeConverter[SOURCE_TYPE, bytes]):
+    '''
+    Wrap other `ITypeConverter` (that returns `str` or `bytes`) and compress its values with stdlib codecs.
+
+    - Values shorter than `threshold` bytes are stored uncompressed (with the header).
+    - First byte of every value is a header with format version, codec and payload type,
+    so the codec or threshold can be changed without migration of old rows.
+    - Legacy rows stored by the wrapped converter as text (`str`) are read transparently.
+    - `zdict` is a preset dictionary for zlib (see `build_zlib_dictionary`) that improves compression of small values.
+    Values compressed with a dictionary store its id and can be read only with the same dictionary.
+
+    Generic[SOURCE_TYPE]
+
+    Usage:
+    ```
+    type_converters = (CompressedTypeConverter[dict](DictTypeConverter(), codec='zlib', threshold=128), )
+    ```
+    '''
+    def __init__(
+            self,
+            converter: ITypeConverter[SOURCE_TYPE, str] | ITypeConverter[SOURCE_TYPE, bytes],
+            *,
+            codec: Codec = 'zlib',
+            level: int | None = None,
+            threshold: int = 256,
+            zdict: bytes | None = None,
+        ) -> None:
+        if codec not in _CODEC_IDS:
+            raise TypeConverterError(f'Unknown codec "{codec}". Expected one of: {tuple(_CODEC_IDS)}.')
+        if zdict is not None and codec != 'zlib':
+            raise TypeConverterError('`zdict` is supported only by "zlib" codec.')
+
+        self._converter = converter
+        self._codec = codec
+        self._level = level
+        self._threshold = threshold
+        self._zdict = zdict
+        self._zdict_id = zlib.adler32(zdict) if zdict is not None else None
+
+        super().__init__(
+            source_type = converter.source_type,
+            db_type = bytes,
+            to_database_func = self._compress,
+            from_database_func = self._decompress,
+        )
+
+    @override
+    def from_database(self, value: bytes | str) -> SOURCE_TYPE:  # type: ignore[override]
+        if isinstance(value, str):
+            return self._converter.from_database(value)  # type: ignore[arg-type]
+        return super().from_database(value)
+
+    def _compress(self, value: SOURCE_TYPE) -> bytes:
+        db_value = self._converter.to_database(value)
+        is_text = isinstance(db_value, str)
+        payload: bytes = db_value.encode('utf-8') if isinstance(db_value, str) else db_value
+
+        prefix = b''
+        codec_id = _RAW
+        if len(payload) >= self._threshold:
+            if self._codec == 'zlib':
+                level = self._level if self._level is not None else zlib.Z_DEFAULT_COMPRESSION
+                if self._zdict is not None:
+                    compressor = zlib.compressobj(level, zdict=self._zdict)
+                    compressed = compressor.compress(payload) + compressor.flush()
+                    codec_id = _ZLIB_DICT
+                    prefix = _DICT_ID.pack(self._zdict_id)
+                else:
+                    compressed = zlib.compress(payload, level)
+                    codec_id = _ZLIB
+            elif self._codec == 'lzma':
+                compressed = lzma.compress(payload, preset=self._level)
+                codec_id = _LZMA
+            else:
+                compressed = bz2.compress(payload, self._level if self._level is not None else 9)
+                codec_id = _BZ2
+
+            # Incompressible data is kept as is
+            if len(compressed) + len(prefix) < len(payload):
+                payload = compressed
+            else:
+                codec_id = _RAW
+                prefix = b''
+
+        header = (FORMAT_VERSION << 5) | (codec_id << 1) | int(is_text)
+
+        return bytes((header, )) + prefix + payload
+
+    def _decompress(self, value: bytes) -> SOURCE_TYPE:
+        if len(value) == 0:
+            raise TypeConverterError('Compressed value can not be empty.')
+
+        header = value[0]
+        version, codec_id, is_text = header >> 5, (header >> 1) & 0b1111, header & 1
+        if version != FORMAT_VERSION:
+            raise TypeConverterError(f'Unsupported compressed value format version {version}.')
+
+        payload = memoryview(value)[1:]
+        data: bytes
+        if codec_id == _RAW:
+            data = bytes(payload)
+        elif codec_id == _ZLIB:
+            data = zlib.decompress(payload)
+        elif codec_id == _ZLIB_DICT:
+            (dict_id, ) = _DICT_ID.unpack(payload[:_DICT_ID.size])
+            if self._zdict is None or dict_id != self._zdict_id:
+                raise TypeConverterError(f'Value is compressed with unknown zlib dictionary (id {dict_id}).')
+            decompressor = zlib.decompressobj(zdict=self._zdict)
+            data = decompressor.decompress(payload[_DICT_ID.size:]) + decompressor.flush()
+        elif codec_id == _LZMA:
+            data = lzma.decompress(payload)
+        elif codec_id == _BZ2:
+            data = bz2.decompress(payload)
+        else:
+            raise TypeConverterError(f'Unknown codec id {codec_id} in compressed value.')
+
+        return self._converter.from_database(data.decode('utf-8') if is_text else data)  # type: ignore[arg-type]
+
+
+class CompressedListTypeConverter(CompressedTypeConverter[list]):
+    def __init__(self, *, codec: Codec = 'zlib', level: int | None = None, threshold: int = 256, zdict: bytes | None = None) -> None:
+        super().__init__(ListTypeConverter(), codec=codec, level=level, threshold=threshold, zdict=zdict)
+
+class CompressedDictTypeConverter(CompressedTypeConverter[dict]):
+    def __init__(self, *, codec: Codec = 'zlib', level: int | None = None, threshold: int = 256, zdict: bytes | None = None) -> None:
+        super().__init__(DictTypeConverter(), codec=codec, level=level, threshold=threshold, zdict=zdict)
+
+
+_TOKEN = re.compile(rb'"(?:[^"\\]|\\.)*"\s*:?\s*|[^\s"]{4,}')
+
+def build_zlib_dictionary(samples: Iterable[str | bytes], *, size: int = 16 * 1024) -> bytes:
+    '''
+    Build a preset zlib dictionary from sample values (e.g. `DictTypeConverter().to_database(...)` of typical rows).
+
+    Frequent tokens (JSON keys with ":" and repeated strings) are joined, the most useful ones at the end,
+    because zlib finds closer matches with shorter distance codes.
+    '''
+    counter: Counter[bytes] = Counter()
+    for sample in samples:
+        data = sample.encode('utf-8') if isinstance(sample, str) else sample
+        counter.update(_TOKEN.findall(data))
+
+    scored = sorted(
+        ((count * len(token), token) for token, count in counter.items() if count > 1),
+        reverse = True,
+    )
+
+    chosen: list[bytes] = []
+    total = 0
+    for _, token in scored:
+        if total + len(token) > size:
+            continue
+        chosen.append(token)
+        total += len(token)
+
+    return b''.join(reversed(chosen))
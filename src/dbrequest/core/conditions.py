@@ -0,0 +1,323 @@
+__all__ = [
+    'Condition',
+    'ConditionCompiler',
+    'Column',
+    'Comparison',
+    'Between',
+    'In',
+    'IsNull',
+    'WithinLast',
+    'OlderThan',
+    'Contains',
+    'And',
+    'Or',
+    'Not',
+    'normalize_json_path',
+]
+
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterable
+from datetime import datetime as Datetime, date as Date, timedelta as Timedelta
+
+from ..exceptions import SQLArgsError
+from ..interfaces import IField
+
+
+# JSON path of SQLite JSON1 functions: "$", object keys (".key" or '."any key"') and array indexes ("[0]").
+# Paths are inserted into SQL as literals (indexes on expressions and generated columns don't match parameters),
+# so quotes other than around keys are not allowed. Braces are not allowed too: `where` templates are formatted by `str.format`.
+_JSON_PATH = re.compile(r'^\$(?:\.[A-Za-z_][A-Za-z0-9_]*|\."[^"\'{}]*"|\[\d+\])*$')
+_JSON_KEY = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+_JSON_TYPES = (str, int, float)
+
+def normalize_json_path(path: str) -> str:
+    '''Return JSON path started with "$". Paths without "$" are dot-separated keys: "a.b" is "$.a.b".'''
+    if not path.startswith('$'):
+        path = '$' + ''.join(f'.{key}' if _JSON_KEY.match(key) else f'."{key}"' for key in path.split('.'))
+    if not _JSON_PATH.match(path):
+        raise SQLArgsError(f'Invalid JSON path "{path}".')
+    return path
+
+def _append_json_path(path: str | None, key: str | int) -> str:
+    path = '$' if path is None else path
+    if isinstance(key, int):
+        return normalize_json_path(f'{path}[{key}]')
+    return normalize_json_path(path + (f'.{key}' if _JSON_KEY.match(key) else f'."{key}"'))
+
+
+class ConditionCompiler:
+    '''
+    Internal library class. Compile `Condition` objects for a specific `BaseDBRequest`:
+    resolve fields by name, convert values by type converters of the fields and prefix columns with the table alias.
+
+    `json_columns` maps (field name, JSON path) to generated columns, that are used instead of `json_extract`.
+    '''
+    def __init__(
+            self,
+            get_field: Callable[[IField | str], IField],
+            convert_value: Callable[[IField, Any], Any],
+            *,
+            prefix: str = '',
+            json_columns: dict[tuple[str, str], str] | None = None,
+        ) -> None:
+        self._get_field = get_field
+        self._convert_value = convert_value
+        self._prefix = prefix
+        self._json_columns = json_columns if json_columns is not None else {}
+
+    def get_field(self, field: IField | str) -> IField:
+        return self._get_field(field)
+
+    def column(self, field: IField) -> str:
+        return f'{self._prefix}{field.name}'
+
+    def expression(self, field: IField, path: str | None = None) -> str:
+        '''Column of the field or its value by JSON path.'''
+        if path is None:
+            return self.column(field)
+
+        generated_column = self._json_columns.get((field.name, path))
+        if generated_column is not None:
+            return f'{self._prefix}{generated_column}'
+        return f"json_extract({self.column(field)}, '{path}')"
+
+    def value(self, field: IField, value: Any, path: str | None = None) -> Any:
+        '''Database value of the field, or JSON scalar for JSON path.'''
+        if value is None:
+            raise SQLArgsError(f'Comparison of field "{field.name}" with `None`, use `is_null`.')
+        if path is not None:
+            if not isinstance(value, _JSON_TYPES):
+                raise SQLArgsError(f'Value of JSON path "{path}" must be str, int, float or bool, not {type(value)}.')
+            return value
+        return self._convert_value(field, value)
+
+    def compile(self, condition: 'Condition') -> tuple[str, tuple[Any, ...]]:
+        '''Return `where` template with "{}" placeholders and `where_values` for `SQLSelect`.'''
+        return condition.compile(self)
+
+
+class Condition(ABC):
+    '''
+    Predicate of `BaseDBRequest.load_all(where=...)` compiled to SQL `WHERE`.
+    Conditions are combined with `&` (AND), `|` (OR) and `~` (NOT).
+    '''
+    @abstractmethod
+    def compile(self, compiler: ConditionCompiler) -> tuple[str, tuple[Any, ...]]:
+        '''Return SQL with "{}" placeholders and values of the database types.'''
+
+    def __and__(self, other: 'Condition') -> 'Condition':
+        return And(self, other)
+
+    def __or__(self, other: 'Condition') -> 'Condition':
+        return Or(self, other)
+
+    def __invert__(self) -> 'Condition':
+        return Not(self)
+
+
+_OPERATORS = ('=', '!=', '<', '<=', '>', '>=')
+
+# Conditions with `path` compare a value inside a JSON field (see `Column.json`)
+
+class Comparison(Condition):
+    def __init__(self, field: IField | str, operator: str, value: Any, *, path: str | None = None) -> None:
+        if operator not in _OPERATORS:
+            raise SQLArgsError(f'Unknown operator "{operator}". Expected one of: {_OPERATORS}.')
+        self._field = field
+        self._operator = operator
+        self._value = value
+        self._path = path
+
+    def compile(self, compiler: ConditionCompiler) -> tuple[str, tuple[Any, ...]]:
+        field = compiler.get_field(self._field)
+        value = compiler.value(field, self._value, self._path)
+        return f'{compiler.expression(field, self._path)} {self._operator} {{}}', (value, )
+
+class Between(Condition):
+    '''`low <= field <= high`, both bounds are included.'''
+    def __init__(self, field: IField | str, low: Any, high: Any, *, path: str | None = None) -> None:
+        self._field = field
+        self._low = low
+        self._high = high
+        self._path = path
+
+    def compile(self, compiler: ConditionCompiler) -> tuple[str, tuple[Any, ...]]:
+        field = compiler.get_field(self._field)
+        values = (compiler.value(field, self._low, self._path), compiler.value(field, self._high, self._path))
+        return f'{compiler.expression(field, self._path)} BETWEEN {{}} AND {{}}', values
+
+class In(Condition):
+    def __init__(self, field: IField | str, values: Iterable[Any], *, path: str | None = None) -> None:
+        self._field = field
+        self._values = tuple(values)
+        self._path = path
+        if not self._values:
+            raise SQLArgsError('`values` of `In` condition can not be empty.')
+
+    def compile(self, compiler: ConditionCompiler) -> tuple[str, tuple[Any, ...]]:
+        field = compiler.get_field(self._field)
+        values = tuple(compiler.value(field, value, self._path) for value in self._values)
+        return f'{compiler.expression(field, self._path)} IN ({", ".join(["{}"] * len(values))})', values
+
+class IsNull(Condition):
+    '''Value is NULL. For JSON path: the key is missing or its value is JSON `null`.'''
+    def __init__(self, field: IField | str, is_null: bool = True, *, path: str | None = None) -> None:
+        self._field = field
+        self._is_null = is_null
+        self._path = path
+
+    def compile(self, compiler: ConditionCompiler) -> tuple[str, tuple[Any, ...]]:
+        field = compiler.get_field(self._field)
+        return f'{compiler.expression(field, self._path)} IS {"" if self._is_null else "NOT "}NULL', ()
+
+class Contains(Condition):
+    '''JSON array (or object values) of the field, or of its JSON path, contains the value. Uses `json_each`.'''
+    def __init__(self, field: IField | str, value: Any, *, path: str | None = None) -> None:
+        self._field = field
+        self._value = value
+        self._path = path
+
+    def compile(self, compiler: ConditionCompiler) -> tuple[str, tuple[Any, ...]]:
+        field = compiler.get_field(self._field)
+        value = compiler.value(field, self._value, '$' if self._path is None else self._path)
+        source = compiler.column(field) if self._path is None else f"{compiler.column(field)}, '{self._path}'"
+        return f'EXISTS (SELECT 1 FROM json_each({source}) WHERE json_each.value = {{}})', (value, )
+
+class WithinLast(Condition):
+    '''
+    `field >= now - period` for `datetime` and `date` fields.
+    `now` is taken when the condition is compiled: `datetime.now()` or `date.today()` by field type.
+    '''
+    _operator = '>='
+    _method = 'within_last'
+
+    def __init__(self, field: IField | str, period: Timedelta, *, now: Datetime | Date | None = None) -> None:
+        if not isinstance(period, Timedelta):
+            raise SQLArgsError(f'`period` must be `timedelta`, not {type(period)}.')
+        self._field = field
+        self._period = period
+        self._now = now
+
+    def compile(self, compiler: ConditionCompiler) -> tuple[str, tuple[Any, ...]]:
+        field = compiler.get_field(self._field)
+        now = self._now
+        if now is None:
+            if issubclass(field.type, Datetime):
+                now = Datetime.now()
+            elif issubclass(field.type, Date):
+                now = Date.today()
+            else:
+                raise SQLArgsError(f'`{self._method}` needs `datetime` or `date` field, field "{field.name}" has type {field.type}.')
+
+        return Comparison(field, self._operator, now - self._period).compile(compiler)
+
+class OlderThan(WithinLast):
+    '''`field < now - period`: rows expired after `period`. NULL values never match.'''
+    _operator = '<'
+    _method = 'older_than'
+
+class _Group(Condition):
+    _operator: str
+
+    def __init__(self, *conditions: Condition) -> None:
+        if not conditions:
+            raise SQLArgsError(f'`{self.__class__.__name__}` needs at least one condition.')
+        self._conditions = conditions
+
+    def compile(self, compiler: ConditionCompiler) -> tuple[str, tuple[Any, ...]]:
+        parts = []
+        values: tuple[Any, ...] = ()
+        for condition in self._conditions:
+            sql, condition_values = condition.compile(compiler)
+            parts.append(f'({sql})')
+            values += condition_values
+
+        return f' {self._operator} '.join(parts), values
+
+class And(_Group):
+    _operator = 'AND'
+
+class Or(_Group):
+    _operator = 'OR'
+
+class Not(Condition):
+    def __init__(self, condition: Condition) -> None:
+        self._condition = condition
+
+    def compile(self, compiler: ConditionCompiler) -> tuple[str, tuple[Any, ...]]:
+        sql, values = self._condition.compile(compiler)
+        return f'NOT ({sql})', values
+
+
+class Column:
+    '''
+    Builder of conditions on a field with Python operators. Values are native Python values of the field type
+    (`datetime`, `date`, `timedelta`, ...), they are converted by the field type converter,
+    so the conditions use column indexes (`BETWEEN` and comparisons are index range scans).
+
+    Fields stored as JSON text (`ListTypeConverter`, `DictTypeConverter`) are filtered inside the database
+    by JSON1 functions: `Column('settings')['lang']` (or `.json('lang')`, `.json('$.a[0]')`) compares
+    `json_extract` of the path with JSON scalars (str, int, float, bool), `contains` searches arrays by `json_each`.
+    Hot paths can be indexed with generated columns, see `JsonIndex`.
+
+    Usage:
+    ```
+    created = Column(created_field)
+    users.load_all(User(), where=created.within_last(timedelta(hours=24)))
+    users.load_all(User(), where=(created >= start) & (Column('rating') > 10))
+    users.load_all(User(), where=Column('birthday').between(date(2000, 1, 1), date(2000, 12, 31)))
+    users.load_all(User(), where=(Column('settings')['lang'] == 'ru') & Column('tags').contains('admin'))
+    ```
+    '''
+    def __init__(self, field: IField | str, *, path: str | None = None) -> None:
+        self._field = field
+        self._path = normalize_json_path(path) if path is not None else None
+
+    def json(self, path: str) -> 'Column':
+        '''Value of the JSON field by path: "$.a.b[0]" or dot-separated keys "a.b".'''
+        return Column(self._field, path=path)
+
+    def __getitem__(self, key: str | int) -> 'Column':
+        '''Value of the JSON field by object key or array index.'''
+        return Column(self._field, path=_append_json_path(self._path, key))
+
+    def __eq__(self, value: Any) -> Condition:  # type: ignore[override]
+        return IsNull(self._field, path=self._path) if value is None else Comparison(self._field, '=', value, path=self._path)
+
+    def __ne__(self, value: Any) -> Condition:  # type: ignore[override]
+        return IsNull(self._field, False, path=self._path) if value is None else Comparison(self._field, '!=', value, path=self._path)
+
+    def __lt__(self, value: Any) -> Condition:
+        return Comparison(self._field, '<', value, path=self._path)
+
+    def __le__(self, value: Any) -> Condition:
+        return Comparison(self._field, '<=', value, path=self._path)
+
+    def __gt__(self, value: Any) -> Condition:
+        return Comparison(self._field, '>', value, path=self._path)
+
+    def __ge__(self, value: Any) -> Condition:
+        return Comparison(self._field, '>=', value, path=self._path)
+
+    def between(self, low: Any, high: Any) -> Condition:
+        return Between(self._field, low, high, path=self._path)
+
+    def in_(self, values: Iterable[Any]) -> Condition:
+        return In(self._field, values, path=self._path)
+
+    def is_null(self, is_null: bool = True) -> Condition:
+        return IsNull(self._field, is_null, path=self._path)
+
+    def contains(self, value: Any) -> Condition:
+        return Contains(self._field, value, path=self._path)
+
+    def within_last(self, period: Timedelta, *, now: Datetime | Date | None = None) -> Condition:
+        if self._path is not None:
+            raise SQLArgsError('`within_last` is not supported for JSON paths.')
+        return WithinLast(self._field, period, now=now)
+
+    def older_than(self, period: Timedelta, *, now: Datetime | Date | None = None) -> Condition:
+        if self._path is not None:
+            raise SQLArgsError('`older_than` is not supported for JSON paths.')
+        return OlderThan(self._field, period, now=now)
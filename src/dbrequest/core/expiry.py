@@ -0,0 +1,143 @@
+__all__ = ['DeleteProgress', 'ExpiryPolicy', 'ExpiryPurger']
+
+import time
+import logging
+import threading
+from typing import Any, Callable, TypeAlias
+from datetime import timedelta as Timedelta
+
+from ..config import config
+from ..interfaces import IDBRequest, IField
+from .conditions import Condition, OlderThan
+
+
+# Called after every deleted chunk with the total number of deleted rows
+DeleteProgress: TypeAlias = Callable[[int], None]
+
+
+class ExpiryPolicy:
+    '''
+    TTL of table rows: a row is expired when its `field` (`datetime` or `date`) is older than `ttl`.
+    Rows with NULL in the field never expire.
+
+    Expired rows are deleted by `purge_expired` of the request with `delete_where`
+    in chunks of `chunk_size` rows and `pause` seconds between them.
+    `ExpiryPurger` calls it in the background every `interval` seconds.
+    Index the field: every chunk searches expired rows by it.
+    '''
+    def __init__(
+            self,
+            field: IField | str,
+            ttl: Timedelta,
+            *,
+            interval: float = 60.0,
+            chunk_size: int = 500,
+            pause: float = 0.01,
+        ) -> None:
+        if not isinstance(ttl, Timedelta):
+            raise TypeError(f'`ttl` must be `timedelta`, not {type(ttl)}.')
+        if interval <= 0:
+            raise ValueError(f'`interval` must be positive, not {interval}.')
+
+        self.field_name = field.name if isinstance(field, IField) else field
+        self.ttl = ttl
+        self.interval = interval
+        self.chunk_size = chunk_size
+        self.pause = pause
+
+    def get_condition(self) -> Condition:
+        '''Condition of expired rows, the current time is taken when it is compiled.'''
+        return OlderThan(self.field_name, self.ttl)
+
+
+class ExpiryPurger:
+    '''
+    Background thread that calls `purge_expired` of requests with `expiry` policy
+    (`BaseDBRequest`, `ShardedDBRequest`) every `ExpiryPolicy.interval` seconds.
+    Deleted rows are logged to the library logger (`config.LOGGER_NAME`).
+
+    Usage:
+    ```
+    sessions = BaseDBRequest[Session](..., expiry=ExpiryPolicy('created', timedelta(days=30)))
+
+    with ExpiryPurger(sessions):
+        serve_forever()
+    ```
+    '''
+    def __init__(self, *requests: IDBRequest[Any], poll_interval: float = 1.0) -> None:
+        for request in requests:
+            if getattr(request, 'expiry', None) is None or not hasattr(request, 'purge_expired'):
+                raise ValueError(f'Request of {request.model_type} has no `expiry` policy.')
+        if poll_interval <= 0:
+            raise ValueError(f'`poll_interval` must be positive, not {poll_interval}.')
+
+        self._logger = logging.getLogger(config.LOGGER_NAME)
+        self._requests = requests
+        self._poll_interval = poll_interval
+        # The first purge is run on the first poll
+        self._due_times = [0.0] * len(requests)
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            raise RuntimeError('Expiry purger is already running.')
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='dbrequest-expiry', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        '''
+        Stop the thread. A running purge returns after its current chunk.
+        If the thread is still running after `timeout`, `running` stays true and `start` raises `RuntimeError`.
+        '''
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if not self._thread.is_alive():
+                self._thread = None
+
+    def run_pending(self, *, force: bool = False) -> int:
+        '''Purge due requests (all of them with `force`) in the calling thread and return the number of deleted rows.'''
+        with self._lock:
+            deleted = 0
+            for index, request in enumerate(self._requests):
+                now = time.monotonic()
+                if not force and now < self._due_times[index]:
+                    continue
+                if self._stop_event.is_set() and not force:
+                    break
+
+                expiry: ExpiryPolicy = getattr(request, 'expiry')
+                self._due_times[index] = now + expiry.interval
+                try:
+                    # Forced purges are not interrupted by `stop`
+                    count: int = getattr(request, 'purge_expired')(stop=None if force else self._stop_event)
+                except Exception as error:
+                    # A failed purge is retried by the next interval
+                    self._logger.exception(error)
+                    continue
+
+                if count:
+                    self._logger.info(f'Expired {request.model_type.__name__} rows deleted: {count}')
+                deleted += count
+
+            return deleted
+
+    def __enter__(self) -> 'ExpiryPurger':
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._poll_interval):
+            self.run_pending()
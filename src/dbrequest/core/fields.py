@@ -1,9 +1,10 @@
-__all__ = ['BaseField', 'AutoField']
+__all__ = ['BaseField', 'AutoField', 'BlobField', 'RelationField']
 
-from typing import Callable
+from typing import Any, Callable
+from operator import attrgetter
 
 from ..exceptions import InternalError
-from ..interfaces import IField, MODEL, FIELD_TYPE
+from ..interfaces import IField, IDBRequest, MODEL, FIELD_TYPE
 
 
 class BaseField(IField[MODEL, FIELD_TYPE]):
@@ -16,11 +17,15 @@ class BaseField(IField[MODEL, FIELD_TYPE]):
             getter: Callable[[MODEL], FIELD_TYPE],
             setter: Callable[[MODEL, FIELD_TYPE | None], None],
             allowed_none: bool = False,
+            lazy: bool = False,
+            full_text: bool = False,
         ) -> None:
 
         self._name = name
         self._type = field_type
         self._allowed_none = allowed_none
+        self._lazy = lazy
+        self._full_text = full_text
         self._getter = getter
         self._setter = setter
         self._value: FIELD_TYPE | None = None
@@ -33,6 +38,14 @@ class BaseField(IField[MODEL, FIELD_TYPE]):
     def type(self) -> type[FIELD_TYPE]:
         return self._type
     
+    @property
+    def lazy(self) -> bool:
+        return self._lazy
+
+    @property
+    def full_text(self) -> bool:
+        return self._full_text
+
     @property
     def value(self) -> FIELD_TYPE | None:
         if self._value is None and not self._allowed_none:
@@ -56,6 +69,15 @@ class BaseField(IField[MODEL, FIELD_TYPE]):
         self._setter(object, self.value)
 
 
+class _AttributeSetter:
+    '''Picklable replacement of `lambda obj, value: setattr(obj, name, value)`.'''
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __call__(self, object: Any, value: Any) -> None:
+        setattr(object, self._name, value)
+
+
 class AutoField(BaseField[MODEL, FIELD_TYPE]):
     '''
     `BaseField` with automatic creation of getter and setter functions.
@@ -81,9 +103,112 @@ class AutoField(BaseField[MODEL, FIELD_TYPE]):
     private_prop = AutoField('private_prop', int)
     ```
     '''
-    def __init__(self, name: str, field_type: type[FIELD_TYPE], *, allowed_none: bool = False) -> None:
-        getter = lambda obj: getattr(obj, name)
-        setter = lambda obj, value: setattr(obj, name, value)
+    def __init__(
+            self,
+            name: str,
+            field_type: type[FIELD_TYPE],
+            *,
+            allowed_none: bool = False,
+            lazy: bool = False,
+            full_text: bool = False,
+        ) -> None:
+        getter = attrgetter(name)
+        setter = _AttributeSetter(name)
+
+        super().__init__(name, field_type, getter=getter, setter=setter, allowed_none=allowed_none, lazy=lazy, full_text=full_text)
+
+
+class BlobField(AutoField[MODEL, bytes]):
+    '''
+    Deferred `bytes` field for large BLOBs.
 
-        super().__init__(name, field_type, getter=getter, setter=setter, allowed_none=allowed_none)
+    - `load` and `load_all` don't read the column, the model attribute keeps its value.
+    - `save` and `update` write the column only if the value is not `None`.
+    - Use `BaseDBRequest.open_blob`, `read_blob` and `write_blob` to stream the value in chunks.
 
+    Generic[MODEL]
+    '''
+    def __init__(self, name: str) -> None:
+        super().__init__(name, bytes, allowed_none=True)
+
+    @property
+    def deferred(self) -> bool:
+        return True
+
+
+class RelationField(AutoField[MODEL, FIELD_TYPE]):
+    '''
+    Foreign key column: `AutoField` with the key of an object of other table.
+
+    The column stores the key (e.g. `order.user_id`). Related objects are loaded by `prefetch`
+    (or `load_all(prefetch=...)`) with one batched query per relation and set to the model attribute `attribute`
+    (e.g. `order.user`), or `None` if the related object is not found.
+
+    Args:
+        `related_request`: `IDBRequest` of the related table with `load_many` method
+            (`BaseDBRequest`, `UniversalDBRequest`, `ShardedDBRequest`).
+        `related_field`: Field of the related table referenced by the key, usually its key field.
+            Column name may be used if the model attribute has the same name.
+        `attribute`: Model attribute for the related object.
+        `related_model`: Related model class. Required if `related_request` serves several models (`UniversalDBRequest`).
+
+    Generic[MODEL, FIELD_TYPE]
+
+    Usage:
+    ```
+    user_field = RelationField[Order, int]('user_id', int, related_request=users, related_field='id', attribute='user')
+    orders = BaseDBRequest[Order](Order, 'orders', (id_field, user_field), (id_field, ))
+    orders.load_all(Order(), prefetch=(user_field, ))
+    ```
+    '''
+    def __init__(
+            self,
+            name: str,
+            field_type: type[FIELD_TYPE],
+            *,
+            related_request: IDBRequest,
+            related_field: IField | str,
+            attribute: str,
+            related_model: type | None = None,
+            allowed_none: bool = True,
+        ) -> None:
+        super().__init__(name, field_type, allowed_none=allowed_none)
+
+        if related_model is None:
+            related_model = related_request.model_type
+            if not isinstance(related_model, type):
+                raise TypeError('`related_model` must be set for `related_request` with several model types.')
+
+        self._related_request = related_request
+        self._related_field = related_field
+        self._related_field_name = related_field.name if isinstance(related_field, IField) else related_field
+        self._related_model = related_model
+        self._attribute = attribute
+        self._related_setter = _AttributeSetter(attribute)
+
+    @property
+    def related_request(self) -> IDBRequest:
+        return self._related_request
+
+    @property
+    def related_field_name(self) -> str:
+        return self._related_field_name
+
+    @property
+    def related_model(self) -> type:
+        return self._related_model
+
+    @property
+    def attribute(self) -> str:
+        return self._attribute
+
+    def get_related_key(self, related_object: Any) -> Any:
+        '''Return value of the referenced field of the related object.'''
+        if isinstance(self._related_field, IField):
+            self._related_field.get_value_from_object(related_object)
+            return self._related_field.value
+        return getattr(related_object, self._related_field)
+
+    def set_related_object(self, object: MODEL, related_object: Any) -> None:
+        '''Write the related object (or `None`) to the model object.'''
+        self._related_setter(object, related_object)
@@ -0,0 +1,72 @@
+__all__ = ['FULL_TEXT_SUFFIX', 'get_full_text_table', 'build_full_text_script', 'build_text_column', 'build_match_query']
+
+import re
+
+
+# Shadow FTS5 table of "users" is "users_fts"
+FULL_TEXT_SUFFIX = '_fts'
+
+_TOKEN = re.compile(r'[^\W_]+\*?')
+
+
+def get_full_text_table(table: str) -> str:
+    return f'{table}{FULL_TEXT_SUFFIX}'
+
+def _sql_string(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+def build_full_text_script(table: str, columns: tuple[str, ...], *, tokenize: str | None = None, rebuild: bool = False) -> str:
+    '''
+    SQL script that creates the external content FTS5 table for `columns` of `table` and triggers that keep it in sync.
+    `rebuild` fills the index with existing rows.
+    '''
+    fts = get_full_text_table(table)
+    columns_str = ', '.join(columns)
+    new_values = ', '.join(f'new.{column}' for column in columns)
+    old_values = ', '.join(f'old.{column}' for column in columns)
+    options = f", content={_sql_string(table)}, content_rowid='rowid'"
+    if tokenize is not None:
+        options += f', tokenize={_sql_string(tokenize)}'
+
+    insert = f'INSERT INTO {fts}(rowid, {columns_str}) VALUES (new.rowid, {new_values});'
+    delete = f"INSERT INTO {fts}({fts}, rowid, {columns_str}) VALUES ('delete', old.rowid, {old_values});"
+
+    script = (
+        f'CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({columns_str}{options});\n'
+        f'CREATE TRIGGER IF NOT EXISTS {fts}_insert AFTER INSERT ON {table} BEGIN {insert} END;\n'
+        f'CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {table} BEGIN {delete} END;\n'
+        f'CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE OF {columns_str} ON {table} BEGIN {delete} {insert} END;\n'
+    )
+    if rebuild:
+        script += f"INSERT INTO {fts}({fts}) VALUES ('rebuild');\n"
+
+    return script
+
+def build_text_column(
+        table: str,
+        index: int,
+        *,
+        highlight: bool,
+        markers: tuple[str, str],
+        ellipsis: str,
+        tokens: int,
+    ) -> str:
+    '''Result column with FTS5 `snippet` (or `highlight`) of the column number `index` of the FTS5 table.'''
+    fts = get_full_text_table(table)
+    open_marker, close_marker = (_sql_string(marker) for marker in markers)
+    if highlight:
+        return f'highlight({fts}, {index}, {open_marker}, {close_marker})'
+    return f'snippet({fts}, {index}, {open_marker}, {close_marker}, {_sql_string(ellipsis)}, {tokens})'
+
+def build_match_query(query: str) -> str:
+    '''
+    Convert user input to FTS5 query: every word is a quoted token, all of them must match.
+    Word with "*" at the end is a prefix query. FTS5 operators and syntax errors are not possible.
+    '''
+    terms = []
+    for token in _TOKEN.findall(query):
+        if token.endswith('*'):
+            terms.append(f'"{token[:-1]}"*')
+        else:
+            terms.append(f'"{token}"')
+    return ' '.join(terms)
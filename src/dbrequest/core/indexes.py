@@ -0,0 +1,397 @@
+'''
+Index advisor: compare indexes of SQLite tables with the columns used by `BaseDBRequest` objects and by recorded queries.
+
+Report from the command line (trace files are written by `RecordingExecutor`):
+```
+$ python -m dbrequest.core.indexes database.db --trace workload.trace.gz
+$ python -m dbrequest.core.indexes database.db --trace workload.trace.gz --min-count 10 --create
+```
+'''
+__all__ = ['IndexInfo', 'IndexSuggestion', 'IndexAdvisor', 'JsonIndex', 'main']
+
+import re
+import sys
+import zlib
+import logging
+from typing import TYPE_CHECKING, Any, Iterable
+from collections import Counter
+
+from ..config import config
+from ..exceptions import SchemaError
+from ..interfaces import IDatabaseExecutor, IField
+from ..sql import SQLCustom, SQLCreateIndex
+from ..sql.properties import _IDENTIFIER
+from .conditions import normalize_json_path
+
+if TYPE_CHECKING:
+    from .requests import BaseDBRequest
+
+
+class IndexInfo:
+    '''
+    Existing index of a table.
+    `origin` is "c" for `CREATE INDEX`, "u" for `UNIQUE` and "pk" for `PRIMARY KEY` constraints.
+    Columns of expression indexes are `None`.
+    '''
+    def __init__(self, name: str, table: str, columns: tuple[str | None, ...], *, unique: bool, partial: bool, origin: str) -> None:
+        self.name = name
+        self.table = table
+        self.columns = columns
+        self.unique = unique
+        self.partial = partial
+        self.origin = origin
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.name!r}, {self.table!r}, {self.columns!r})'
+
+
+class IndexSuggestion:
+    '''
+    Missing index found by `IndexAdvisor`.
+
+    `reasons`: why the columns need an index ("key field", "sort field", "filter", "ORDER BY").
+    `count`: number of recorded queries that would use the index.
+    '''
+    def __init__(self, table: str, columns: tuple[str, ...], reasons: tuple[str, ...], *, count: int = 0) -> None:
+        self.table = table
+        self.columns = columns
+        self.reasons = reasons
+        self.count = count
+
+    def get_name(self, *, include: tuple[str, ...] = (), where: str | None = None) -> str:
+        name = f'ix_{self.table}_{"_".join(self.columns + include)}'
+        if where is not None:
+            name += f'_p{zlib.crc32(where.encode("utf-8")):08x}'
+        return name
+
+    def to_sql_request(self, *, include: tuple[str, ...] = (), where: str | None = None, unique: bool = False, name: str | None = None) -> SQLCreateIndex:
+        '''
+        Args:
+            `include`: Extra columns appended to the index, so queries reading only these columns
+            don't read the table (covering index).
+            `where`: Condition of a partial index (trusted SQL, see `SQLCreateIndex`).
+            `unique`: Create `UNIQUE` index.
+            `name`: Index name, by default "ix_<table>_<columns>".
+        '''
+        columns = self.columns + tuple(column for column in include if column not in self.columns)
+        if name is None:
+            name = self.get_name(include=columns[len(self.columns):], where=where)
+        return SQLCreateIndex(name, self.table, columns=columns, unique=unique, where=where)
+
+    def __str__(self) -> str:
+        count = f', {self.count} queries' if self.count else ''
+        return f'{self.table} ({", ".join(self.columns)}): {", ".join(self.reasons)}{count}'
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.table!r}, {self.columns!r}, {self.reasons!r}, count={self.count})'
+
+
+class _TableSchema:
+    def __init__(self, columns: tuple[str, ...], rowid_columns: tuple[str, ...], indexes: list[IndexInfo]) -> None:
+        self.columns = columns
+        self.rowid_columns = rowid_columns
+        self.indexes = indexes
+
+    def is_covered(self, columns: tuple[str, ...]) -> bool:
+        '''Query by `columns` searches by rowid or by an index with one of the columns first, instead of a full scan.'''
+        if columns[0] in self.rowid_columns:
+            return True
+        return any(
+            not index.partial and index.columns and index.columns[0] in columns
+            for index in self.indexes
+        )
+
+
+# Recorded statements: SQL generated by `BaseDBRequest` and similar hand-written SQL
+_STATEMENT = re.compile(r'^\s*(?:SELECT\b.*?\bFROM|UPDATE|DELETE\s+FROM)\s+(\w+)(?:\s+AS\s+(\w+))?', re.IGNORECASE | re.DOTALL)
+_WHERE = re.compile(r'\bWHERE\b(.*?)(?:\bORDER\s+BY\b|\bGROUP\s+BY\b|\bLIMIT\b|\bRETURNING\b|;|$)', re.IGNORECASE | re.DOTALL)
+_ORDER_BY = re.compile(r'\bORDER\s+BY\s+(?:(\w+)\.)?(\w+)', re.IGNORECASE)
+_PREDICATE = re.compile(r'(?:\b(\w+)\.)?\b(\w+)\s*(<>|==|=|<=|>=|<|>|\bBETWEEN\b|\bIN\b|\bIS\b)', re.IGNORECASE)
+_EQUALITY_OPERATORS = ('=', '==', 'IN', 'IS')
+_RANGE_OPERATORS = ('<=', '>=', '<', '>', 'BETWEEN')
+
+def _parse_statement(sql: str) -> tuple[str, tuple[str, ...], str | None] | None:
+    '''Return table, filter columns (equality columns, then the first range column) and ORDER BY column.'''
+    match = _STATEMENT.match(sql)
+    if match is None:
+        return None
+    table, alias = match.group(1), match.group(2)
+    names = (table, alias)
+
+    equality: list[str] = []
+    range_column: str | None = None
+    where = _WHERE.search(sql, match.end())
+    if where is not None:
+        for qualifier, column, operator in _PREDICATE.findall(where.group(1)):
+            if qualifier and qualifier not in names:
+                continue
+            operator = operator.upper()
+            if operator in _EQUALITY_OPERATORS:
+                if column not in equality:
+                    equality.append(column)
+            elif operator in _RANGE_OPERATORS and range_column is None:
+                range_column = column
+
+    columns = tuple(equality)
+    if range_column is not None and range_column not in columns:
+        columns += (range_column, )
+
+    order_by = None
+    order = _ORDER_BY.search(sql, match.end())
+    if order is not None and (not order.group(1) or order.group(1) in names):
+        order_by = order.group(2)
+
+    return table, columns, order_by
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class JsonIndex:
+    '''
+    Indexed generated column with the value of a JSON path of a JSON field (`ListTypeConverter`, `DictTypeConverter`).
+
+    Pass it to `BaseDBRequest(json_indexes=...)`: conditions on the path (`Column('settings')['lang'] == 'ru'`)
+    then compare the generated column, which is an index seek instead of `json_extract` of every row.
+    `BaseDBRequest.create_json_indexes` adds missing columns and indexes (or declare them in the table schema).
+
+    The column is `VIRTUAL`: it takes no space in the table, only the index stores the values.
+    `column` is "<field>_<path keys>" by default.
+    '''
+    def __init__(self, field: IField | str, path: str, *, column: str | None = None) -> None:
+        self.field_name = field.name if isinstance(field, IField) else field
+        self.path = normalize_json_path(path)
+        if column is None:
+            column = '_'.join([self.field_name] + re.findall(r'\w+', self.path))
+        if not _IDENTIFIER.match(column):
+            raise SchemaError(f'Invalid generated column name "{column}".')
+        self.column = column
+
+    def get_index_name(self, table: str) -> str:
+        return f'ix_{table}_{self.column}'
+
+    def get_column_sql(self) -> str:
+        '''Column definition for `CREATE TABLE` and `ALTER TABLE ... ADD COLUMN`.'''
+        return f"{self.column} GENERATED ALWAYS AS (json_extract({self.field_name}, '{self.path}')) VIRTUAL"
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.field_name!r}, {self.path!r}, column={self.column!r})'
+
+
+class IndexAdvisor:
+    '''
+    Find missing indexes of SQLite tables for:
+    - key fields of `BaseDBRequest` objects (`load`, `update`, `delete` search by them);
+    - sort fields passed to `add_request` (`load_all(sort_by=...)` with `limit`);
+    - filter and `ORDER BY` columns of recorded queries (`record`, `record_trace`).
+
+    Existing indexes are read by `PRAGMA index_list` and `PRAGMA index_info`.
+    `INTEGER PRIMARY KEY` columns are rowid aliases and need no index.
+
+    Usage:
+    ```
+    advisor = IndexAdvisor()
+    advisor.add_request(users, sort_by=('created', ))
+    advisor.record_trace('workload.trace.gz')
+    print(advisor.report())
+    advisor.check(min_count=10, create=True)
+    ```
+    '''
+    def __init__(self, executor: IDatabaseExecutor | None = None) -> None:
+        '''`executor`: Database of the recorded queries. Tables of `add_request` use executors of the requests.'''
+        if executor is None:
+            from ..executors import UniversalExecutor
+            executor = UniversalExecutor()
+
+        self._logger = logging.getLogger(config.LOGGER_NAME)
+        self._executor = executor
+        self._executors: dict[str, IDatabaseExecutor] = {}
+        self._key_columns: dict[str, list[str]] = {}
+        self._sort_columns: dict[str, list[str]] = {}
+        self._filters: Counter[tuple[str, tuple[str, ...]]] = Counter()
+        self._orders: Counter[tuple[str, str]] = Counter()
+        self._schemas: dict[str, _TableSchema] = {}
+
+    def add_request(self, request: 'BaseDBRequest', *, sort_by: Iterable[IField | str] = ()) -> None:
+        '''Check key fields of the request and fields used as `sort_by`.'''
+        table = request._table_name
+        self._executors[table] = request._executor
+
+        key_columns = self._key_columns.setdefault(table, [])
+        for field in request._key_fields:
+            if field.name not in key_columns:
+                key_columns.append(field.name)
+
+        sort_columns = self._sort_columns.setdefault(table, [])
+        for sort_field in sort_by:
+            name = request._get_field(sort_field).name
+            if name not in sort_columns:
+                sort_columns.append(name)
+
+    def record(self, sql: str) -> None:
+        '''Add executed SQL statement to the query history.'''
+        parsed = _parse_statement(sql)
+        if parsed is None:
+            return
+
+        table, columns, order_by = parsed
+        if columns:
+            self._filters[(table, columns)] += 1
+        if order_by is not None:
+            self._orders[(table, order_by)] += 1
+
+    def record_trace(self, trace_filename: str) -> None:
+        '''Add successful statements of a `RecordingExecutor` trace file to the query history.'''
+        from ..executors.workload import read_trace
+
+        for record in read_trace(trace_filename):
+            if not record.is_script and not record.is_error:
+                self.record(record.sql)
+
+    def get_indexes(self, table: str) -> list[IndexInfo]:
+        return list(self._get_schema(table).indexes)
+
+    def analyze(self, *, min_count: int = 1) -> list[IndexSuggestion]:
+        '''
+        Return missing indexes, most used first.
+        Recorded filters and `ORDER BY` columns are suggested if they are used by at least `min_count` queries.
+        Suggestions whose columns are a prefix of another suggestion are merged into it.
+        '''
+        found: dict[tuple[str, tuple[str, ...]], IndexSuggestion] = {}
+
+        def suggest(table: str, columns: tuple[str, ...], reason: str, count: int = 0) -> None:
+            schema = self._get_schema(table)
+            columns = tuple(column for column in columns if column in schema.columns)
+            if not columns or schema.is_covered(columns):
+                return
+
+            suggestion = found.setdefault((table, columns), IndexSuggestion(table, columns, ()))
+            if reason not in suggestion.reasons:
+                suggestion.reasons += (reason, )
+            suggestion.count += count
+
+        for table, columns in self._key_columns.items():
+            for column in columns:
+                suggest(table, (column, ), 'key field')
+        for table, columns in self._sort_columns.items():
+            for column in columns:
+                suggest(table, (column, ), 'sort field')
+        for (table, columns), count in self._filters.items():
+            if count >= min_count:
+                suggest(table, columns, 'filter', count)
+        for (table, column), count in self._orders.items():
+            if count >= min_count:
+                suggest(table, (column, ), 'ORDER BY', count)
+
+        suggestions = list(found.values())
+        for suggestion in list(suggestions):
+            for other in suggestions:
+                if (
+                    other is not suggestion and other.table == suggestion.table
+                    and len(other.columns) > len(suggestion.columns)
+                    and other.columns[:len(suggestion.columns)] == suggestion.columns
+                ):
+                    other.reasons += tuple(reason for reason in suggestion.reasons if reason not in other.reasons)
+                    other.count += suggestion.count
+                    suggestions.remove(suggestion)
+                    break
+
+        return sorted(suggestions, key=lambda suggestion: ('key field' not in suggestion.reasons, -suggestion.count))
+
+    def report(self, *, min_count: int = 1) -> str:
+        suggestions = self.analyze(min_count=min_count)
+        if not suggestions:
+            return 'No missing indexes.'
+
+        lines = [f'Missing indexes: {len(suggestions)}']
+        for suggestion in suggestions:
+            lines.append(f'- {suggestion}')
+            lines.append(f'  {suggestion.to_sql_request().get_request()[0]}')
+        return '\n'.join(lines)
+
+    def create(
+            self,
+            suggestion: IndexSuggestion,
+            *,
+            include: tuple[str, ...] = (),
+            where: str | None = None,
+            unique: bool = False,
+            name: str | None = None,
+        ) -> str:
+        '''Create the suggested index (see `IndexSuggestion.to_sql_request` for options). Returns the index name.'''
+        request = suggestion.to_sql_request(include=include, where=where, unique=unique, name=name)
+        self._logger.info(f'Creating index: {request.get_request()[0]}')
+        self._get_executor(suggestion.table).start(request)
+        self._schemas.pop(suggestion.table, None)
+
+        return request.name
+
+    def check(self, *, min_count: int = 1, create: bool = False) -> list[IndexSuggestion]:
+        '''Log missing indexes as warnings (e.g. on startup) or create them if `create`. Returns the suggestions.'''
+        suggestions = self.analyze(min_count=min_count)
+        for suggestion in suggestions:
+            if create:
+                self.create(suggestion)
+            else:
+                self._logger.warning(f'Missing index: {suggestion}. Create it with: {suggestion.to_sql_request().get_request()[0]}')
+        return suggestions
+
+    def _get_executor(self, table: str) -> IDatabaseExecutor:
+        return self._executors.get(table, self._executor)
+
+    def _query(self, table: str, sql: str) -> list[tuple[Any, ...]]:
+        return self._get_executor(table).start(SQLCustom(sql, None))
+
+    def _get_schema(self, table: str) -> _TableSchema:
+        schema = self._schemas.get(table)
+        if schema is not None:
+            return schema
+
+        table_info = self._query(table, f'PRAGMA table_info({_quote(table)});')
+        if not table_info:
+            self._logger.warning(f'Index advisor: table "{table}" not found.')
+
+        # cid, name, type, notnull, dflt_value, pk
+        columns = tuple(row[1] for row in table_info)
+        primary_key = [row for row in table_info if row[5]]
+        rowid_columns: tuple[str, ...] = ('rowid', '_rowid_', 'oid')
+        if len(primary_key) == 1 and str(primary_key[0][2]).upper() == 'INTEGER':
+            rowid_columns += (primary_key[0][1], )
+
+        indexes = []
+        # seq, name, unique, origin, partial
+        for _, name, unique, origin, partial in self._query(table, f'PRAGMA index_list({_quote(table)});'):
+            # seqno, cid, name
+            index_columns = tuple(row[2] for row in sorted(self._query(table, f'PRAGMA index_info({_quote(name)});')))
+            indexes.append(IndexInfo(name, table, index_columns, unique=bool(unique), partial=bool(partial), origin=origin))
+
+        schema = _TableSchema(columns, rowid_columns, indexes)
+        self._schemas[table] = schema
+        return schema
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+    from ..executors import SQLiteExecutor
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('database', help='SQLite database file.')
+    parser.add_argument('--trace', action='append', default=[], help='Trace file of `RecordingExecutor`, can be repeated.')
+    parser.add_argument('--min-count', type=int, default=1, help='Minimum number of queries using an index.')
+    parser.add_argument('--create', action='store_true', help='Create the missing indexes.')
+    options = parser.parse_args(argv)
+
+    advisor = IndexAdvisor(SQLiteExecutor(options.database))
+    for trace_filename in options.trace:
+        advisor.record_trace(trace_filename)
+
+    print(advisor.report(min_count=options.min_count))
+    if options.create:
+        created = advisor.check(min_count=options.min_count, create=True)
+        print(f'Created indexes: {len(created)}')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,192 @@
+__all__ = ['LazyValue', 'LazyDict', 'LazyList', 'create_lazy_value']
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+
+class LazyValue(ABC):
+    '''
+    Mixin of `LazyDict` and `LazyList`: container filled from the raw database value on first access.
+
+    - `raw` is the value read from the database, `loader` converts it (e.g. `DictTypeConverter.from_database`).
+    - Any read or write of the container decodes the raw value first.
+    - `reusable` means the raw value can be written back without encoding:
+    the container is not decoded, or it was not modified and has no nested lists or dicts
+    (their in-place changes can not be tracked).
+    '''
+    __slots__ = ()
+
+    _raw: Any
+    _loader: Callable[[Any], Any] | None
+    _modified: bool
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Any:
+        # `dict.__new__` and `list.__new__` don't check abstract methods as `object.__new__` does
+        if cls.__abstractmethods__:
+            raise TypeError(f'Can\'t instantiate abstract class {cls.__name__} without {", ".join(sorted(cls.__abstractmethods__))}.')
+        return super().__new__(cls)
+
+    @property
+    def raw(self) -> Any:
+        return self._raw
+
+    @property
+    def loaded(self) -> bool:
+        return self._loader is None
+
+    @property
+    def modified(self) -> bool:
+        return self._modified
+
+    @property
+    def reusable(self) -> bool:
+        if self._modified:
+            return False
+        if self._loader is not None:
+            return True
+        return not any(isinstance(item, (list, dict)) for item in self._iter_items())
+
+    def load(self) -> None:
+        '''Decode the raw value. Called automatically on first access.'''
+        loader = self._loader
+        if loader is not None:
+            self._loader = None
+            value = loader(self._raw)
+            if isinstance(value, LazyValue):
+                value.load()
+            self._fill(value)
+
+    @abstractmethod
+    def _fill(self, value: Any) -> None:
+        '''Set the decoded value to the empty container.'''
+
+    @abstractmethod
+    def _iter_items(self) -> Any:
+        '''Iterate over items of the decoded container.'''
+
+
+def _reader(base: type, name: str) -> Callable:
+    method = getattr(base, name)
+
+    def wrapper(self: LazyValue, *args: Any, **kwargs: Any) -> Any:
+        if self._loader is not None:
+            self.load()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+def _writer(base: type, name: str) -> Callable:
+    method = getattr(base, name)
+
+    def wrapper(self: LazyValue, *args: Any, **kwargs: Any) -> Any:
+        if self._loader is not None:
+            self.load()
+        self._modified = True
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+def _wrap_methods(cls: type, base: type, readers: tuple[str, ...], writers: tuple[str, ...]) -> type:
+    for name in readers:
+        setattr(cls, name, _reader(base, name))
+    for name in writers:
+        setattr(cls, name, _writer(base, name))
+    return cls
+
+
+class LazyDict(LazyValue, dict):
+    '''
+    `dict` decoded from the database on first access. See `LazyValue`.
+
+    C code that reads dict storage directly (e.g. `PyDict_GetItem` in extensions) sees an empty dict
+    before the first access from Python. Call `load` before passing it to such code.
+    '''
+    __slots__ = ('_raw', '_loader', '_modified')
+
+    def __init__(self, raw: Any, loader: Callable[[Any], dict]) -> None:
+        dict.__init__(self)
+        self._raw = raw
+        self._loader = loader
+        self._modified = False
+
+    def _fill(self, value: Any) -> None:
+        dict.update(self, value)
+
+    def _iter_items(self) -> Any:
+        return dict.values(self)
+
+    def __repr__(self) -> str:
+        self.load()
+        return dict.__repr__(self)
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # Copies and pickles are plain dicts
+        self.load()
+        return (dict, (dict(dict.items(self)), ))
+
+_wrap_methods(
+    LazyDict, dict,
+    readers = (
+        '__getitem__', '__contains__', '__iter__', '__reversed__', '__len__', '__eq__', '__ne__',
+        '__or__', '__ror__', 'get', 'keys', 'values', 'items', 'copy',
+    ),
+    writers = ('__setitem__', '__delitem__', '__ior__', 'pop', 'popitem', 'setdefault', 'update', 'clear'),
+)
+
+
+class LazyList(LazyValue, list):
+    '''
+    `list` decoded from the database on first access. See `LazyValue`.
+
+    C code that reads list storage directly (e.g. `json.dumps`, `list + lazy_list`) sees an empty list
+    before the first access from Python. Call `load` before passing it to such code.
+    Type converters of the library do it automatically.
+    '''
+    __slots__ = ('_raw', '_loader', '_modified')
+
+    def __init__(self, raw: Any, loader: Callable[[Any], list]) -> None:
+        list.__init__(self)
+        self._raw = raw
+        self._loader = loader
+        self._modified = False
+
+    def _fill(self, value: Any) -> None:
+        list.extend(self, value)
+
+    def _iter_items(self) -> Any:
+        return list.__iter__(self)
+
+    def __repr__(self) -> str:
+        self.load()
+        return list.__repr__(self)
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # Copies and pickles are plain lists
+        self.load()
+        return (list, (list(list.__iter__(self)), ))
+
+_wrap_methods(
+    LazyList, list,
+    readers = (
+        '__getitem__', '__contains__', '__iter__', '__reversed__', '__len__',
+        '__eq__', '__ne__', '__lt__', '__le__', '__gt__', '__ge__',
+        '__add__', '__mul__', '__rmul__', 'index', 'count', 'copy',
+    ),
+    writers = (
+        '__setitem__', '__delitem__', '__iadd__', '__imul__',
+        'append', 'extend', 'insert', 'pop', 'remove', 'clear', 'sort', 'reverse',
+    ),
+)
+
+
+def create_lazy_value(source_type: type, raw: Any, loader: Callable[[Any], Any]) -> LazyDict | LazyList:
+    '''Return `LazyDict` or `LazyList` for `source_type` `dict` or `list`.'''
+    if source_type is dict:
+        return LazyDict(raw, loader)
+    if source_type is list:
+        return LazyList(raw, loader)
+    raise TypeError(f'Lazy decoding supports only `dict` and `list`, not {source_type}.')
@@ -0,0 +1,35 @@
+'''Internal helpers for reading a table in worker processes.'''
+
+__all__ = ['get_config_snapshot', 'configure_worker', 'split_range']
+
+from typing import Any
+
+from ..config import config
+
+
+_CONFIG_NAMES = ('DATABASE_FILENAME', 'EXECUTOR', 'LOGGER_NAME', 'SHARD_FILENAMES')
+
+def get_config_snapshot() -> dict[str, Any]:
+    '''Return current library config values, which must be the same in worker processes.'''
+    return {name: getattr(config, name) for name in _CONFIG_NAMES}
+
+def configure_worker(snapshot: dict[str, Any]) -> None:
+    '''
+    `ProcessPoolExecutor` initializer.
+
+    With the "spawn" start method worker processes import the library from scratch,
+    so config set by `init` in the parent process has to be restored. `init_script` is not executed again.
+    '''
+    for name, value in snapshot.items():
+        setattr(config, name, value)
+
+def split_range(lower: int, upper: int, parts: int) -> list[tuple[int, int]]:
+    '''Split closed interval [lower, upper] into at most `parts` half-open intervals [low, high).'''
+    if parts <= 0:
+        raise ValueError(f'`parts` must be positive int, not {parts}.')
+    if type(lower) is not int or type(upper) is not int:
+        raise TypeError(f'Range bounds must be int, not {type(lower)} and {type(upper)}.')
+
+    step = max(1, -(-(upper - lower + 1) // parts))
+
+    return [(low, min(low + step, upper + 1)) for low in range(lower, upper + 1, step)]
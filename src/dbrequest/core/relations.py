@@ -0,0 +1,47 @@
+__all__ = ['prefetch_related', 'MAX_BATCH_SIZE']
+
+from typing import Any, Iterable
+
+from ..exceptions import FactoryError
+from .fields import RelationField
+
+
+# Keys per query, lower than the default maximum number of SQLite host parameters in old versions (999)
+MAX_BATCH_SIZE = 500
+
+
+def prefetch_related(objects: list[Any], relations: Iterable[RelationField], *, batch_size: int = MAX_BATCH_SIZE) -> list[Any]:
+    '''
+    Load related objects of all `objects` with one query per relation (per `batch_size` keys)
+    and set them to the relation attributes. Objects with equal keys share one related object.
+
+    Returns:
+        The same `objects` list.
+    '''
+    for relation in relations:
+        keys: dict[Any, None] = {}
+        for object in objects:
+            relation.get_value_from_object(object)
+            if relation.value is not None:
+                keys[relation.value] = None
+
+        related = _load_related(relation, list(keys), batch_size)
+
+        for object in objects:
+            relation.get_value_from_object(object)
+            relation.set_related_object(object, related.get(relation.value) if relation.value is not None else None)
+
+    return objects
+
+def _load_related(relation: RelationField, keys: list[Any], batch_size: int) -> dict[Any, Any]:
+    load_many = getattr(relation.related_request, 'load_many', None)
+    if load_many is None:
+        raise FactoryError(f'Request {type(relation.related_request)} does not support `load_many`.')
+
+    related: dict[Any, Any] = {}
+    model_type = relation.related_model
+    for start in range(0, len(keys), batch_size):
+        for related_object in load_many(model_type(), relation.related_field_name, keys[start:start + batch_size]):
+            related[relation.get_related_key(related_object)] = related_object
+
+    return related
@@ -1,13 +1,29 @@
 __all__ = ['BaseDBRequest']
 
-from typing import Any
+import os
+import io
+import time
+import threading
+from typing import Any, Callable, ContextManager, Iterable, Iterator
 from types import MethodType
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-from ..exceptions import SchemaError
+from ..exceptions import SchemaError, FactoryError, NotFoundError
 from ..interfaces import IDatabaseExecutor, ITypeConverter, IDBRequest, IField, MODEL
-from ..executors import UniversalExecutor
-from ..sql.requests import SQLInsert, SQLSelect, SQLUpdate, SQLDelete
+from ..sql.requests import SQLInsert, SQLSelect, SQLJoin, SQLUpdate, SQLDelete, SQLCreateIndex, SQLCustom, SQLScript
 from .serializer import Serializer 
+from .cache import QueryCache
+from .parallel import get_config_snapshot, configure_worker, split_range
+from .fields import RelationField
+from .relations import prefetch_related, MAX_BATCH_SIZE
+from .conditions import Condition, ConditionCompiler
+from .indexes import IndexAdvisor, IndexSuggestion, JsonIndex
+from .full_text import get_full_text_table, build_full_text_script, build_text_column, build_match_query
+from .expiry import DeleteProgress, ExpiryPolicy
+
+
+# Alias of the main table in SELECT requests with JOIN
+JOIN_ALIAS = 't0'
 
 
 class BaseDBRequest(IDBRequest[MODEL]):
@@ -28,9 +44,12 @@ class BaseDBRequest(IDBRequest[MODEL]):
             fields: tuple[IField, ...],
             key_fields: tuple[IField, ...],
             *,
-            executor: IDatabaseExecutor = UniversalExecutor(),
+            executor: IDatabaseExecutor | None = None,
             type_converters: tuple[ITypeConverter, ...] = (),
             replace_type_converters: bool = False,
+            cache: QueryCache | None = None,
+            json_indexes: tuple[JsonIndex, ...] = (),
+            expiry: ExpiryPolicy | None = None,
         ) -> None:
         '''
         Class constructor.
@@ -41,50 +60,106 @@ class BaseDBRequest(IDBRequest[MODEL]):
             `fields`: `IField` objects in the same order that the columns in table.
             `key_fields`: Unique `IFields` objects, that can be used as object UID.
             `executor`: Set specific `IDatabaseExecutor` only for that DBRequest instance.
+                If not set, `UniversalExecutor` is created on first use, so it follows the current library config.
             `type_converters`: Tuple of `ITypeConverter` objects used for convert unsupported types. 
                 Passed converters override defaults (it check before default converters).
             `replace_type_converters`: Set `True` for drop default `ITypeConverters` object.
+            `cache`: `QueryCache` for results of `load` and `load_all`. Writes of this object invalidate the table in it.
+            `json_indexes`: `JsonIndex` generated columns used by `where` conditions on JSON paths.
+            `expiry`: `ExpiryPolicy` (TTL) of rows, see `purge_expired` and `ExpiryPurger`.
         '''
 
         self._model_type = model_type
         self._table_name = table_name
-        self._executor = executor
+        self._fields = fields
         self._key_fields = key_fields
-
-        if not replace_type_converters:
-            type_converters = type_converters + executor.default_type_converters
-
-        self._serializer = Serializer[MODEL](
-            fields = fields,
-            supported_types = executor.supported_types,
-            type_converters = type_converters,
-        )
+        self._type_converters = type_converters
+        self._replace_type_converters = replace_type_converters
+        self._lazy_executor = executor
+        self._lazy_serializer: Serializer[MODEL] | None = None
+        self._cache = cache
+        self._json_indexes = json_indexes
+        self._expiry = expiry
 
         if len(key_fields) == 0:
             raise SchemaError('`key_fields` must contents at least one element.')
         for key_field in key_fields:
             if key_field.name not in [field.name for field in fields]:
                 raise SchemaError(f'Key field "{key_field.name}" not found in `fields` tuple.')
+        for json_index in json_indexes:
+            if json_index.field_name not in [field.name for field in fields]:
+                raise SchemaError(f'Field "{json_index.field_name}" of `JsonIndex` not found in `fields` tuple.')
+        if expiry is not None and expiry.field_name not in [field.name for field in fields]:
+            raise SchemaError(f'Field "{expiry.field_name}" of `ExpiryPolicy` not found in `fields` tuple.')
+        for field in fields:
+            if field.full_text and field.type is not str:
+                raise SchemaError(f'Full-text field "{field.name}" must have type `str`, not {field.type}.')
 
     @property
     def model_type(self) -> type[MODEL]:
         return self._model_type
 
+    @property
+    def expiry(self) -> ExpiryPolicy | None:
+        return self._expiry
+
+    @property
+    def _executor(self) -> IDatabaseExecutor:
+        '''Executor is resolved on first use, so the library config may be changed after the constructor call.'''
+        if self._lazy_executor is None:
+            from ..executors import UniversalExecutor
+            self._lazy_executor = UniversalExecutor()
+
+        return self._lazy_executor
+
+    @property
+    def _serializer(self) -> Serializer[MODEL]:
+        '''Serializer depends on the executor types, so it is created together with the executor.'''
+        if self._lazy_serializer is None:
+            type_converters = self._type_converters
+            if not self._replace_type_converters:
+                type_converters = type_converters + self._executor.default_type_converters
+
+            self._lazy_serializer = Serializer[MODEL](
+                fields = self._fields,
+                supported_types = self._executor.supported_types,
+                type_converters = type_converters,
+            )
+
+        return self._lazy_serializer
+
+    @property
+    def _columns(self) -> tuple[str, ...]:
+        '''Columns read by SELECT requests: all except deferred.'''
+        return tuple(field.name for field in self._serializer.loaded_fields)
+
     def save(self, object:MODEL) -> None:
         self._check_type(object)
         
         params, values = self._serializer.get_params_and_values(object)
 
         request = SQLInsert(self._table_name, columns=params, values=values)
-        self._executor.start(request)
+        self._write(request)
         
-    def load(self, object:MODEL) -> bool:
+    def load(self, object:MODEL, *, join:tuple[RelationField | str, ...] = ()) -> bool:
+        '''
+        Load object from database. See `IDBRequest.load`.
+
+        `join`: `RelationField` objects (or their names) whose related objects are loaded by the same SELECT.
+        '''
         self._check_type(object)
         is_found = False
         condition, condition_values = self._get_key_field_condition(object)
+
+        if join:
+            joined = self._load_joined(
+                lambda: object, self._get_relations(join),
+                where=f'{JOIN_ALIAS}.{condition}', where_values=condition_values, limit=1,
+            )
+            return len(joined) > 0
         
-        request = SQLSelect(self._table_name, columns='*', where=condition, where_values=condition_values, limit=1)
-        response = self._executor.start(request)
+        request = SQLSelect(self._table_name, columns=self._columns, where=condition, where_values=condition_values, limit=1)
+        response = self._select(request)
 
         if len(response) > 0:
             is_found = True
@@ -100,18 +175,75 @@ class BaseDBRequest(IDBRequest[MODEL]):
         params, values = self._serializer.get_params_and_values(object)
 
         request = SQLUpdate(self._table_name, columns=params, values=values, where=condition, where_values=condition_values)
-        self._executor.start(request)
+        self._write(request)
         
     def delete(self, object:MODEL) -> None:
         self._check_type(object)
         condition, condition_values = self._get_key_field_condition(object)
         
         request = SQLDelete(self._table_name, where=condition, where_values=condition_values)
-        self._executor.start(request)
+        self._write(request)
+
+    def delete_where(
+            self,
+            object_sample: MODEL,
+            where: Condition,
+            *,
+            chunk_size: int | None = 1000,
+            pause: float = 0.01,
+            progress: DeleteProgress | None = None,
+            stop: threading.Event | None = None,
+        ) -> int:
+        '''
+        Delete all rows that meet `where` condition (see `load_all`) and return the number of deleted rows.
 
-    def load_all(self, object_sample:MODEL, *, limit:int | None=None, reverse:bool=False, sort_by:IField | str | None=None) -> list[MODEL]:
+        Rows are deleted in chunks of `chunk_size` rows in order of `internal_row_id_name` of the executor
+        (or the key field, chunks raise `SchemaError` for composite keys). Every chunk is a short transaction, so other writers wait for one chunk only,
+        and they can run during `pause` seconds between chunks. `chunk_size=None` deletes all rows by one request.
+        `progress` is called after every chunk with the total number of deleted rows.
+        When `stop` event is set, the delete returns after the current chunk (e.g. on shutdown).
+        '''
         self._check_type(object_sample)
-        objects_list = []
+        return self._delete_where(where, chunk_size=chunk_size, pause=pause, progress=progress, stop=stop)
+
+    def purge_expired(self, *, progress: DeleteProgress | None = None, stop: threading.Event | None = None) -> int:
+        '''Delete rows expired by `expiry` policy with `delete_where` and return their number. See `delete_where` for `stop`.'''
+        if self._expiry is None:
+            raise SchemaError(f'Request of table "{self._table_name}" has no `expiry` policy.')
+
+        return self._delete_where(
+            self._expiry.get_condition(),
+            chunk_size = self._expiry.chunk_size,
+            pause = self._expiry.pause,
+            progress = progress,
+            stop = stop,
+        )
+
+    def load_all(
+            self,
+            object_sample: MODEL,
+            *,
+            limit: int | None = None,
+            reverse: bool = False,
+            sort_by: IField | str | None = None,
+            prefetch: tuple[RelationField | str, ...] = (),
+            join: tuple[RelationField | str, ...] = (),
+            where: Condition | None = None,
+        ) -> list[MODEL]:
+        '''
+        Load all objects that meet the conditions. See `IDBRequest.load_all`.
+
+        `where`: condition built with `Column` (e.g. `Column(created).within_last(timedelta(days=1))`).
+        Its values are Python values of the fields, converted by the field type converters.
+
+        `prefetch`: `RelationField` objects (or their names) whose related objects are loaded
+        with one batched query per relation (see `prefetch`).
+        `join`: `RelationField` objects (or their names) whose related objects are loaded by the same SELECT
+        with `LEFT JOIN`. Related tables must be in the same database; joined results are not cached.
+        '''
+        self._check_type(object_sample)
+        relations = self._get_relations(prefetch)
+        joined_relations = self._get_relations(join)
 
         order_by = None
 
@@ -124,7 +256,7 @@ class BaseDBRequest(IDBRequest[MODEL]):
             else:
                 raise TypeError(f'The `sort_by` parameter might be IField, str` or MetodType, not {type(sort_by)}.')
 
-            if sort_field_name in [field.name for field in self._serializer.fields]:
+            if sort_field_name in [field.name for field in self._fields]:
                 order_by = sort_field_name
             else:
                 raise SchemaError(f'Unable to sort by field name "{sort_field_name}": field not exist.')
@@ -135,17 +267,561 @@ class BaseDBRequest(IDBRequest[MODEL]):
         if order_by is not None:
             if reverse:
                 order_by += ' DESC' 
+
+        if joined_relations:
+            where_sql, where_values = self._compile_condition(where, prefix=f'{JOIN_ALIAS}.')
+            objects_list = self._load_joined(
+                type(object_sample), joined_relations,
+                where = where_sql,
+                where_values = where_values,
+                order_by = f'{JOIN_ALIAS}.{order_by}' if order_by is not None else None,
+                limit = limit,
+            )
+            return prefetch_related(objects_list, relations)
         
-        request = SQLSelect(self._table_name, columns='*', order_by=order_by, limit=limit)
-        table = self._executor.start(request)
-        
-        for row in table:
+        where_sql, where_values = self._compile_condition(where)
+        request = SQLSelect(
+            self._table_name, columns=self._columns,
+            where=where_sql, where_values=where_values, order_by=order_by, limit=limit,
+        )
+        objects_list = self._load_objects(type(object_sample), request)
+
+        return prefetch_related(objects_list, relations)
+
+    def load_many(self, object_sample: MODEL, field: IField | str, values: Iterable[Any]) -> list[MODEL]:
+        '''
+        Load objects whose `field` value is one of `values` with batched `IN (...)` queries.
+        Values are converted by the type converter of the field.
+
+        Args:
+            `object_sample`: Some instance of the model class. It will be used to clone objects.
+            `field`: Field or column name, usually a key field.
+            `values`: Python values of the field.
+        Returns:
+            List of new model objects in order of the table.
+        '''
+        self._check_type(object_sample)
+        field = self._get_field(field)
+        db_values = tuple(dict.fromkeys(self._serializer.convert_value(field, value) for value in values))
+
+        objects_list: list[MODEL] = []
+        for start in range(0, len(db_values), MAX_BATCH_SIZE):
+            batch = db_values[start:start + MAX_BATCH_SIZE]
+            request = SQLSelect(
+                self._table_name,
+                columns = self._columns,
+                where = f'{field.name} IN ({", ".join(["{}"] * len(batch))})',
+                where_values = batch,
+            )
+            objects_list.extend(self._load_objects(type(object_sample), request))
+
+        return objects_list
+
+    def prefetch(self, objects: list[MODEL], *relations: RelationField | str) -> list[MODEL]:
+        '''
+        Load related objects of `RelationField` fields for all `objects` (e.g. a result of `load_all`)
+        with one query per relation instead of one query per object.
+
+        Returns:
+            The same `objects` list.
+        '''
+        return prefetch_related(objects, self._get_relations(relations))
+
+    def check_indexes(self, *, sort_by: tuple[IField | str, ...] = (), create: bool = False) -> list[IndexSuggestion]:
+        '''
+        Find missing indexes for the key fields and `sort_by` fields with `IndexAdvisor`, e.g. on startup.
+        Missing indexes are logged as warnings, or created if `create`.
+        '''
+        advisor = IndexAdvisor(self._executor)
+        advisor.add_request(self, sort_by=sort_by)
+        return advisor.check(create=create)
+
+    def create_json_indexes(self) -> None:
+        '''Add missing generated columns and indexes of `json_indexes` to the table.'''
+        # `table_xinfo` lists generated columns too
+        request = SQLCustom(f'PRAGMA table_xinfo({self._table_name});', None)
+        columns = {row[1] for row in self._executor.start(request)}
+
+        for json_index in self._json_indexes:
+            if json_index.column not in columns:
+                self._executor.start(SQLCustom(f'ALTER TABLE {self._table_name} ADD COLUMN {json_index.get_column_sql()};', None))
+            self._executor.start(SQLCreateIndex(
+                json_index.get_index_name(self._table_name), self._table_name, columns=(json_index.column, ),
+            ))
+
+    def create_full_text_index(self, *, tokenize: str | None = None, rebuild: bool = False) -> None:
+        '''
+        Create FTS5 table "<table>_fts" for fields with `full_text=True` and triggers that update it on every write,
+        including writes bypassing `BaseDBRequest`. The table stores only the index, texts are read from the main table.
+        A new index is filled with existing rows, `rebuild` refills an existing one.
+
+        Args:
+            `tokenize`: FTS5 tokenizer, e.g. "porter unicode61" or "unicode61 remove_diacritics 2".
+                It is used only when the FTS5 table is created.
+        '''
+        columns = self._get_full_text_columns()
+        fts = get_full_text_table(self._table_name)
+        request = SQLSelect('sqlite_master', columns=('name', ), where='type = {} AND name = {}', where_values=('table', fts))
+        exists = bool(self._executor.start(request))
+
+        script = build_full_text_script(self._table_name, columns, tokenize=tokenize, rebuild=rebuild or not exists)
+        self._executor.start(SQLScript(script))
+
+    def search(self, object_sample: MODEL, query: str, *, limit: int | None = None, syntax: bool = False) -> list[MODEL]:
+        '''
+        Load objects whose full-text fields match `query`, the most relevant first (FTS5 `bm25` rank).
+        The index must be created by `create_full_text_index`.
+
+        Args:
+            `object_sample`: Some instance of the model class. It will be used to clone objects.
+            `query`: Words that must all be found. Word with "*" at the end matches any word with that prefix.
+            `limit`: Maximum number of objects to load.
+            `syntax`: Pass `query` as is to FTS5 `MATCH`, with its operators ("OR", "NEAR", column filters, ...).
+        '''
+        self._check_type(object_sample)
+        request = self._create_search_request(query, (), limit=limit, syntax=syntax)
+        if request is None:
+            return []
+        return self._load_objects(type(object_sample), request)
+
+    def search_snippets(
+            self,
+            object_sample: MODEL,
+            query: str,
+            field: IField | str,
+            *,
+            limit: int | None = None,
+            syntax: bool = False,
+            highlight: bool = False,
+            markers: tuple[str, str] = ('<b>', '</b>'),
+            ellipsis: str = '...',
+            tokens: int = 16,
+        ) -> list[tuple[MODEL, str]]:
+        '''
+        `search` that also returns a fragment of `field` text around the matches (FTS5 `snippet`),
+        or the whole text if `highlight`. Matched words are wrapped in `markers`.
+
+        Returns:
+            List of (model object, text) tuples, the most relevant first.
+        '''
+        self._check_type(object_sample)
+        field = self._get_field(field)
+        columns = self._get_full_text_columns()
+        if field.name not in columns:
+            raise SchemaError(f'Field "{field.name}" is not full-text field.')
+        if not 0 < tokens <= 64:
+            raise ValueError(f'`tokens` must be from 1 to 64, not {tokens}.')
+
+        text_column = build_text_column(
+            self._table_name, columns.index(field.name),
+            highlight=highlight, markers=markers, ellipsis=ellipsis, tokens=tokens,
+        )
+        request = self._create_search_request(query, (text_column, ), limit=limit, syntax=syntax)
+        if request is None:
+            return []
+
+        results = []
+        for row in self._select(request):
             object = type(object_sample)()
+            self._serializer.set_values_to_object(object, row[:-1])
+            results.append((object, row[-1]))
+
+        return results
+
+    def load_all_parallel(
+            self,
+            object_sample: MODEL,
+            *,
+            workers: int | None = None,
+            partitions: int | None = None,
+            ordered: bool = True,
+            prefetch: tuple[RelationField | str, ...] = (),
+        ) -> Iterator[MODEL]:
+        '''
+        Load all objects using a pool of worker processes.
+
+        The table is split into ranges of `internal_row_id_name` of the executor
+        (or the first key field, which must be integer, if the executor has no row id).
+        Every range is read and deserialized in a worker process with its own database connection,
+        so CPU-bound type conversion is not limited by the GIL.
+
+        Requirements: the model class must be importable by the worker processes (defined on module level),
+        fields and type converters must be picklable (`AutoField` and built-in converters are).
+
+        Args:
+            `object_sample`: Some instance of the model class. It will be used to clone objects.
+            `workers`: Number of worker processes. `os.cpu_count()` by default.
+            `partitions`: Number of ranges. `workers * 4` by default, that balances uneven ranges.
+            `ordered`: Yield objects in range column order. If `False`, ranges are yielded as soon as they are ready.
+            `prefetch`: Relations loaded for every range in this process, see `prefetch`.
+        Returns:
+            Iterator of new model objects.
+        '''
+        self._check_type(object_sample)
+        relations = self._get_relations(prefetch)
+
+        workers = workers if workers else (os.cpu_count() or 1)
+        partitions = partitions if partitions else workers * 4
+        column = self._executor.internal_row_id_name if self._executor.internal_row_id_name else self._key_fields[0].name
+        if not self._executor.internal_row_id_name and (not issubclass(self._key_fields[0].type, int) or self._key_fields[0].type is bool):
+            raise SchemaError(f'Ranges of parallel load need integer key field, not "{column}" of type {self._key_fields[0].type}.')
+
+        request = SQLSelect(self._table_name, columns=(f'MIN({column})', f'MAX({column})'))
+        lower, upper = self._executor.start(request)[0]
+        if lower is None or upper is None:
+            return iter(())
+        if type(lower) is not int or type(upper) is not int:
+            raise SchemaError(f'Ranges of parallel load need integer values of column "{column}", not {type(lower)} and {type(upper)}.')
+
+        ranges = split_range(lower, upper, partitions)
+
+        return self._iterate_ranges(type(object_sample), column, ranges, workers=workers, ordered=ordered, relations=relations)
+
+    def _iterate_ranges(
+            self,
+            model_type: type[MODEL],
+            column: str,
+            ranges: list[tuple[int, int]],
+            *,
+            workers: int,
+            ordered: bool,
+            relations: tuple[RelationField, ...],
+        ) -> Iterator[MODEL]:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=configure_worker, initargs=(get_config_snapshot(), ))
+        try:
+            futures = [pool.submit(self._load_range, model_type, column, low, high) for low, high in ranges]
+            for future in (futures if ordered else as_completed(futures)):
+                yield from prefetch_related(future.result(), relations)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def read_snapshot(self) -> ContextManager[None]:
+        '''
+        Scope where `load`, `load_all` and other reads of the database share one connection in one read transaction
+        (executor must support it, like SQLite), see `SQLiteExecutor.read_snapshot`. `QueryCache` is not used in the scope.
+        '''
+        read_snapshot = getattr(self._executor, 'read_snapshot', None)
+        if read_snapshot is None:
+            raise FactoryError(f'Executor {type(self._executor)} does not support read snapshots.')
+        return read_snapshot()
+
+    def open_blob(self, object: MODEL, field: IField, *, size: int | None = None) -> io.RawIOBase:
+        '''
+        Open the BLOB value of the object stored in the table for incremental I/O (executor must support it, like SQLite).
+
+        Args:
+            `object`: Model object with a key field value.
+            `field`: Field of the BLOB column, usually `BlobField`.
+            `size`: If set, the value is replaced by zero-filled BLOB of that size and opened for writing.
+        Returns:
+            Binary file-like object. Close it (or use `with`) to commit and release the connection.
+        '''
+        self._check_type(object)
+        if field.name not in [field.name for field in self._fields]:
+            raise SchemaError(f'Field "{field.name}" not found in `fields` tuple.')
+
+        open_blob = getattr(self._executor, 'open_blob', None)
+        row_id_name = self._executor.internal_row_id_name
+        if open_blob is None or row_id_name is None:
+            raise FactoryError(f'Executor {type(self._executor)} does not support incremental BLOB I/O.')
+
+        condition, condition_values = self._get_key_field_condition(object)
+        request = SQLSelect(self._table_name, columns=(row_id_name, ), where=condition, where_values=condition_values, limit=1)
+        response = self._executor.start(request)
+        if len(response) == 0:
+            raise NotFoundError(f'Object not found in table "{self._table_name}".')
+
+        return open_blob(self._table_name, field.name, response[0][0], size=size)
+
+    def read_blob(self, object: MODEL, field: IField, target: Any, *, chunk_size: int = 64 * 1024) -> int:
+        '''
+        Copy the BLOB value of the object in chunks without loading it whole into memory.
+
+        Args:
+            `target`: Binary file-like object with `write` method, or writable buffer (`bytearray`, `memoryview`)
+                large enough for the value.
+        Returns:
+            Number of copied bytes.
+        '''
+        copied = 0
+        with self.open_blob(object, field) as stream:
+            if hasattr(target, 'write'):
+                while chunk := stream.read(chunk_size):
+                    target.write(chunk)
+                    copied += len(chunk)
+            else:
+                view = memoryview(target).cast('B')
+                if len(view) < stream.size:
+                    raise ValueError(f'Buffer size {len(view)} is less than BLOB size {stream.size}.')
+                while read := stream.readinto(view[copied:copied + chunk_size]):
+                    copied += read
+
+        return copied
+
+    def write_blob(self, object: MODEL, field: IField, source: Any, *, size: int | None = None, chunk_size: int = 64 * 1024) -> int:
+        '''
+        Replace the BLOB value of the object, writing it in chunks.
+
+        Args:
+            `source`: Bytes-like object (`bytes`, `memoryview`, ...) or binary file-like object with `read` method.
+            `size`: Number of bytes to write from file-like `source`. By default it is read until the end.
+        Returns:
+            Number of written bytes.
+        '''
+        if not hasattr(source, 'read'):
+            view = memoryview(source).cast('B')
+            with self.open_blob(object, field, size=len(view)) as stream:
+                for offset in range(0, len(view), chunk_size):
+                    stream.write(view[offset:offset + chunk_size])
+            return len(view)
+
+        if size is None:
+            position = source.tell()
+            size = source.seek(0, io.SEEK_END) - position
+            source.seek(position)
+
+        written = 0
+        with self.open_blob(object, field, size=size) as stream:
+            while written < size and (chunk := source.read(min(chunk_size, size - written))):
+                stream.write(chunk)
+                written += len(chunk)
+
+        return written
+
+    def __getstate__(self) -> dict[str, Any]:
+        '''Serializer is recreated after unpickling in worker processes.'''
+        state = self.__dict__.copy()
+        state['_lazy_serializer'] = None
+        state['_cache'] = None
+        return state
+
+    def _load_range(self, model_type: type[MODEL], column: str, low: int, high: int) -> list[MODEL]:
+        '''Worker process task of `load_all_parallel`.'''
+        request = SQLSelect(
+            self._table_name,
+            columns = self._columns,
+            where = f'{column} >= {{}} AND {column} < {{}}',
+            where_values = (low, high),
+            order_by = column,
+        )
+
+        return self._load_objects(model_type, request)
+
+    def _load_objects(self, model_type: type[MODEL], request: SQLSelect) -> list[MODEL]:
+        objects_list = []
+        table = self._select(request)
+
+        for row in table:
+            object = model_type()
             self._serializer.set_values_to_object(object, row)
             objects_list.append(object)
 
         return objects_list
 
+    def _load_joined(
+            self,
+            create_object: Callable[[], MODEL],
+            relations: tuple[RelationField, ...],
+            *,
+            where: str | None = None,
+            where_values: tuple[Any, ...] | None = None,
+            order_by: str | None = None,
+            limit: int | None = None,
+        ) -> list[MODEL]:
+        '''
+        Load objects and related objects of `relations` with one SELECT with `LEFT JOIN`.
+        The main table has alias `t0`, related tables `t1`, `t2`, ... in order of `relations`.
+        '''
+        related_requests = tuple(self._get_joined_request(relation) for relation in relations)
+
+        columns = tuple(f'{JOIN_ALIAS}.{column}' for column in self._columns)
+        joins = []
+        for index, (relation, related_request) in enumerate(zip(relations, related_requests), start=1):
+            alias = f't{index}'
+            columns += tuple(f'{alias}.{column}' for column in related_request._columns)
+            joins.append(SQLJoin(
+                related_request._table_name,
+                alias = alias,
+                on = f'{JOIN_ALIAS}.{relation.name} = {alias}.{relation.related_field_name}',
+            ))
+
+        request = SQLSelect(
+            self._table_name, alias=JOIN_ALIAS, joins=tuple(joins), columns=columns,
+            where=where, where_values=where_values, order_by=order_by, limit=limit,
+        )
+        sizes = (len(self._columns), ) + tuple(len(related_request._columns) for related_request in related_requests)
+        # Objects with equal keys share one related object, like in `prefetch`
+        identity_maps: tuple[dict[Any, Any], ...] = tuple({} for _ in relations)
+
+        objects_list = []
+        for row in self._executor.start(request):
+            parts = Serializer.split_row(row, sizes)
+            object = create_object()
+            self._serializer.set_values_to_object(object, parts[0])
+
+            for relation, related_request, part, identity_map in zip(relations, related_requests, parts[1:], identity_maps):
+                relation.get_value_from_object(object)
+                key = relation.value
+                related_object = None
+                if key is not None and key in identity_map:
+                    related_object = identity_map[key]
+                elif key is not None and any(value is not None for value in part):
+                    related_object = relation.related_model()
+                    related_request._serializer.set_values_to_object(related_object, part)
+                    identity_map[key] = related_object
+                relation.set_related_object(object, related_object)
+
+            objects_list.append(object)
+
+        return objects_list
+
+    def _get_full_text_columns(self) -> tuple[str, ...]:
+        columns = tuple(field.name for field in self._fields if field.full_text)
+        if not columns:
+            raise SchemaError(f'Table "{self._table_name}" has no fields with `full_text=True`.')
+        return columns
+
+    def _create_search_request(
+            self, query: str, extra_columns: tuple[str, ...], *, limit: int | None, syntax: bool,
+        ) -> SQLSelect | None:
+        self._get_full_text_columns()
+        match_query = query if syntax else build_match_query(query)
+        if not match_query.strip():
+            return None
+
+        fts = get_full_text_table(self._table_name)
+        return SQLSelect(
+            fts,
+            columns = tuple(f'{JOIN_ALIAS}.{column}' for column in self._columns) + extra_columns,
+            joins = (SQLJoin(self._table_name, alias=JOIN_ALIAS, on=f'{JOIN_ALIAS}.rowid = {fts}.rowid', kind='INNER'), ),
+            where = f'{fts} MATCH {{}}',
+            where_values = (match_query, ),
+            order_by = 'rank',
+            limit = limit,
+        )
+
+    def _get_joined_request(self, relation: RelationField) -> 'BaseDBRequest':
+        related_request = relation.related_request
+        if not isinstance(related_request, BaseDBRequest):
+            # `UniversalDBRequest` selects the request by model type
+            get_request = getattr(related_request, '_get_request', None)
+            if get_request is not None:
+                related_request = get_request(relation.related_model())
+
+        if not isinstance(related_request, BaseDBRequest):
+            raise FactoryError(f'Relation "{relation.name}" can not be joined: {type(related_request)} is not `BaseDBRequest`.')
+
+        return related_request
+
+    def _select(self, request: SQLSelect) -> list[tuple[Any]]:
+        '''Run SELECT request using the cache if it is set.'''
+        # Cached rows may be newer or older than the read snapshot
+        if self._cache is None or getattr(self._executor, 'in_read_snapshot', False):
+            return self._executor.start(request)
+
+        key = request.get_request()
+        rows = self._cache.get(self._table_name, key)
+        if rows is None:
+            version = self._cache.get_version(self._table_name)
+            rows = self._executor.start(request)
+            self._cache.put(self._table_name, key, rows, version=version)
+
+        return rows
+
+    def _write(self, request: SQLInsert | SQLUpdate | SQLDelete) -> list[tuple[Any]]:
+        '''Run request that changes the table and invalidate the cache.'''
+        try:
+            return self._executor.start(request)
+        finally:
+            if self._cache is not None:
+                self._cache.invalidate(self._table_name)
+
+    def _delete_where(
+            self,
+            where: Condition,
+            *,
+            chunk_size: int | None,
+            pause: float,
+            progress: DeleteProgress | None,
+            stop: threading.Event | None,
+        ) -> int:
+        if not isinstance(where, Condition):
+            raise TypeError(f'The `where` parameter must be `Condition`, not {type(where)}.')
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError(f'`chunk_size` must be positive, not {chunk_size}.')
+
+        column = self._executor.internal_row_id_name if self._executor.internal_row_id_name else self._key_fields[0].name
+        where_sql, where_values = self._compile_condition(where)
+        where_values = where_values or ()
+
+        if chunk_size is None:
+            deleted = len(self._write(SQLDelete(self._table_name, where=where_sql, where_values=where_values, returning=(column, ))))
+            if progress is not None:
+                progress(deleted)
+            return deleted
+
+        # Chunks are ranges of a unique column: rows are not skipped or deleted by values of other rows
+        if not self._executor.internal_row_id_name and len(self._key_fields) != 1:
+            raise SchemaError(f'Chunked delete of table "{self._table_name}" needs a row id or a single key field, use `chunk_size=None`.')
+
+        deleted = 0
+        last_value = None
+        while True:
+            # Every chunk continues after the last deleted row, so rows before it are not scanned again
+            chunk_where = where_sql if last_value is None else f'{column} > {{}} AND ({where_sql})'
+            chunk_values = where_values if last_value is None else (last_value, ) + where_values
+            request = SQLDelete(
+                self._table_name,
+                where = f'{column} IN (SELECT {column} FROM {self._table_name} WHERE {chunk_where} ORDER BY {column} LIMIT {int(chunk_size)}) AND ({where_sql})',
+                where_values = chunk_values + where_values,
+                returning = (column, ),
+            )
+            rows = self._write(request)
+            deleted += len(rows)
+            if progress is not None:
+                progress(deleted)
+
+            if len(rows) < chunk_size or (stop is not None and stop.is_set()):
+                return deleted
+
+            last_value = max(row[0] for row in rows)
+            if stop is not None:
+                if stop.wait(pause):
+                    return deleted
+            elif pause > 0:
+                time.sleep(pause)
+
+    def _get_field(self, field: IField | str) -> IField:
+        name = field.name if isinstance(field, IField) else field
+        for own_field in self._fields:
+            if own_field.name == name:
+                return own_field
+
+        raise SchemaError(f'Field "{name}" not found in `fields` tuple.')
+
+    def _compile_condition(self, condition: Condition | None, *, prefix: str = '') -> tuple[str | None, tuple[Any, ...] | None]:
+        if condition is None:
+            return None, None
+        if not isinstance(condition, Condition):
+            raise TypeError(f'The `where` parameter must be `Condition`, not {type(condition)}.')
+
+        compiler = ConditionCompiler(
+            self._get_field, self._serializer.convert_value,
+            prefix = prefix,
+            json_columns = {(json_index.field_name, json_index.path): json_index.column for json_index in self._json_indexes},
+        )
+        return compiler.compile(condition)
+
+    def _get_relations(self, relations: tuple[RelationField | str, ...]) -> tuple[RelationField, ...]:
+        result = []
+        for relation in relations:
+            field = self._get_field(relation)
+            if not isinstance(field, RelationField):
+                raise SchemaError(f'Field "{field.name}" is not `RelationField`.')
+            result.append(field)
+
+        return tuple(result)
+
     def _check_type(self, object:MODEL) -> None:
         if not isinstance(object, self._model_type):
             raise TypeError(f'Got unexpected model object type {type(object)}. Expected: {self._model_type}.')
@@ -4,6 +4,7 @@ from typing import Any, Generic
 
 from ..exceptions import InternalError
 from ..interfaces import ITypeConverter, IField, MODEL
+from .lazy import LazyValue, create_lazy_value
 
 
 class Serializer(Generic[MODEL]):
@@ -30,41 +31,75 @@ class Serializer(Generic[MODEL]):
         `supported_types`: types supported by a specific database
         `type_converters`: `ITypeConverter` objects for converting unsupported types
         '''
+        for field in fields:
+            if field.lazy and field.type not in (list, dict):
+                raise TypeError(f'Lazy field {field.name} must have type `list` or `dict`, not {field.type}.')
+
         self._fields = fields
         self._supported_types = supported_types
         self._type_converters = type_converters
+        self._loaded_fields = tuple(field for field in fields if not field.deferred)
     
     @property
     def fields(self) -> tuple[IField, ...]:
         '''Return current `IField` objects.'''
         return self._fields
 
+    @property
+    def loaded_fields(self) -> tuple[IField, ...]:
+        '''Return `IField` objects read from the database (all except deferred).'''
+        return self._loaded_fields
+
     def get_params_and_values(self, object:MODEL) -> tuple[tuple[str, ...], tuple[Any, ...]]:
-        '''Return prepared parameters and values tuples from input object for writing to the database.'''
-        params_list: list[str] = [field.name for field in self._fields]
+        '''
+        Return prepared parameters and values tuples from input object for writing to the database.
+        Deferred fields with `None` value are skipped.
+        '''
+        params_list: list[str] = []
         values_list: list[Any] = []
 
         for field in self._fields:
             field.get_value_from_object(object)
+            if field.deferred and field.value is None:
+                continue
             value = self._get_field_value(field)
+            params_list.append(field.name)
             values_list.append(value)
         
         return tuple(params_list), tuple(values_list)
     
     def set_values_to_object(self, object:MODEL, values:tuple[Any]) -> None:
-        '''Prepare and set values from database to object.'''
-        if len(self._fields) != len(values):
-            raise InternalError(f'Number of values ({len(self._fields)}) not equal to number of fields ({len(values)}).')
+        '''Prepare and set values from database (in order of `loaded_fields`) to object.'''
+        if len(self._loaded_fields) != len(values):
+            raise InternalError(f'Number of values ({len(values)}) not equal to number of fields ({len(self._loaded_fields)}).')
         
-        data: dict[IField, Any] = dict(zip(self._fields, values))
+        data: dict[IField, Any] = dict(zip(self._loaded_fields, values))
 
         for field in data.keys():
             self._set_field_value(field, data[field])
             field.set_value_to_object(object)
 
-    def _get_field_value(self, field:IField) -> Any:
-        '''Retrieve value from the `IField` object and convert if necessary.'''
-        value = field.value
+    @staticmethod
+    def split_row(row:tuple[Any, ...], sizes:tuple[int, ...]) -> list[tuple[Any, ...]]:
+        '''Split a row of joined tables to parts of `sizes` lengths (one part per table).'''
+        if sum(sizes) != len(row):
+            raise InternalError(f'Number of values ({len(row)}) not equal to number of joined columns ({sum(sizes)}).')
+
+        parts = []
+        start = 0
+        for size in sizes:
+            parts.append(tuple(row[start:start + size]))
+            start += size
+
+        return parts
+
+    def convert_value(self, field:IField, value:Any) -> Any:
+        '''Convert Python value of the field type (e.g. a query parameter) to the database value.'''
+        if isinstance(value, LazyValue):
+            if value.reusable:
+                return value.raw
+            value.load()
+
         if not type(value) in self._supported_types:
             for converter in self._type_converters:
                 if issubclass(field.type, converter.source_type):
@@ -79,12 +114,28 @@ class Serializer(Generic[MODEL]):
 
         return value
 
+    def _get_field_value(self, field:IField) -> Any:
+        '''Retrieve value from the `IField` object and convert if necessary.'''
+        return self.convert_value(field, field.value)
+
     def _set_field_value(self, field:IField, value:Any) -> None:
         '''Set database value to the `IField` object and convert if necessary.'''
-        if not field.type in self._supported_types:
+        if field.type in self._supported_types:
+            if value is not None and not isinstance(value, field.type):
+                # Types converted by the database library (e.g. `SQLiteExecutor` native types)
+                # come unconverted from columns of other declared types
+                for converter in self._type_converters:
+                    if converter.source_type is field.type:
+                        value = converter.from_database(value)
+                        break
+        else:
             for converter in self._type_converters:
                 if issubclass(converter.source_type, field.type):
-                    if not value is None:
+                    if value is None:
+                        pass
+                    elif field.lazy:
+                        value = create_lazy_value(field.type, value, converter.from_database)
+                    else:
                         value = converter.from_database(value)
                     break
             else:
@@ -0,0 +1,255 @@
+__all__ = ['ShardedDBRequest']
+
+import zlib
+import copy
+import heapq
+import threading
+import contextvars
+from typing import Any, Callable, Iterable, Iterator
+from contextlib import ExitStack, contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+from ..config import config
+from ..exceptions import ConfigError, SchemaError
+from ..interfaces import IDatabaseExecutor, ITypeConverter, IDBRequest, IField, MODEL
+from .requests import BaseDBRequest
+from .fields import RelationField
+from .relations import prefetch_related
+from .conditions import Condition
+from .expiry import DeleteProgress, ExpiryPolicy
+
+
+# Database value types in SQLite sort order, NULL goes before them
+_ORDERED_TYPES: tuple[type | tuple[type, ...], ...] = ((int, float), str, bytes)
+
+
+class ShardedDBRequest(IDBRequest[MODEL]):
+    '''
+    `IDBRequest` implementation that hash-partitions one table across several databases (shards).
+
+    - `save`, `update` and `delete` are routed to one shard by the hash of the `shard_key` value.
+    - `load` is routed by `shard_key` if the object has its value, otherwise all shards are searched.
+    - `load_all` reads all shards in parallel threads and merges results by `sort_by`, `limit` and `reverse`.
+
+    Every shard must contain the same table. Key fields other than `shard_key` are unique only within a shard
+    (e.g. AUTOINCREMENT id), so use `shard_key` to identify objects for `update` and `delete`.
+
+    Generic[MODEL]
+
+    Usage:
+    ```
+    dbrequest.init(shard_filenames=('users_0.db', 'users_1.db'), init_script='tables.sql')
+
+    users = ShardedDBRequest[User](User, 'users', fields, key_fields, shard_key=username_field)
+    ```
+    '''
+    def __init__(
+            self,
+            model_type: type[MODEL],
+            table_name: str,
+            fields: tuple[IField, ...],
+            key_fields: tuple[IField, ...],
+            *,
+            shard_key: IField,
+            executors: tuple[IDatabaseExecutor, ...] | None = None,
+            type_converters: tuple[ITypeConverter, ...] = (),
+            replace_type_converters: bool = False,
+            max_workers: int | None = None,
+            expiry: ExpiryPolicy | None = None,
+        ) -> None:
+        '''
+        Class constructor.
+
+        Args:
+            `model_type`, `table_name`, `fields`, `key_fields`, `type_converters`, `replace_type_converters`:
+                Same as in `BaseDBRequest`.
+            `shard_key`: Field whose value selects the shard. It must be set before `save`.
+            `executors`: One `IDatabaseExecutor` per shard.
+                If not set, `UniversalExecutor` is created for every file in `config.SHARD_FILENAMES`.
+            `max_workers`: Maximum number of threads for `load_all`. Number of shards by default.
+            `expiry`: `ExpiryPolicy` (TTL) of rows of every shard, see `BaseDBRequest.purge_expired`.
+        '''
+        if executors is None:
+            if not config.SHARD_FILENAMES:
+                raise ConfigError('Shards are not configured. Set `shard_filenames` in `init` or pass `executors`.')
+
+            from ..executors import UniversalExecutor
+            executors = tuple(UniversalExecutor(filename) for filename in config.SHARD_FILENAMES)
+
+        if len(executors) == 0:
+            raise ConfigError('`executors` must contents at least one element.')
+        if shard_key.name not in [field.name for field in fields]:
+            raise SchemaError(f'Shard key field "{shard_key.name}" not found in `fields` tuple.')
+
+        self._model_type = model_type
+        self._shard_key = shard_key
+        self._fields = fields
+        self._max_workers = max_workers if max_workers else len(executors)
+        self._expiry = expiry
+        self._shards: tuple[BaseDBRequest[MODEL], ...] = tuple(
+            self._create_shard(
+                model_type, table_name, fields, key_fields,
+                executor = executor,
+                type_converters = type_converters,
+                replace_type_converters = replace_type_converters,
+                expiry = expiry,
+            )
+            for executor in executors
+        )
+
+    @property
+    def model_type(self) -> type[MODEL]:
+        return self._model_type
+
+    @property
+    def expiry(self) -> ExpiryPolicy | None:
+        return self._expiry
+
+    @property
+    def shards(self) -> tuple[BaseDBRequest[MODEL], ...]:
+        '''`BaseDBRequest` objects of every shard in order of executors.'''
+        return self._shards
+
+    def save(self, object:MODEL) -> None:
+        self._get_shard(object).save(object)
+
+    def load(self, object:MODEL) -> bool:
+        if self._get_shard_key_value(object) is not None:
+            return self._get_shard(object).load(object)
+
+        for shard in self._shards:
+            if shard.load(object):
+                return True
+
+        return False
+
+    def update(self, object:MODEL) -> None:
+        self._get_shard(object).update(object)
+
+    def delete(self, object:MODEL) -> None:
+        self._get_shard(object).delete(object)
+
+    def load_all(
+            self,
+            object_sample: MODEL,
+            *,
+            limit: int | None = None,
+            reverse: bool = False,
+            sort_by: IField | str | None = None,
+            prefetch: tuple[RelationField | str, ...] = (),
+            where: Condition | None = None,
+        ) -> list[MODEL]:
+        relations = self._shards[0]._get_relations(prefetch)
+        load_shard: Callable[[BaseDBRequest[MODEL]], list[MODEL]] = (
+            lambda shard: shard.load_all(object_sample, limit=limit, reverse=reverse, sort_by=sort_by, where=where)
+        )
+
+        results = self._map_shards(load_shard)
+
+        objects_list: list[MODEL]
+        if sort_by is not None:
+            sort_field = self._get_field(sort_by.name if isinstance(sort_by, IField) else sort_by)
+            objects_list = list(heapq.merge(*results, key=self._create_sort_key(sort_field), reverse=reverse))
+        else:
+            objects_list = [object for result in results for object in result]
+
+        if limit is not None:
+            objects_list = objects_list[:limit]
+
+        return prefetch_related(objects_list, relations)
+
+    @contextmanager
+    def read_snapshot(self) -> Iterator[None]:
+        '''Read snapshot of every shard, see `BaseDBRequest.read_snapshot`. Snapshots of shards are taken one by one.'''
+        with ExitStack() as stack:
+            for shard in self._shards:
+                stack.enter_context(shard.read_snapshot())
+            yield
+
+    def delete_where(self, object_sample: MODEL, where: Condition, **kwargs: Any) -> int:
+        '''Chunked delete in every shard one by one. See `BaseDBRequest.delete_where`.'''
+        return sum(shard.delete_where(object_sample, where, **kwargs) for shard in self._shards)
+
+    def purge_expired(self, *, progress: DeleteProgress | None = None, stop: threading.Event | None = None) -> int:
+        '''Delete expired rows in every shard one by one. `progress` gets the number of deleted rows of the current shard.'''
+        deleted = 0
+        for shard in self._shards:
+            if stop is not None and stop.is_set():
+                break
+            deleted += shard.purge_expired(progress=progress, stop=stop)
+        return deleted
+
+    def load_many(self, object_sample: MODEL, field: IField | str, values: Iterable[Any]) -> list[MODEL]:
+        '''Load objects whose `field` value is one of `values` from all shards. See `BaseDBRequest.load_many`.'''
+        values = list(values)
+        results = self._map_shards(lambda shard: shard.load_many(object_sample, field, values))
+
+        return [object for result in results for object in result]
+
+    def prefetch(self, objects: list[MODEL], *relations: RelationField | str) -> list[MODEL]:
+        '''See `BaseDBRequest.prefetch`.'''
+        return prefetch_related(objects, self._shards[0]._get_relations(relations))
+
+    def _map_shards(self, function: Callable[[BaseDBRequest[MODEL]], list[MODEL]]) -> list[list[MODEL]]:
+        '''Run `function` for every shard in threads. They get copies of the caller context (`read_snapshot`, `query_timeout`, ...).'''
+        contexts = [contextvars.copy_context() for _ in self._shards]
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(self._shards))) as pool:
+            return list(pool.map(lambda context, shard: context.run(function, shard), contexts, self._shards))
+
+    def _create_shard(self, model_type: type[MODEL], table_name: str, fields: tuple[IField, ...], key_fields: tuple[IField, ...], **kwargs: Any) -> BaseDBRequest[MODEL]:
+        '''Create a shard request with its own copies of fields, because `IField` objects store values and shards run in parallel.'''
+        fields_copy = tuple(copy.copy(field) for field in fields)
+        fields_by_name = {field.name: field for field in fields_copy}
+        key_fields_copy = tuple(fields_by_name[field.name] for field in key_fields)
+
+        return BaseDBRequest[MODEL](model_type, table_name, fields_copy, key_fields_copy, **kwargs)
+
+    def _get_field(self, name: str) -> IField:
+        for field in self._fields:
+            if field.name == name:
+                return field
+
+        raise SchemaError(f'Unable to sort by field name "{name}": field not exist.')
+
+    def _create_sort_key(self, field: IField) -> Callable[[MODEL], tuple[int, Any]]:
+        '''
+        Shards sort rows by database values, so they are merged by the values converted by the field converter.
+        SQLite puts NULL values first, then numbers, text and blobs in ascending order.
+        '''
+        def sort_key(object: MODEL) -> tuple[int, Any]:
+            field.get_value_from_object(object)
+            value = self._shards[0]._serializer.convert_value(field, field.value)
+            if value is None:
+                return (0, 0)
+            for rank, types in enumerate(_ORDERED_TYPES, start=1):
+                if isinstance(value, types):
+                    return (rank, value)
+            raise SchemaError(f'Unable to merge shards sorted by field "{field.name}": database values of type {type(value)} are not ordered.')
+
+        return sort_key
+
+    def _get_shard_key_value(self, object:MODEL) -> Any:
+        try:
+            self._shard_key.get_value_from_object(object)
+            return self._shard_key.value
+        except (TypeError, ValueError):
+            return None
+
+    def _get_shard(self, object:MODEL) -> BaseDBRequest[MODEL]:
+        if not isinstance(object, self._model_type):
+            raise TypeError(f'Got unexpected model object type {type(object)}. Expected: {self._model_type}.')
+
+        value = self._get_shard_key_value(object)
+        if value is None:
+            raise SchemaError(f'Unable to select shard: shard key field "{self._shard_key.name}" is empty (None type).')
+
+        # Hash of the database value: Python values equal in SQL (`True` and 1) go to the same shard.
+        # `hash()` is randomized between processes for `str` and `bytes`, so a stable checksum is used
+        db_value = self._shards[0]._serializer.convert_value(self._shard_key, value)
+        if isinstance(db_value, float) and db_value.is_integer():
+            db_value = int(db_value)
+        if type(db_value) not in (int, float, str, bytes):
+            raise SchemaError(f'Unable to select shard: database value of shard key field "{self._shard_key.name}" has type {type(db_value)}, not int, float, str or bytes.')
+        index = zlib.crc32(repr(db_value).encode()) % len(self._shards)
+
+        return self._shards[index]
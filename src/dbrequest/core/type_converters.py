@@ -10,13 +10,15 @@ __all__ = [
     'TimedeltaTypeConverter',
 ]
 
-from typing import override, Callable
+from typing import override, Any, Callable
+from functools import partial
 from datetime import datetime as Datetime, date as Date, timedelta as Timedelta
 
 import json 
 
 from ..exceptions import TypeConverterError
 from ..interfaces import ITypeConverter, SOURCE_TYPE, DB_TYPE
+from .lazy import LazyValue, create_lazy_value
 
 
 class BaseTypeConverter(ITypeConverter[SOURCE_TYPE, DB_TYPE]):
@@ -38,14 +40,18 @@ class BaseTypeConverter(ITypeConverter[SOURCE_TYPE, DB_TYPE]):
 
         self._source_type = source_type
         self._db_type = db_type
-        self._to_database_func = to_database_func if to_database_func else lambda value: self._db_type.__call__(value)
-        self._from_database_func = from_database_func if from_database_func else lambda value: self._source_type.__call__(value)
+        self._to_database_func = to_database_func if to_database_func else self._db_type.__call__
+        self._from_database_func = from_database_func if from_database_func else self._source_type.__call__
     
     @property
     @override
     def source_type(self) -> type[SOURCE_TYPE]:
         return self._source_type
 
+    @property
+    def db_type(self) -> type[DB_TYPE]:
+        return self._db_type
+
     @override
     def to_database(self, value: SOURCE_TYPE) -> DB_TYPE:
         if not isinstance(value, self._source_type):
@@ -85,10 +91,44 @@ class BaseTypeConverter(ITypeConverter[SOURCE_TYPE, DB_TYPE]):
         return source_value
 
 
+# Convert functions are module-level (not lambdas), so converters can be pickled and sent to worker processes
+
+def _to_json(dumps: Callable[[Any], str], value: Any) -> str:
+    if isinstance(value, LazyValue):
+        if value.reusable:
+            return value.raw
+        value.load()
+    return dumps(value)
+
+def _from_json(source_type: type[SOURCE_TYPE], value: str) -> SOURCE_TYPE:
+    return source_type.__call__(json.loads(value))
+
+def _from_json_lazy(source_type: type[SOURCE_TYPE], value: str) -> SOURCE_TYPE:
+    return create_lazy_value(source_type, value, partial(_from_json, source_type))  # type: ignore[return-value]
+
+def _datetime_to_database(db_type: type[DB_TYPE], value: Datetime) -> DB_TYPE:
+    return db_type.__call__(value.timestamp())
+
+def _timedelta_to_database(db_type: type[DB_TYPE], value: Timedelta) -> DB_TYPE:
+    return db_type.__call__(value.total_seconds())
+
+def _timedelta_from_database(value: Any) -> Timedelta:
+    return Timedelta(seconds=value)
+
+
 class BaseJsonTypeConverter(BaseTypeConverter[SOURCE_TYPE, str]):
-    def __init__(self, source_type:type[SOURCE_TYPE], **json_kwargs) -> None:
-        to_database_func = lambda value: json.dumps(value, **json_kwargs)
-        from_database_func = lambda value: source_type.__call__(json.loads(value))
+    '''
+    Convert value to JSON string with `json.dumps(value, **json_kwargs)`.
+
+    With `lazy=True` (only `list` and `dict`) `from_database` returns `LazyList` or `LazyDict`,
+    which parse JSON on first access. Unmodified lazy values are written back without encoding.
+    '''
+    def __init__(self, source_type:type[SOURCE_TYPE], *, lazy: bool = False, **json_kwargs) -> None:
+        if lazy and source_type not in (list, dict):
+            raise TypeConverterError(f'Lazy decoding supports only `list` and `dict`, not {source_type}.')
+
+        to_database_func = partial(_to_json, partial(json.dumps, **json_kwargs))
+        from_database_func = partial(_from_json_lazy if lazy else _from_json, source_type)
         super().__init__(
             source_type = source_type,
             db_type = str,
@@ -103,21 +143,21 @@ class BoolTypeConverter(BaseTypeConverter[bool, int]):
         super().__init__(source_type=bool, db_type=int)
 
 class ListTypeConverter(BaseJsonTypeConverter[list]): 
-    def __init__(self, **json_kwargs: dict) -> None:
-        super().__init__(source_type=list, **json_kwargs)
+    def __init__(self, *, lazy: bool = False, **json_kwargs: dict) -> None:
+        super().__init__(source_type=list, lazy=lazy, **json_kwargs)
 
 class TupleTypeConverter(BaseJsonTypeConverter[tuple]):
     def __init__(self, **json_kwargs: dict) -> None:
         super().__init__(source_type=tuple, **json_kwargs)
 
 class DictTypeConverter(BaseJsonTypeConverter[dict]):
-    def __init__(self, **json_kwargs: dict) -> None:
-        super().__init__(source_type=dict, **json_kwargs)
+    def __init__(self, *, lazy: bool = False, **json_kwargs: dict) -> None:
+        super().__init__(source_type=dict, lazy=lazy, **json_kwargs)
 
 class DatetimeTypeConverter(BaseTypeConverter[Datetime, DB_TYPE]):
     def __init__(self, db_type:type[DB_TYPE]) -> None:
-        to_database_func = lambda value: db_type.__call__(value.timestamp())
-        from_database_func = lambda value: Datetime.fromtimestamp(value)
+        to_database_func = partial(_datetime_to_database, db_type)
+        from_database_func = Datetime.fromtimestamp
         super().__init__(
             source_type = Datetime,
             db_type = db_type,
@@ -127,8 +167,8 @@ class DatetimeTypeConverter(BaseTypeConverter[Datetime, DB_TYPE]):
 
 class DateTypeConverter(BaseTypeConverter[Date, int]):
     def __init__(self) -> None:
-        to_database_func = lambda value: value.toordinal()
-        from_database_func = lambda value: Date.fromordinal(value)
+        to_database_func = Date.toordinal
+        from_database_func = Date.fromordinal
         super().__init__(
             source_type = Date,
             db_type = int,
@@ -138,8 +178,8 @@ class DateTypeConverter(BaseTypeConverter[Date, int]):
 
 class TimedeltaTypeConverter(BaseTypeConverter[Timedelta, DB_TYPE]):
     def __init__(self, db_type:type[DB_TYPE]) -> None:
-        to_database_func = lambda value: db_type.__call__(value.total_seconds())
-        from_database_func = lambda value: Timedelta(seconds=value)
+        to_database_func = partial(_timedelta_to_database, db_type)
+        from_database_func = _timedelta_from_database
         super().__init__(
             source_type = Timedelta,
             db_type = db_type,
@@ -1,10 +1,12 @@
 __all__ = ['UniversalDBRequest']
 
-from typing import Any, no_type_check
+from typing import Any, Iterable, Iterator, no_type_check
 from types import MethodType
+from contextlib import ExitStack, contextmanager
 
 from ..exceptions import FactoryError
 from ..interfaces import IDBRequest, IField, MODEL
+from .conditions import Condition
 
 
 class UniversalDBRequest(IDBRequest[Any]):
@@ -33,8 +35,11 @@ class UniversalDBRequest(IDBRequest[Any]):
     def save(self, object:MODEL) -> None:
         self._get_request(object).save(object)
     
-    def load(self, object:MODEL) -> bool:
-        return self._get_request(object).load(object)
+    def load(self, object:MODEL, *, join: tuple[IField | str, ...] = ()) -> bool:
+        request = self._get_request(object)
+        if join:
+            return request.load(object, join=join)  # type: ignore[call-arg]
+        return request.load(object)
     
     def update(self, object:MODEL) -> None:
         self._get_request(object).update(object)
@@ -42,9 +47,68 @@ class UniversalDBRequest(IDBRequest[Any]):
     def delete(self, object:MODEL) -> None:
         self._get_request(object).delete(object)
     
-    def load_all(self, object_sample:MODEL, *, limit:int | None=None, reverse:bool=False, sort_by:IField | str | None=None) -> list[MODEL]:
-        return self._get_request(object_sample).load_all(object_sample, limit=limit, reverse=reverse, sort_by=sort_by)
+    def load_all(
+            self,
+            object_sample: MODEL,
+            *,
+            limit: int | None = None,
+            reverse: bool = False,
+            sort_by: IField | str | None = None,
+            prefetch: tuple[IField | str, ...] = (),
+            join: tuple[IField | str, ...] = (),
+            where: Condition | None = None,
+        ) -> list[MODEL]:
+        request = self._get_request(object_sample)
+        # Relation options and conditions are passed only if set, so any `IDBRequest` works without them
+        kwargs: dict[str, Any] = {}
+        if prefetch:
+            kwargs['prefetch'] = prefetch
+        if join:
+            kwargs['join'] = join
+        if where is not None:
+            kwargs['where'] = where
+        return request.load_all(object_sample, limit=limit, reverse=reverse, sort_by=sort_by, **kwargs)
+
+    def load_many(self, object_sample: MODEL, field: IField | str, values: Iterable[Any]) -> list[MODEL]:
+        return self._get_method(object_sample, 'load_many')(object_sample, field, values)
+
+    def delete_where(self, object_sample: MODEL, where: Condition, **kwargs: Any) -> int:
+        '''Chunked delete by the request of the model type. See `BaseDBRequest.delete_where`.'''
+        return self._get_method(object_sample, 'delete_where')(object_sample, where, **kwargs)
+
+    def prefetch(self, objects: list[MODEL], *relations: IField | str) -> list[MODEL]:
+        '''Prefetch relations of objects of every model type by its request. See `BaseDBRequest.prefetch`.'''
+        objects_by_type: dict[type, list[Any]] = {}
+        for object in objects:
+            objects_by_type.setdefault(type(object), []).append(object)
+
+        for typed_objects in objects_by_type.values():
+            self._get_method(typed_objects[0], 'prefetch')(typed_objects, *relations)
+
+        return objects
     
+    @contextmanager
+    def read_snapshot(self) -> Iterator[None]:
+        '''
+        Scope where reads of all requests share one connection and one read transaction per database,
+        so a report over several model types sees consistent data. See `BaseDBRequest.read_snapshot`.
+        '''
+        with ExitStack() as stack:
+            for request in self._requests:
+                read_snapshot = getattr(request, 'read_snapshot', None)
+                if read_snapshot is None:
+                    raise FactoryError(f'Request {type(request)} does not support read snapshots.')
+                # Requests of the same database reuse the snapshot of the first one
+                stack.enter_context(read_snapshot())
+            yield
+
+    def _get_method(self, object:MODEL, name: str) -> Any:
+        request = self._get_request(object)
+        method = getattr(request, name, None)
+        if method is None:
+            raise FactoryError(f'Request {type(request)} does not support `{name}`.')
+        return method
+
     def _get_request(self, object:MODEL) -> IDBRequest[MODEL]:
         for request in self._requests:
             if isinstance(object, request.model_type):
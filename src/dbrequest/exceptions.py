@@ -5,6 +5,10 @@ class InternalError(BaseDBRequestError): pass
 class SchemaError(BaseDBRequestError): pass
 class TypeConverterError(BaseDBRequestError): pass
 class FactoryError(BaseDBRequestError): pass
+class NotFoundError(BaseDBRequestError): pass
 
 class SQLArgsError(BaseDBRequestError): pass
 
+class QueryTimeoutError(BaseDBRequestError, TimeoutError): pass
+class QueryCancelledError(BaseDBRequestError): pass
+class OverloadedError(BaseDBRequestError): pass
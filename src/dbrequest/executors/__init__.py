@@ -1,3 +1,10 @@
 from .universal_executor import UniversalExecutor
 from .sqlite_executor import SQLiteExecutor
 
+from .workload import RecordingExecutor, replay_trace
+from .sqlite_cache_validator import SQLiteCacheValidator
+from .sqlite_backup import SQLiteSnapshot
+from .sqlite_maintenance import MaintenanceScheduler
+from .sqlite_timeout import CancellationToken, query_timeout, cancellation, run_async
+from .priority import PriorityExecutor, PriorityStats, query_priority
+from .sqlite_routing import RoutingExecutor, read_your_writes
@@ -0,0 +1,261 @@
+__all__ = ['Priority', 'PRIORITIES', 'PriorityStats', 'PriorityExecutor', 'query_priority']
+
+import time
+import logging
+import threading
+import contextvars
+from collections import deque
+from typing import Any, Iterator, Literal, TypeAlias
+from contextlib import contextmanager
+
+from ..config import config
+from ..exceptions import OverloadedError
+from ..interfaces import ISQLRequest, ITypeConverter, IDatabaseExecutor
+
+
+Priority: TypeAlias = Literal['interactive', 'normal', 'batch']
+# From the highest priority to the lowest
+PRIORITIES: tuple[Priority, ...] = ('interactive', 'normal', 'batch')
+
+# Queue times kept per priority for percentiles
+_SAMPLES = 1000
+
+_priority: contextvars.ContextVar[Priority | None] = contextvars.ContextVar('dbrequest_query_priority', default=None)
+
+
+@contextmanager
+def query_priority(priority: Priority) -> Iterator[None]:
+    '''
+    Priority of `PriorityExecutor` requests in the scope (the current thread or asyncio task).
+    It overrides the priority of the executor view passed to the request object.
+    '''
+    if priority not in PRIORITIES:
+        raise ValueError(f'Unknown priority "{priority}".')
+
+    reset_token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(reset_token)
+
+
+class PriorityStats:
+    '''Counters and queue times (seconds) of one priority class of `PriorityExecutor`.'''
+    def __init__(self, priority: Priority, queued: int, running: int, completed: int, shed: int, queue_times: list[float]) -> None:
+        self.priority = priority
+        self.queued = queued
+        self.running = running
+        self.completed = completed
+        self.shed = shed
+        self._queue_times = sorted(queue_times)
+
+    def percentile(self, percent: float) -> float:
+        '''Queue time percentile of the recent requests, 0.0 without requests.'''
+        if not self._queue_times:
+            return 0.0
+        index = min(len(self._queue_times) - 1, int(len(self._queue_times) * percent / 100))
+        return self._queue_times[index]
+
+    def __str__(self) -> str:
+        return (
+            f'{self.priority}: {self.running} running, {self.queued} queued, {self.completed} completed, {self.shed} shed, '
+            f'queue time p50 {self.percentile(50) * 1000:.2f} ms, p99 {self.percentile(99) * 1000:.2f} ms'
+        )
+
+
+class _Waiter:
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.granted = False
+        self.arrival_time = time.perf_counter()
+
+
+class PriorityExecutor(IDatabaseExecutor):
+    '''
+    `IDatabaseExecutor` wrapper with admission control: at most `max_concurrency` requests run at once,
+    waiting requests are started by priority ("interactive", "normal", "batch"), in arrival order within a priority.
+
+    - "batch" requests may use only `max_concurrency - reserved` slots, so `reserved` slots are always
+    left for latency-sensitive requests, and batch work uses the leftover capacity.
+    - Load shedding: a request is rejected with `OverloadedError` if the queue of its priority already has
+    `max_queue` requests, or if it waits longer than `max_wait` seconds. Both may be set per priority with a dict.
+    - `stats` reports counters and queue-time percentiles per priority.
+
+    The priority of a request is set by `query_priority` scope, otherwise by the executor view
+    (see `for_priority`) that the request object uses, otherwise it is "normal".
+
+    Usage:
+    ```
+    executor = PriorityExecutor(SQLiteExecutor(), max_concurrency=4, max_queue={'batch': 100})
+    users = BaseDBRequest[User](..., executor=executor.for_priority('interactive'))
+    reports = BaseDBRequest[Report](..., executor=executor.for_priority('batch'))
+    ```
+    '''
+    def __init__(
+            self,
+            executor: IDatabaseExecutor,
+            *,
+            max_concurrency: int = 4,
+            reserved: int = 1,
+            max_queue: int | dict[Priority, int] | None = None,
+            max_wait: float | dict[Priority, float] | None = None,
+        ) -> None:
+        if max_concurrency < 1:
+            raise ValueError(f'`max_concurrency` must be positive, not {max_concurrency}.')
+        if not 0 <= reserved < max_concurrency:
+            raise ValueError(f'`reserved` must be in range 0...{max_concurrency - 1}, not {reserved}.')
+
+        self._logger = logging.getLogger(config.LOGGER_NAME)
+        self._executor = executor
+        self._max_concurrency = max_concurrency
+        self._limits: dict[Priority, int] = {
+            priority: max_concurrency - reserved if priority == 'batch' else max_concurrency for priority in PRIORITIES
+        }
+        self._max_queue = self._get_per_priority(max_queue)
+        self._max_wait = self._get_per_priority(max_wait)
+
+        self._lock = threading.Lock()
+        self._running = 0
+        self._queues: dict[Priority, deque[_Waiter]] = {priority: deque() for priority in PRIORITIES}
+        self._running_by_priority = dict.fromkeys(PRIORITIES, 0)
+        self._completed = dict.fromkeys(PRIORITIES, 0)
+        self._shed = dict.fromkeys(PRIORITIES, 0)
+        self._queue_times: dict[Priority, deque[float]] = {priority: deque(maxlen=_SAMPLES) for priority in PRIORITIES}
+
+    @property
+    def supported_types(self) -> tuple[type, ...]:
+        return self._executor.supported_types
+
+    @property
+    def default_type_converters(self) -> tuple[ITypeConverter, ...]:
+        return self._executor.default_type_converters
+
+    @property
+    def internal_row_id_name(self) -> str | None:
+        return self._executor.internal_row_id_name
+
+    def start(self, sql_request: ISQLRequest) -> list[tuple[Any]]:
+        return self.start_with_priority(sql_request, 'normal')
+
+    def start_with_priority(self, sql_request: ISQLRequest, priority: Priority) -> list[tuple[Any]]:
+        '''Run the request with `priority`, unless `query_priority` scope sets another one.'''
+        priority = _priority.get() or priority
+        if priority not in PRIORITIES:
+            raise ValueError(f'Unknown priority "{priority}".')
+
+        self._acquire(priority)
+        try:
+            return self._executor.start(sql_request)
+        finally:
+            self._release(priority)
+
+    def for_priority(self, priority: Priority) -> IDatabaseExecutor:
+        '''Executor view for request objects: runs their requests with `priority` through this executor.'''
+        if priority not in PRIORITIES:
+            raise ValueError(f'Unknown priority "{priority}".')
+        return _PriorityView(self, priority)
+
+    def stats(self) -> dict[Priority, PriorityStats]:
+        with self._lock:
+            return {
+                priority: PriorityStats(
+                    priority,
+                    queued = len(self._queues[priority]),
+                    running = self._running_by_priority[priority],
+                    completed = self._completed[priority],
+                    shed = self._shed[priority],
+                    queue_times = list(self._queue_times[priority]),
+                )
+                for priority in PRIORITIES
+            }
+
+    def __getattr__(self, name: str) -> Any:
+        '''Extra features of the wrapped executor (e.g. `SQLiteExecutor.open_blob`) bypass admission control.'''
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._executor, name)
+
+    def _acquire(self, priority: Priority) -> None:
+        waiter = _Waiter()
+        with self._lock:
+            max_queue = self._max_queue.get(priority)
+            if max_queue is not None and len(self._queues[priority]) >= max_queue:
+                self._shed[priority] += 1
+                message = f'Queue of {priority} requests is full ({max_queue}), request is rejected'
+                self._logger.warning(message)
+                raise OverloadedError(message)
+
+            self._queues[priority].append(waiter)
+            self._grant()
+
+        if not waiter.event.wait(self._max_wait.get(priority)):
+            with self._lock:
+                # The slot may be granted right after the timeout
+                if not waiter.granted:
+                    self._queues[priority].remove(waiter)
+                    self._shed[priority] += 1
+                    message = f'{priority.capitalize()} request waited longer than {self._max_wait[priority]} s, request is rejected'
+                    self._logger.warning(message)
+                    raise OverloadedError(message)
+
+        with self._lock:
+            self._queue_times[priority].append(time.perf_counter() - waiter.arrival_time)
+
+    def _release(self, priority: Priority) -> None:
+        with self._lock:
+            self._running -= 1
+            self._running_by_priority[priority] -= 1
+            self._completed[priority] += 1
+            self._grant()
+
+    def _grant(self) -> None:
+        # Called under the lock: start waiting requests from the highest priority while there are free slots
+        for priority in PRIORITIES:
+            queue = self._queues[priority]
+            while queue and self._running < self._limits[priority]:
+                waiter = queue.popleft()
+                waiter.granted = True
+                self._running += 1
+                self._running_by_priority[priority] += 1
+                waiter.event.set()
+            if queue:
+                # Lower priorities don't overtake a waiting request
+                return
+
+    @staticmethod
+    def _get_per_priority(value: Any) -> dict[Priority, Any]:
+        if value is None:
+            return {}
+        if isinstance(value, dict):
+            for priority in value:
+                if priority not in PRIORITIES:
+                    raise ValueError(f'Unknown priority "{priority}".')
+            return dict(value)
+        return dict.fromkeys(PRIORITIES, value)
+
+
+class _PriorityView(IDatabaseExecutor):
+    '''`PriorityExecutor` with another default priority, see `PriorityExecutor.for_priority`.'''
+    def __init__(self, executor: PriorityExecutor, priority: Priority) -> None:
+        self._executor = executor
+        self._priority = priority
+
+    @property
+    def supported_types(self) -> tuple[type, ...]:
+        return self._executor.supported_types
+
+    @property
+    def default_type_converters(self) -> tuple[ITypeConverter, ...]:
+        return self._executor.default_type_converters
+
+    @property
+    def internal_row_id_name(self) -> str | None:
+        return self._executor.internal_row_id_name
+
+    def start(self, sql_request: ISQLRequest) -> list[tuple[Any]]:
+        return self._executor.start_with_priority(sql_request, self._priority)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._executor, name)
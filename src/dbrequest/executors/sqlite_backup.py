@@ -0,0 +1,113 @@
+__all__ = ['BackupProgress', 'copy_database', 'SQLiteSnapshot']
+
+import time
+import uuid
+import sqlite3
+from typing import Any, Callable, TypeAlias
+
+from ..interfaces import ITypeConverter
+from .sqlite_executor import SQLiteExecutor
+
+
+# Called after every step with the numbers of copied and total pages
+BackupProgress: TypeAlias = Callable[[int, int], None]
+
+
+class _Restarted(Exception):
+    pass
+
+def copy_database(
+        source: sqlite3.Connection,
+        target: sqlite3.Connection,
+        *,
+        pages: int = 256,
+        sleep: float = 0.005,
+        progress: BackupProgress | None = None,
+        max_restarts: int = 3,
+    ) -> None:
+    '''
+    Copy the database of `source` connection to `target` with the SQLite online backup API.
+
+    - Every step copies `pages` pages (-1 or 0 copies everything in one step) under a short read lock,
+    then the copy pauses for `sleep` seconds, so writers of the source are not blocked for long.
+    - If another connection writes to the source during the copy, SQLite restarts it,
+    so the result is always a consistent state of the database.
+    - Under constant writes a stepwise copy may never finish: after `max_restarts` restarts
+    the database is copied in one step (in WAL mode it doesn't block writers).
+    '''
+    if sleep < 0:
+        raise ValueError(f'`sleep` must be non-negative, not {sleep}.')
+
+    restarts = 0
+    last_remaining: int | None = None
+
+    def on_step(status: int, remaining: int, total: int) -> None:
+        nonlocal restarts, last_remaining
+        if last_remaining is not None and remaining > last_remaining:
+            restarts += 1
+            if restarts > max_restarts:
+                raise _Restarted()
+        last_remaining = remaining
+
+        if progress is not None:
+            progress(total - remaining, total)
+        if remaining > 0 and sleep > 0:
+            time.sleep(sleep)
+
+    # `sleep` of `Connection.backup` is used only for retries of busy or locked steps
+    try:
+        source.backup(target, pages=pages if pages > 0 else -1, progress=on_step, sleep=sleep)
+    except _Restarted:
+        source.backup(target, pages=-1, progress=on_step, sleep=sleep)
+
+
+class SQLiteSnapshot(SQLiteExecutor):
+    '''
+    `SQLiteExecutor` of a consistent in-memory copy of a database, created by `SQLiteExecutor.snapshot`.
+    Long read-heavy work (reports, analytics) on the copy doesn't hold locks or read pages of the production database.
+
+    The copy is shared by connections of this process only (`load_all_parallel` can't read it)
+    and is never written back. `close` (or `with`) frees the memory.
+    '''
+    def __init__(
+            self,
+            source: sqlite3.Connection,
+            *,
+            pages: int = -1,
+            sleep: float = 0.0,
+            progress: BackupProgress | None = None,
+            native_types: bool | dict[str, ITypeConverter] = False,
+            timeout: float | None = None,
+        ) -> None:
+        filename = f'file:dbrequest_snapshot_{uuid.uuid4().hex}?mode=memory&cache=shared'
+        super().__init__(filename, native_types=native_types, timeout=timeout)
+
+        # The in-memory database lives while at least one connection is open
+        self._keeper: sqlite3.Connection | None = sqlite3.connect(filename, uri=True, check_same_thread=False)
+        try:
+            copy_database(source, self._keeper, pages=pages, sleep=sleep, progress=progress)
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def closed(self) -> bool:
+        return self._keeper is None
+
+    def close(self) -> None:
+        if self._keeper is not None:
+            self._keeper.close()
+            self._keeper = None
+
+    def __enter__(self) -> 'SQLiteSnapshot':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        if getattr(self, '_keeper', None) is not None:
+            self.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        raise TypeError('`SQLiteSnapshot` is available only in the process that created it.')
@@ -0,0 +1,64 @@
+__all__ = ['BlobStream']
+
+import io
+import sqlite3
+from typing import Any
+
+
+class BlobStream(io.RawIOBase):
+    '''
+    Binary file-like object for incremental I/O of one SQLite BLOB value (`sqlite3.Blob`).
+
+    The stream owns its connection: `close` commits written data and closes the connection.
+    BLOB size can't be changed by writing, it is set when the stream is opened for writing.
+    Wrap in `io.BufferedReader` if many small reads are expected.
+    '''
+    def __init__(self, connection: sqlite3.Connection, blob: sqlite3.Blob, *, readonly: bool) -> None:
+        super().__init__()
+        self._connection = connection
+        self._blob = blob
+        self._readonly = readonly
+
+    @property
+    def size(self) -> int:
+        return len(self._blob)
+
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return not self._readonly
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        view = memoryview(buffer).cast('B')
+        data = self._blob.read(len(view))
+        view[:len(data)] = data
+        return len(data)
+
+    def write(self, data: Any) -> int:
+        if self._readonly:
+            raise io.UnsupportedOperation('BLOB is opened for reading only.')
+
+        view = memoryview(data).cast('B')
+        self._blob.write(view)
+        return len(view)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._blob.seek(offset, whence)
+        return self._blob.tell()
+
+    def tell(self) -> int:
+        return self._blob.tell()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            self._blob.close()
+            self._connection.commit()
+        finally:
+            self._connection.close()
+            super().close()
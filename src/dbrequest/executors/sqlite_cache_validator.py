@@ -0,0 +1,113 @@
+__all__ = ['SQLiteCacheValidator']
+
+import sqlite3
+import threading
+
+from ..config import config
+from ..exceptions import SQLArgsError
+from ..interfaces import ICacheValidator
+from ..sql.properties import _IDENTIFIER
+
+
+CHANGES_TABLE = 'dbrequest_changes'
+
+class SQLiteCacheValidator(ICacheValidator):
+    '''
+    `ICacheValidator` for SQLite based on `PRAGMA data_version`.
+
+    `PRAGMA data_version` on a persistent connection changes when any other connection
+    (of this or another process) commits to the database. Checking it costs one cheap query,
+    so `QueryCache` can be validated on every lookup.
+
+    By default any change makes all cached tables stale. With `tracked_tables` the validator keeps per-table
+    write counters in the `dbrequest_changes` table, updated by triggers, so only changed tables are reported
+    (untracked tables are still reported on any change).
+    Triggers are created by `install` and add a small cost to every written row.
+
+    Usage:
+    ```
+    validator = SQLiteCacheValidator(tracked_tables=('users', 'orders'))
+    validator.install()
+    cache = QueryCache(validator=validator)
+    ```
+    '''
+    def __init__(self, database_filename: str | None = None, *, tracked_tables: tuple[str, ...] = ()) -> None:
+        for table in tracked_tables:
+            if not _IDENTIFIER.match(table):
+                raise SQLArgsError(f'Invalid table name "{table}".')
+
+        self._database_filename = database_filename
+        self._tracked_tables = tracked_tables
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._data_version: int | None = None
+        self._table_versions: dict[str, int] = {}
+
+    def install(self) -> None:
+        '''Create the counters table and triggers of tracked tables. Safe to call several times.'''
+        script = f'CREATE TABLE IF NOT EXISTS {CHANGES_TABLE} (table_name TEXT PRIMARY KEY, version INTEGER NOT NULL DEFAULT 0);\n'
+        for table in self._tracked_tables:
+            script += f"INSERT OR IGNORE INTO {CHANGES_TABLE} (table_name, version) VALUES ('{table}', 0);\n"
+            for event in ('INSERT', 'UPDATE', 'DELETE'):
+                script += (
+                    f'CREATE TRIGGER IF NOT EXISTS {CHANGES_TABLE}_{table}_{event.lower()} AFTER {event} ON {table} BEGIN '
+                    f"UPDATE {CHANGES_TABLE} SET version = version + 1 WHERE table_name = '{table}'; END;\n"
+                )
+
+        with self._lock:
+            connection = self._get_connection()
+            connection.executescript(script)
+            connection.commit()
+
+    def get_stale_tables(self, tables: set[str]) -> set[str]:
+        with self._lock:
+            connection = self._get_connection()
+            data_version = connection.execute('PRAGMA data_version;').fetchone()[0]
+
+            if data_version == self._data_version:
+                return set()
+
+            # Changes made before the first check are unknown
+            is_first_check = self._data_version is None
+            self._data_version = data_version
+
+            if not self._tracked_tables:
+                return set(tables)
+
+            table_versions = self._read_table_versions(connection)
+            if table_versions is None or is_first_check:
+                self._table_versions = table_versions or {}
+                return set(tables)
+
+            changed = {table for table, version in table_versions.items() if self._table_versions.get(table) != version}
+            self._table_versions = table_versions
+
+            return {table for table in tables if table in changed or table not in self._tracked_tables}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+                self._data_version = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            database_filename = config.DATABASE_FILENAME if self._database_filename is None else self._database_filename
+            self._connection = sqlite3.connect(
+                database_filename,
+                uri = database_filename.startswith('file:'),
+                check_same_thread = False,
+                isolation_level = None,
+            )
+
+        return self._connection
+
+    def _read_table_versions(self, connection: sqlite3.Connection) -> dict[str, int] | None:
+        try:
+            rows = connection.execute(f'SELECT table_name, version FROM {CHANGES_TABLE};').fetchall()
+        except sqlite3.OperationalError:
+            # Counters table is not installed: changed tables are unknown
+            return None
+
+        return dict(rows)
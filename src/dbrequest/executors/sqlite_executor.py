@@ -1,27 +1,117 @@
+import os
+import time
 import sqlite3
 import logging
-from typing import Any
+import threading
+import contextvars
+from typing import TYPE_CHECKING, Any, Iterator
+from functools import partial
+from contextlib import closing, contextmanager
 
 from ..config import config
+from ..exceptions import QueryTimeoutError, QueryCancelledError
 from ..interfaces import ITypeConverter, ISQLRequest, IDatabaseExecutor
-from ..sql import SQLFile
-from ..core.type_converters import (
-    BoolTypeConverter, ListTypeConverter, TupleTypeConverter, DictTypeConverter,
-    DatetimeTypeConverter, DateTypeConverter, TimedeltaTypeConverter,
-)
+from ..sql import SQLScript, SQLSelect
+from .sqlite_blob import BlobStream
+from .sqlite_timeout import PROGRESS_INSTRUCTIONS, get_limits
+
+if TYPE_CHECKING:
+    from .sqlite_backup import BackupProgress, SQLiteSnapshot
+    from .sqlite_timeout import CancellationToken
+
+
+# Converters of `sqlite3` are global, registered names are kept to register them once per process
+_registered_converters: dict[str, ITypeConverter] = {}
+# Adapters of `sqlite3` are global and keyed by Python type: every type is adapted for one declared type per process
+_adapted_types: dict[type, str] = {}
+
+class _ReadSnapshot:
+    '''Connection of `SQLiteExecutor.read_snapshot` scope inside a read transaction.'''
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.connection = connection
+        self.lock = threading.Lock()
+
+# Snapshots of the current scope by database filename and conversion mode, shared by all executors of the database
+_read_snapshots: contextvars.ContextVar[dict[tuple[str, bool], _ReadSnapshot]] = contextvars.ContextVar('dbrequest_read_snapshots', default={})
+
+def _convert_native_value(converter: ITypeConverter, db_type: type, value: bytes) -> Any:
+    # `sqlite3` passes values to converters as bytes
+    if db_type is str:
+        return converter.from_database(value.decode('utf-8'))
+    if db_type is bytes:
+        return converter.from_database(value)
+    return converter.from_database(db_type(value))
 
 
 class SQLiteExecutor(IDatabaseExecutor):
-    def __init__(self, database_filename: str | None = None) -> None:
+    '''
+    `IDatabaseExecutor` implementation for the `sqlite3` module. Every request uses a new connection.
+
+    Database filenames started with "file:" are opened as URI,
+    e.g. "file:name?mode=memory&cache=shared" for a shared in-memory database.
+
+    `native_types` moves type conversion into the `sqlite3` module: converters are registered as
+    `sqlite3` adapters (by Python type) and converters (by declared column type, `PARSE_DECLTYPES`),
+    so `Serializer` passes these values without conversion. `True` registers default converters
+    for columns declared as: `BOOLEAN`, `JSON_LIST`, `JSON_TUPLE`, `JSON_DICT`, `DATETIME_TS`, `DATE_ORDINAL`, `TIMEDELTA_SECONDS`.
+    A dict maps declared types to `BaseTypeConverter` objects (any converter with `db_type`).
+    Columns declared with other types are converted by `Serializer` as usual.
+
+    Adapters and converters of `sqlite3` are global: they apply to all connections of the process,
+    so a Python type may be adapted for one declared type only, and adapters registered by other code are not replaced.
+
+    `timeout` is the time budget of every request in seconds, enforced by the `sqlite3` progress handler:
+    a request over it is interrupted with `QueryTimeoutError` (`query_timeout` scopes override it).
+    Requests in `cancellation` scopes (and calls of `run_async`) are interrupted with `QueryCancelledError`.
+    Time spent waiting for locks is limited by the busy timeout of `sqlite3`, not by `timeout`.
+
+    `read_snapshot` scope runs all SELECT requests of the database on one connection in one read transaction.
+
+    The executor tracks its activity (`idle_time`), so background work like `MaintenanceScheduler` can wait for quiet periods.
+    '''
+    def __init__(
+            self,
+            database_filename: str | None = None,
+            *,
+            native_types: bool | dict[str, ITypeConverter] = False,
+            timeout: float | None = None,
+        ) -> None:
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f'`timeout` must be positive, not {timeout}.')
+
         self._logger = logging.getLogger(config.LOGGER_NAME)
         self._database_filename = database_filename
+        self._timeout = timeout
+        self._activity_lock = threading.Lock()
+        self._active_requests = 0
+        self._last_activity = time.monotonic()
+
+        if native_types is True:
+            native_types = self._get_default_native_types()
+        self._native_types: dict[str, ITypeConverter] = {name.upper(): converter for name, converter in (native_types or {}).items()}
+        source_types: dict[type, str] = {}
+        for name, converter in self._native_types.items():
+            if getattr(converter, 'db_type', None) not in (int, float, str, bytes):
+                raise TypeError(f'Native type "{name}" needs converter with `db_type` int, float, str or bytes.')
+            other_name = source_types.setdefault(converter.source_type, name)
+            if other_name != name:
+                raise TypeError(
+                    f'Native types "{other_name}" and "{name}" have the same source type {converter.source_type}, '
+                    'but `sqlite3` adapts a Python type only one way.'
+                )
+        self._check_adapters()
 
     @property
     def supported_types(self) -> tuple[type, ...]:
-        return (int, float, str, bytes, type(None))
+        return (int, float, str, bytes, type(None)) + tuple(converter.source_type for converter in self._native_types.values())
     
     @property
     def default_type_converters(self) -> tuple[ITypeConverter, ...]:
+        from ..core.type_converters import (
+            BoolTypeConverter, ListTypeConverter, TupleTypeConverter, DictTypeConverter,
+            DatetimeTypeConverter, DateTypeConverter, TimedeltaTypeConverter,
+        )
+
         return (
             BoolTypeConverter(),
             ListTypeConverter(),
@@ -35,44 +125,316 @@ class SQLiteExecutor(IDatabaseExecutor):
     @property
     def internal_row_id_name(self) -> str:
         return 'rowid'
+
+    @property
+    def idle_time(self) -> float:
+        '''Seconds since the last request of the executor has finished, 0.0 while any request is running.'''
+        with self._activity_lock:
+            if self._active_requests:
+                return 0.0
+            return time.monotonic() - self._last_activity
     
+    @property
+    def in_read_snapshot(self) -> bool:
+        '''`read_snapshot` scope of the database is active in the current context.'''
+        return self._get_read_snapshot_key() in _read_snapshots.get()
+
     def start(self, sql_request:ISQLRequest) -> list[tuple[Any]]:
         if not isinstance(sql_request, ISQLRequest):
             raise TypeError(type(sql_request))
         
-        database_filename = config.DATABASE_FILENAME if self._database_filename is None else self._database_filename
+        snapshot = self._get_read_snapshot(sql_request)
+        if snapshot is not None:
+            return self._read_in_snapshot(snapshot, sql_request)
+
+        database_filename = self._get_database_filename()
         connection = None
+
+        self._begin_activity()
+        try:
+            connection = self._connect(database_filename)
+            return self._execute(connection, sql_request)
+
+        except sqlite3.Error as error:
+            if connection is None:
+                self._logger.exception(error)
+            raise
+
+        finally:
+            if connection is not None:
+                self._logger.debug(f'Lines changed: {connection.total_changes}')
+                connection.close()
+            self._end_activity()
+
+    @contextmanager
+    def read_snapshot(self) -> Iterator[None]:
+        '''
+        Scope (the current thread or asyncio task) where all SELECT requests of the database, made by any executor
+        of the same database file, share one connection inside one `BEGIN` transaction.
+        Reads in the scope see one consistent state of the database and don't pay connection setup.
+        Nested scopes of the same database reuse the outer snapshot.
+
+        Other requests run on their own connections as usual, their changes are not visible to reads of the scope.
+        In rollback journal mode the snapshot blocks writers until the scope ends, use WAL.
+
+        Usage:
+        ```
+        with executor.read_snapshot():
+            orders = orders_request.load_all(Order())
+            items = items_request.load_all(Item())
+        ```
+        '''
+        key = self._get_read_snapshot_key()
+        snapshots = _read_snapshots.get()
+        if key in snapshots:
+            yield
+            return
+
+        connection = self._connect(key[0], check_same_thread=False)
+        try:
+            connection.isolation_level = None
+            connection.execute('BEGIN;')
+            # The read transaction takes its snapshot on the first read
+            connection.execute('SELECT COUNT(*) FROM sqlite_master;').fetchall()
+
+            reset_token = _read_snapshots.set({**snapshots, key: _ReadSnapshot(connection)})
+            try:
+                yield
+            finally:
+                _read_snapshots.reset(reset_token)
+        finally:
+            connection.close()
+
+    def open_blob(self, table: str, column: str, row: int, *, size: int | None = None) -> BlobStream:
+        '''
+        Open BLOB value of the row (by `rowid`) for incremental I/O.
+
+        If `size` is set, the value is replaced by zero-filled BLOB of that size and opened for writing.
+        Otherwise it is opened for reading only.
+        '''
+        database_filename = self._get_database_filename()
+        self._touch()
+        connection = self._connect(database_filename)
+
+        try:
+            if size is not None:
+                self._logger.debug(f'Allocating BLOB {table}.{column} of row {row}: {size} bytes')
+                connection.execute(f'UPDATE {table} SET {column} = zeroblob(?) WHERE rowid = ?;', (size, row))
+            blob = connection.blobopen(table, column, row, readonly=size is None)
+        except sqlite3.Error as error:
+            self._logger.exception(error)
+            connection.close()
+            raise
+
+        return BlobStream(connection, blob, readonly=size is None)
+
+    def backup(self, target: str, *, pages: int = 256, sleep: float = 0.005, progress: 'BackupProgress | None' = None) -> None:
+        '''
+        Copy the database to `target` file (or URI) while it is in use, with the SQLite online backup API.
+        The copy is consistent: it is restarted if the database is changed during the copy.
+
+        Args:
+            `target`: Backup filename. An existing file is overwritten.
+            `pages`: Pages copied per step, -1 copies everything in one step (the fastest, but blocks writers longer).
+            `sleep`: Pause between steps in seconds, so the copy doesn't starve other connections.
+            `progress`: Function called after every step with the numbers of copied and total pages.
+        '''
+        from .sqlite_backup import copy_database
+
+        self._logger.info(f'Backup of "{self._get_database_filename()}" to "{target}"')
+        with closing(self._connect(self._get_database_filename())) as source, closing(self._connect_target(target)) as connection:
+            copy_database(source, connection, pages=pages, sleep=sleep, progress=progress)
+
+    def restore(self, source: str, *, pages: int = -1, sleep: float = 0.0, progress: 'BackupProgress | None' = None) -> None:
+        '''
+        Replace the database content with a backup made by `backup` (or any SQLite database file).
+        Arguments are the same as in `backup`. Clear `QueryCache` objects of the database after restore.
+        '''
+        from .sqlite_backup import copy_database
+
+        if not source.startswith('file:') and not os.path.exists(source):
+            raise FileNotFoundError(f'Backup file "{source}" not found.')
+
+        self._logger.info(f'Restore of "{self._get_database_filename()}" from "{source}"')
+        with closing(self._connect_target(source)) as connection, closing(self._connect(self._get_database_filename())) as target:
+            copy_database(connection, target, pages=pages, sleep=sleep, progress=progress)
+
+    def snapshot(self, *, pages: int = -1, sleep: float = 0.0, progress: 'BackupProgress | None' = None) -> 'SQLiteSnapshot':
+        '''
+        Copy the database to memory and return `SQLiteSnapshot`: executor of the copy with the same `native_types`.
+
+        Usage:
+        ```
+        with executor.snapshot() as snapshot:
+            report = BaseDBRequest[Order](Order, 'orders', fields, key_fields, executor=snapshot).load_all(Order())
+        ```
+        '''
+        from .sqlite_backup import SQLiteSnapshot
+
+        with closing(self._connect(self._get_database_filename())) as source:
+            return SQLiteSnapshot(source, pages=pages, sleep=sleep, progress=progress, native_types=self._native_types, timeout=self._timeout)
+
+    def _get_read_snapshot_key(self) -> tuple[str, bool]:
+        return self._get_database_filename(), bool(self._native_types)
+
+    def _get_read_snapshot(self, sql_request: ISQLRequest) -> _ReadSnapshot | None:
+        snapshots = _read_snapshots.get()
+        if not snapshots or not isinstance(sql_request, SQLSelect):
+            return None
+        return snapshots.get(self._get_read_snapshot_key())
+
+    def _read_in_snapshot(self, snapshot: _ReadSnapshot, sql_request: ISQLRequest) -> list[tuple[Any]]:
+        self._begin_activity()
+        try:
+            # The scope may be shared with threads that copy the context (e.g. `asyncio.to_thread`)
+            with snapshot.lock:
+                return self._execute(snapshot.connection, sql_request, commit=False)
+        finally:
+            self._end_activity()
+
+    def _execute(self, connection: sqlite3.Connection, sql_request: ISQLRequest, *, commit: bool = True) -> list[tuple[Any]]:
+        '''Run the request on the open connection with time limits, commit it (or roll back on error) if `commit` is set.'''
         response: list[Any] = []
+        deadline, token = get_limits(self._timeout)
+        interruptions: list[type[Exception]] = []
+        if deadline is not None or token is not None:
+            # The progress handler is not called by short statements, so limits are checked before them too
+            if self._check_limits(deadline, token, interruptions):
+                raise self._get_interruption(sql_request, interruptions[0])
+            connection.set_progress_handler(partial(self._check_limits, deadline, token, interruptions), PROGRESS_INSTRUCTIONS)
 
         try:
-            connection = sqlite3.connect(database_filename)
             cursor = connection.cursor()
 
             request = sql_request.get_request()
             request_log = '\n'.join(str(line) for line in request)
             self._logger.debug(f'Running request:\n{request_log}')
             
-            if isinstance(sql_request, SQLFile):
+            if isinstance(sql_request, SQLScript):
                 cursor.executescript(request[0])
             else:
                 cursor.execute(*request)
-            
-            
-            if request[0].split()[0].upper() == 'SELECT':
+
+            # Any statement with result columns (SELECT, PRAGMA, EXPLAIN, ... RETURNING) returns rows
+            if cursor.description is not None:
                 response = cursor.fetchall()
             
-            connection.commit()
+            if commit:
+                connection.commit()
 
             cursor.close()
 
         except sqlite3.Error as error:
+            if commit and connection.in_transaction:
+                connection.rollback()
+            if interruptions:
+                raise self._get_interruption(sql_request, interruptions[0]) from error
             self._logger.exception(error)
             raise
 
         finally:
-            if connection is not None:
-                self._logger.debug(f'Lines changed: {connection.total_changes}')
-                connection.close()
+            if deadline is not None or token is not None:
+                connection.set_progress_handler(None, 0)
         
         return response
-        
+
+    def _get_interruption(self, sql_request: ISQLRequest, interruption: type[Exception]) -> Exception:
+        message = 'Request timed out' if interruption is QueryTimeoutError else 'Request cancelled'
+        self._logger.warning(f'{message}: {sql_request.get_request()[0]}')
+        return interruption(message)
+
+    @staticmethod
+    def _check_limits(
+            deadline: float | None,
+            token: 'CancellationToken | None',
+            interruptions: list[type[Exception]],
+        ) -> int:
+        # Progress handler: non-zero result interrupts the running statement
+        if token is not None and token.cancelled:
+            interruptions.append(QueryCancelledError)
+            return 1
+        if deadline is not None and time.monotonic() > deadline:
+            interruptions.append(QueryTimeoutError)
+            return 1
+        return 0
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Executors are pickled for worker processes, where activity of this process is not relevant
+        state = self.__dict__.copy()
+        del state['_activity_lock']
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._activity_lock = threading.Lock()
+        self._active_requests = 0
+
+    def _begin_activity(self) -> None:
+        with self._activity_lock:
+            self._active_requests += 1
+
+    def _end_activity(self) -> None:
+        with self._activity_lock:
+            self._active_requests -= 1
+            self._last_activity = time.monotonic()
+
+    def _touch(self) -> None:
+        with self._activity_lock:
+            self._last_activity = time.monotonic()
+
+    def _get_database_filename(self) -> str:
+        return config.DATABASE_FILENAME if self._database_filename is None else self._database_filename
+
+    @staticmethod
+    def _connect_target(database_filename: str) -> sqlite3.Connection:
+        return sqlite3.connect(database_filename, uri=database_filename.startswith('file:'))
+
+    def _connect(self, database_filename: str, *, check_same_thread: bool = True) -> sqlite3.Connection:
+        uri = database_filename.startswith('file:')
+        if not self._native_types:
+            return sqlite3.connect(database_filename, uri=uri, check_same_thread=check_same_thread)
+
+        self._register_native_types()
+        return sqlite3.connect(database_filename, uri=uri, check_same_thread=check_same_thread, detect_types=sqlite3.PARSE_DECLTYPES)
+
+    def _register_native_types(self) -> None:
+        # Executors may be unpickled in worker processes, so registration is checked on every connection
+        if all(_registered_converters.get(name) is converter for name, converter in self._native_types.items()):
+            return
+
+        self._check_adapters()
+        for name, converter in self._native_types.items():
+            if _registered_converters.get(name) is not converter:
+                sqlite3.register_adapter(converter.source_type, converter.to_database)
+                sqlite3.register_converter(name, partial(_convert_native_value, converter, getattr(converter, 'db_type')))
+                _registered_converters[name] = converter
+                _adapted_types[converter.source_type] = name
+
+    def _check_adapters(self) -> None:
+        '''Raise `TypeError` if a source type is already adapted by another native type or by other code of the process.'''
+        for name, converter in self._native_types.items():
+            adapted_name = _adapted_types.get(converter.source_type)
+            if adapted_name is None:
+                adapter = sqlite3.adapters.get((converter.source_type, sqlite3.PrepareProtocol))
+                # Default adapters of `sqlite3` (date, datetime) are deprecated and may be replaced
+                if adapter is not None and getattr(adapter, '__module__', None) != 'sqlite3.dbapi2':
+                    raise TypeError(f'{converter.source_type} of native type "{name}" already has a `sqlite3` adapter registered by other code.')
+            elif adapted_name != name:
+                raise TypeError(f'{converter.source_type} of native type "{name}" is already adapted for native type "{adapted_name}".')
+
+    @staticmethod
+    def _get_default_native_types() -> dict[str, ITypeConverter]:
+        from ..core.type_converters import (
+            BoolTypeConverter, ListTypeConverter, TupleTypeConverter, DictTypeConverter,
+            DatetimeTypeConverter, DateTypeConverter, TimedeltaTypeConverter,
+        )
+
+        return {
+            'BOOLEAN': BoolTypeConverter(),
+            'JSON_LIST': ListTypeConverter(),
+            'JSON_TUPLE': TupleTypeConverter(),
+            'JSON_DICT': DictTypeConverter(),
+            'DATETIME_TS': DatetimeTypeConverter[int](db_type=int),
+            'DATE_ORDINAL': DateTypeConverter(),
+            'TIMEDELTA_SECONDS': TimedeltaTypeConverter[int](db_type=int),
+        }
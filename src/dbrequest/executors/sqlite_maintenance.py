@@ -0,0 +1,242 @@
+__all__ = ['MaintenanceScheduler']
+
+import time
+import sqlite3
+import logging
+import threading
+from typing import Any, Callable
+from contextlib import closing
+
+from ..config import config
+from ..interfaces import IDatabaseExecutor
+from .sqlite_executor import SQLiteExecutor
+from .universal_executor import UniversalExecutor
+
+
+class _Task:
+    def __init__(self, name: str, period: float, run: Callable[[sqlite3.Connection, SQLiteExecutor], str]) -> None:
+        if period <= 0:
+            raise ValueError(f'Period of "{name}" must be positive, not {period}.')
+        self.name = name
+        self.period = period
+        self.run = run
+        self.due_time = time.monotonic() + period
+
+
+class MaintenanceScheduler:
+    '''
+    Opt-in background thread that runs SQLite maintenance for a long-running process.
+
+    Tasks (a period of None disables the task):
+    - "optimize": `PRAGMA optimize`, updates statistics of tables whose queries may get better plans.
+    - "analyze": full `ANALYZE`, bounded by `PRAGMA analysis_limit`.
+    - "checkpoint": `PRAGMA wal_checkpoint(PASSIVE)`, which never waits for readers or writers.
+    When all frames are copied, the WAL file is truncated (`truncate_wal`), so it doesn't grow without bound.
+    - "vacuum": `PRAGMA incremental_vacuum(vacuum_pages)`, returns free pages to the file system.
+    It needs `PRAGMA auto_vacuum = INCREMENTAL`, set before the tables are created (or followed by `VACUUM`).
+
+    A due task waits until the executor has been idle for `idle` seconds (see `SQLiteExecutor.idle_time`),
+    unless it is late by more than `max_delay` seconds. Checkpoint and vacuum run in up to `passes` short passes
+    and stop as soon as the executor is busy again, so the pauses they cause stay bounded.
+    Results are logged to the library logger (`config.LOGGER_NAME`).
+
+    Usage:
+    ```
+    with MaintenanceScheduler(executor, checkpoint_every=60.0):
+        serve_forever()
+    ```
+    '''
+    def __init__(
+            self,
+            executor: IDatabaseExecutor | None = None,
+            *,
+            poll_interval: float = 1.0,
+            idle: float = 2.0,
+            max_delay: float | None = None,
+            optimize_every: float | None = 3600.0,
+            analyze_every: float | None = None,
+            checkpoint_every: float | None = 300.0,
+            vacuum_every: float | None = 3600.0,
+            analysis_limit: int = 1000,
+            vacuum_pages: int = 256,
+            passes: int = 4,
+            pause: float = 0.05,
+            truncate_wal: bool = True,
+            busy_timeout: float = 0.1,
+        ) -> None:
+        if poll_interval <= 0:
+            raise ValueError(f'`poll_interval` must be positive, not {poll_interval}.')
+        if passes < 1 or vacuum_pages < 1:
+            raise ValueError('`passes` and `vacuum_pages` must be positive.')
+
+        self._logger = logging.getLogger(config.LOGGER_NAME)
+        self._executor = UniversalExecutor() if executor is None else executor
+        self._poll_interval = poll_interval
+        self._idle = idle
+        self._max_delay = max_delay
+        self._analysis_limit = analysis_limit
+        self._vacuum_pages = vacuum_pages
+        self._passes = passes
+        self._pause = pause
+        self._truncate_wal = truncate_wal
+        self._busy_timeout = busy_timeout
+
+        periods: dict[str, tuple[float | None, Callable[[sqlite3.Connection, SQLiteExecutor], str]]] = {
+            'optimize': (optimize_every, self._optimize),
+            'analyze': (analyze_every, self._analyze),
+            'vacuum': (vacuum_every, self._vacuum),
+            # The last one, to copy frames written by other tasks
+            'checkpoint': (checkpoint_every, self._checkpoint),
+        }
+        self._tasks = [_Task(name, period, run) for name, (period, run) in periods.items() if period is not None]
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        '''Start the daemon thread. It checks due tasks every `poll_interval` seconds.'''
+        if self.running:
+            raise RuntimeError('Maintenance scheduler is already running.')
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='dbrequest-maintenance', daemon=True)
+        self._thread.start()
+        self._logger.info(f'Maintenance scheduler started: {", ".join(task.name for task in self._tasks) or "no tasks"}')
+
+    def stop(self, timeout: float | None = None) -> None:
+        '''Stop the thread. A running task finishes its current pass first.'''
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+            self._logger.info('Maintenance scheduler stopped')
+
+    def run_pending(self, *, force: bool = False) -> dict[str, str]:
+        '''
+        Run due tasks in the calling thread and return their results by task name.
+        `force` runs all enabled tasks now, whether they are due and the executor is idle or not.
+        '''
+        with self._lock:
+            executor = self._get_executor()
+            now = time.monotonic()
+            is_idle = executor.idle_time >= self._idle
+            due_tasks = [
+                task for task in self._tasks
+                if force or (now >= task.due_time and (is_idle or self._is_late(task, now)))
+            ]
+            if not due_tasks:
+                return {}
+
+            results: dict[str, str] = {}
+            with self._connect(executor) as connection:
+                for task in due_tasks:
+                    if self._stop_event.is_set() and not force:
+                        break
+                    results[task.name] = self._run_task(task, connection, executor)
+
+            return results
+
+    def __enter__(self) -> 'MaintenanceScheduler':
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._poll_interval):
+            try:
+                self.run_pending()
+            except Exception as error:
+                # The thread must survive errors like a missing database file
+                self._logger.exception(error)
+
+    def _run_task(self, task: _Task, connection: sqlite3.Connection, executor: SQLiteExecutor) -> str:
+        start_time = time.perf_counter()
+        try:
+            result = task.run(connection, executor)
+        except sqlite3.Error as error:
+            result = f'failed: {error}'
+            self._logger.warning(f'Maintenance {task.name} failed: {error}')
+        else:
+            self._logger.info(f'Maintenance {task.name}: {result} ({(time.perf_counter() - start_time) * 1000:.1f} ms)')
+
+        task.due_time = time.monotonic() + task.period
+        return result
+
+    def _is_late(self, task: _Task, now: float) -> bool:
+        return self._max_delay is not None and now - task.due_time >= self._max_delay
+
+    def _get_executor(self) -> SQLiteExecutor:
+        executor = self._executor
+        # The specific executor of `UniversalExecutor` depends on the library config
+        if isinstance(executor, UniversalExecutor):
+            executor = executor._executor
+        if not isinstance(executor, SQLiteExecutor):
+            raise TypeError(f'Maintenance needs `SQLiteExecutor`, not {type(executor).__name__}.')
+        return executor
+
+    def _connect(self, executor: SQLiteExecutor) -> 'closing[sqlite3.Connection]':
+        # Own connection: maintenance is not counted as executor activity
+        connection = executor._connect(executor._get_database_filename())
+        connection.isolation_level = None
+        connection.execute(f'PRAGMA busy_timeout = {int(self._busy_timeout * 1000)};')
+        return closing(connection)
+
+    def _can_continue(self, executor: SQLiteExecutor) -> bool:
+        if self._stop_event.is_set() or executor.idle_time < self._idle:
+            return False
+        if self._pause > 0:
+            time.sleep(self._pause)
+        return True
+
+    def _optimize(self, connection: sqlite3.Connection, executor: SQLiteExecutor) -> str:
+        connection.execute('PRAGMA optimize;').fetchall()
+        return 'done'
+
+    def _analyze(self, connection: sqlite3.Connection, executor: SQLiteExecutor) -> str:
+        connection.execute(f'PRAGMA analysis_limit = {int(self._analysis_limit)};')
+        connection.execute('ANALYZE;')
+        return f'done, analysis_limit {self._analysis_limit}'
+
+    def _checkpoint(self, connection: sqlite3.Connection, executor: SQLiteExecutor) -> str:
+        copied = log = 0
+        for index in range(self._passes):
+            busy, log, copied = connection.execute('PRAGMA wal_checkpoint(PASSIVE);').fetchone()
+            if log == -1:
+                return 'skipped, not in WAL mode'
+            # Frames still used by readers are copied by the next pass
+            if copied >= log or index + 1 == self._passes or not self._can_continue(executor):
+                break
+
+        if copied < log:
+            return f'{copied} of {log} frames copied'
+
+        if self._truncate_wal:
+            busy, _, _ = connection.execute('PRAGMA wal_checkpoint(TRUNCATE);').fetchone()
+            if not busy:
+                return f'{log} frames copied, WAL truncated'
+        return f'{log} frames copied'
+
+    def _vacuum(self, connection: sqlite3.Connection, executor: SQLiteExecutor) -> str:
+        if connection.execute('PRAGMA auto_vacuum;').fetchone()[0] != 2:
+            return 'skipped, auto_vacuum is not INCREMENTAL'
+
+        free_pages = connection.execute('PRAGMA freelist_count;').fetchone()[0]
+        initial_pages = free_pages
+        for _ in range(self._passes):
+            if free_pages == 0:
+                break
+            # Every page is freed by one step of the statement, so the rows are fetched
+            connection.execute(f'PRAGMA incremental_vacuum({self._vacuum_pages});').fetchall()
+            free_pages = connection.execute('PRAGMA freelist_count;').fetchone()[0]
+            if free_pages == 0 or not self._can_continue(executor):
+                break
+
+        return f'{initial_pages - free_pages} pages freed, {free_pages} left'
+
@@ -0,0 +1,242 @@
+__all__ = ['RoutingExecutor', 'read_your_writes']
+
+import os
+import time
+import queue
+import sqlite3
+import threading
+import itertools
+import contextvars
+from typing import Any, Iterator
+from contextlib import closing, contextmanager
+from urllib.parse import quote
+
+from ..interfaces import ISQLRequest, ITypeConverter, IDatabaseExecutor
+from ..sql import SQLSelect
+from .sqlite_executor import SQLiteExecutor
+
+
+class _WriteState:
+    def __init__(self) -> None:
+        self.written = False
+
+_write_state: contextvars.ContextVar[_WriteState | None] = contextvars.ContextVar('dbrequest_write_state', default=None)
+
+
+@contextmanager
+def read_your_writes() -> Iterator[None]:
+    '''
+    Scope (the current thread or asyncio task) where reads of `RoutingExecutor` follow a write of the scope
+    to the read-write connection, so they see it even if replicas are not synced yet.
+    Reads before the first write of the scope still use read-only connections.
+    '''
+    reset_token = _write_state.set(_WriteState())
+    try:
+        yield
+    finally:
+        _write_state.reset(reset_token)
+
+def get_read_only_uri(database_filename: str) -> str:
+    if database_filename.startswith('file:'):
+        separator = '&' if '?' in database_filename else '?'
+        return f'{database_filename}{separator}mode=ro'
+    return f'file:{quote(os.path.abspath(database_filename))}?mode=ro'
+
+
+class RoutingExecutor(SQLiteExecutor):
+    '''
+    `SQLiteExecutor` that routes reads (`SQLSelect`) and writes (all other requests) to different connections.
+
+    - Writes run one at a time on a single persistent read-write connection.
+    - Reads run on a pool of up to `readers` persistent read-only (`mode=ro`) connections of the database,
+    so threads read in parallel and don't pay connection setup. With `journal_mode=WAL` (set on the database
+    by default, see `wal`) readers and the writer don't block each other.
+    - With `replicas`, reads go to these database files in turn instead. They are copies made by `sync_replicas`
+    with the online backup API, e.g. on other disks. With `max_lag`, a read syncs replicas first if they missed
+    writes for longer than `max_lag` seconds; otherwise call `sync_replicas` on your schedule.
+    The first read syncs replicas, if they were not synced yet.
+
+    Reads that must see the latest writes: use `read_your_writes` scope (per call or transaction),
+    or pass `primary` view as the executor of a request object (all its requests use the read-write connection).
+
+    Connections are opened on first use with the database filename resolved at that moment, `close` closes them.
+    Other methods (`open_blob`, `backup`, ...) use their own connections as in `SQLiteExecutor`.
+    '''
+    def __init__(
+            self,
+            database_filename: str | None = None,
+            *,
+            readers: int = 4,
+            replicas: tuple[str, ...] = (),
+            max_lag: float | None = None,
+            wal: bool = True,
+            native_types: bool | dict[str, ITypeConverter] = False,
+            timeout: float | None = None,
+        ) -> None:
+        super().__init__(database_filename, native_types=native_types, timeout=timeout)
+        if readers < 1:
+            raise ValueError(f'`readers` must be positive, not {readers}.')
+
+        self._replicas = replicas
+        self._max_lag = max_lag
+        self._wal = wal
+
+        self._write_lock = threading.RLock()
+        self._writer: sqlite3.Connection | None = None
+        self._last_write_time: float | None = None
+        self._last_sync_time: float | None = None
+
+        self._created_targets: set[str] = set()
+        self._readers = threading.BoundedSemaphore(readers)
+        self._pools_lock = threading.Lock()
+        self._pools: dict[str, queue.LifoQueue[sqlite3.Connection]] = {}
+        self._replica_cycle = itertools.cycle(replicas) if replicas else None
+
+    @property
+    def primary(self) -> IDatabaseExecutor:
+        '''Executor view that runs all requests, reads too, on the read-write connection.'''
+        return _PrimaryView(self)
+
+    def start(self, sql_request: ISQLRequest) -> list[tuple[Any]]:
+        if not isinstance(sql_request, ISQLRequest):
+            raise TypeError(type(sql_request))
+
+        snapshot = self._get_read_snapshot(sql_request)
+        if snapshot is not None:
+            return self._read_in_snapshot(snapshot, sql_request)
+
+        write_state = _write_state.get()
+        if isinstance(sql_request, SQLSelect) and (write_state is None or not write_state.written):
+            return self._read(sql_request)
+
+        if write_state is not None and not isinstance(sql_request, SQLSelect):
+            write_state.written = True
+        return self._run_on_writer(sql_request)
+
+    def sync_replicas(self, *, pages: int = -1, sleep: float = 0.0) -> None:
+        '''Copy the database to every replica file. Writes wait for the copy, reads of replicas continue.'''
+        from .sqlite_backup import copy_database
+
+        with self._write_lock:
+            writer = self._get_writer()
+            for replica in self._replicas:
+                self._logger.info(f'Sync of replica "{replica}"')
+                with closing(self._connect_target(replica)) as target:
+                    copy_database(writer, target, pages=pages, sleep=sleep)
+            self._last_sync_time = time.monotonic()
+            self._last_write_time = None
+
+    def close(self) -> None:
+        '''Close open connections. Next requests open them again.'''
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+        with self._pools_lock:
+            for pool in self._pools.values():
+                while not pool.empty():
+                    pool.get_nowait().close()
+            self._pools.clear()
+
+    def __enter__(self) -> 'RoutingExecutor':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        raise TypeError('`RoutingExecutor` keeps open connections, use `SQLiteExecutor` for worker processes.')
+
+    def _run_on_writer(self, sql_request: ISQLRequest) -> list[tuple[Any]]:
+        self._begin_activity()
+        try:
+            with self._write_lock:
+                response = self._execute(self._get_writer(), sql_request)
+                if not isinstance(sql_request, SQLSelect):
+                    self._last_write_time = time.monotonic()
+                return response
+        finally:
+            self._end_activity()
+
+    def _read(self, sql_request: ISQLRequest) -> list[tuple[Any]]:
+        target = self._get_database_filename()
+        if self._replica_cycle is not None:
+            self._sync_lagging_replicas()
+            target = next(self._replica_cycle)
+
+        self._begin_activity()
+        self._readers.acquire()
+        try:
+            pool = self._get_pool(target)
+            try:
+                connection = pool.get_nowait()
+            except queue.Empty:
+                self._create_database(target)
+                connection = self._connect(get_read_only_uri(target), check_same_thread=False)
+            try:
+                return self._execute(connection, sql_request)
+            finally:
+                pool.put(connection)
+        finally:
+            self._readers.release()
+            self._end_activity()
+
+    def _get_writer(self) -> sqlite3.Connection:
+        # Called under the write lock
+        if self._writer is None:
+            self._writer = self._connect(self._get_database_filename(), check_same_thread=False)
+            if self._wal:
+                self._writer.execute('PRAGMA journal_mode = WAL;')
+        return self._writer
+
+    def _create_database(self, target: str) -> None:
+        # Read-only connections can not create the file, so the writer creates it before the first read
+        if target in self._created_targets:
+            return
+        with self._write_lock:
+            if target == self._get_database_filename():
+                self._get_writer()
+            self._created_targets.add(target)
+
+    def _get_pool(self, target: str) -> 'queue.LifoQueue[sqlite3.Connection]':
+        with self._pools_lock:
+            pool = self._pools.get(target)
+            if pool is None:
+                pool = self._pools[target] = queue.LifoQueue()
+            return pool
+
+    def _sync_lagging_replicas(self) -> None:
+        # Replicas are created by the first read
+        if self._last_sync_time is None:
+            self.sync_replicas()
+        elif self._max_lag is not None and self._last_write_time is not None and time.monotonic() - self._last_sync_time >= self._max_lag:
+            self.sync_replicas()
+
+
+class _PrimaryView(IDatabaseExecutor):
+    '''`RoutingExecutor` that runs all requests on the read-write connection, see `RoutingExecutor.primary`.'''
+    def __init__(self, executor: RoutingExecutor) -> None:
+        self._executor = executor
+
+    @property
+    def supported_types(self) -> tuple[type, ...]:
+        return self._executor.supported_types
+
+    @property
+    def default_type_converters(self) -> tuple[ITypeConverter, ...]:
+        return self._executor.default_type_converters
+
+    @property
+    def internal_row_id_name(self) -> str | None:
+        return self._executor.internal_row_id_name
+
+    def start(self, sql_request: ISQLRequest) -> list[tuple[Any]]:
+        if not isinstance(sql_request, ISQLRequest):
+            raise TypeError(type(sql_request))
+        return self._executor._run_on_writer(sql_request)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._executor, name)
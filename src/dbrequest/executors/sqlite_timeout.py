@@ -0,0 +1,101 @@
+__all__ = ['CancellationToken', 'query_timeout', 'cancellation', 'run_async']
+
+import time
+import threading
+import contextvars
+from typing import Any, Callable, Iterator, TypeVar
+from contextlib import contextmanager
+
+
+# The progress handler is called every N virtual machine instructions of SQLite
+PROGRESS_INSTRUCTIONS = 1000
+
+RESULT = TypeVar('RESULT')
+
+
+class CancellationToken:
+    '''
+    Flag that stops running and future requests of `cancellation` scopes it is set to.
+    `cancel` may be called from any thread.
+    '''
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+
+# Timeout of `query_timeout` scope is wrapped in a tuple, so `query_timeout(None)` differs from no scope
+_timeout: contextvars.ContextVar[tuple[float | None] | None] = contextvars.ContextVar('dbrequest_query_timeout', default=None)
+_token: contextvars.ContextVar[CancellationToken | None] = contextvars.ContextVar('dbrequest_cancellation_token', default=None)
+
+
+@contextmanager
+def query_timeout(seconds: float | None) -> Iterator[None]:
+    '''
+    Time budget of every request of `SQLiteExecutor` in the scope (the current thread or asyncio task).
+    It overrides `timeout` of the executor, `None` disables it. A request over the budget raises `QueryTimeoutError`.
+
+    Usage:
+    ```
+    with query_timeout(0.5):
+        users.load_all(User())
+    ```
+    '''
+    if seconds is not None and seconds <= 0:
+        raise ValueError(f'Timeout must be positive, not {seconds}.')
+
+    reset_token = _timeout.set((seconds, ))
+    try:
+        yield
+    finally:
+        _timeout.reset(reset_token)
+
+@contextmanager
+def cancellation(token: CancellationToken) -> Iterator[CancellationToken]:
+    '''Requests of `SQLiteExecutor` in the scope raise `QueryCancelledError` when `token` is cancelled.'''
+    reset_token = _token.set(token)
+    try:
+        yield token
+    finally:
+        _token.reset(reset_token)
+
+def get_limits(executor_timeout: float | None) -> tuple[float | None, CancellationToken | None]:
+    '''Deadline (`time.monotonic`) and cancellation token of a request started now in the current context.'''
+    scope = _timeout.get()
+    timeout = executor_timeout if scope is None else scope[0]
+
+    return (None if timeout is None else time.monotonic() + timeout), _token.get()
+
+async def run_async(function: Callable[..., RESULT], *args: Any, timeout: float | None = None, **kwargs: Any) -> RESULT:
+    '''
+    Run blocking database code (e.g. `users.load_all`) in a thread for asyncio callers.
+    If the awaiting task is cancelled (or `asyncio.wait_for` gives up), running SQLite requests are interrupted,
+    so the abandoned call stops consuming CPU. `timeout` is set by `query_timeout` for requests of the call.
+
+    Usage:
+    ```
+    users_list = await run_async(users.load_all, User(), timeout=1.0)
+    ```
+    '''
+    import asyncio
+
+    token = CancellationToken()
+
+    def run() -> RESULT:
+        with cancellation(token):
+            if timeout is None:
+                return function(*args, **kwargs)
+            with query_timeout(timeout):
+                return function(*args, **kwargs)
+
+    try:
+        # `to_thread` copies the context, so outer scopes of the task apply too
+        return await asyncio.to_thread(run)
+    except asyncio.CancelledError:
+        token.cancel()
+        raise
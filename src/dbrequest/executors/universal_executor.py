@@ -9,18 +9,25 @@ from .sqlite_executor import SQLiteExecutor
 class UniversalExecutor(IDatabaseExecutor):
     '''`IDatabaseExecutor` implementation with `IDatabaseExecutor` factory depends on global library config.'''
     def __init__(self, database_filename: str | None = None) -> None:
-        self._EXECUTORS: dict[config.Executor, IDatabaseExecutor] = {
-            'sqlite': SQLiteExecutor(database_filename),
+        self._EXECUTORS: dict[config.Executor, type[IDatabaseExecutor]] = {
+            'sqlite': SQLiteExecutor,
         }
-        self._executor: IDatabaseExecutor
-   
-        if isinstance(config.EXECUTOR, IDatabaseExecutor):
-            self._executor = config.EXECUTOR
-        else:
-            executor = self._EXECUTORS.get(config.EXECUTOR, None)
-            if executor is None:
-                raise FactoryError(f'Unknown executor "{config.EXECUTOR}"')
-            self._executor = executor
+        self._database_filename = database_filename
+        self._lazy_executor: IDatabaseExecutor | None = None
+
+    @property
+    def _executor(self) -> IDatabaseExecutor:
+        '''Specific executor is resolved from the library config on first use.'''
+        if self._lazy_executor is None:
+            if isinstance(config.EXECUTOR, IDatabaseExecutor):
+                self._lazy_executor = config.EXECUTOR
+            else:
+                executor_type = self._EXECUTORS.get(config.EXECUTOR, None)
+                if executor_type is None:
+                    raise FactoryError(f'Unknown executor "{config.EXECUTOR}"')
+                self._lazy_executor = executor_type(self._database_filename)
+
+        return self._lazy_executor
 
     @property
     def supported_types(self) -> tuple[type, ...]:
@@ -36,5 +43,9 @@ class UniversalExecutor(IDatabaseExecutor):
 
     def start(self, sql_request: ISQLRequest) -> list[tuple[Any]]:
         return self._executor.start(sql_request)
-    
-    
\ No newline at end of file
+
+    def __getattr__(self, name: str) -> Any:
+        '''Extra features of the specific executor (e.g. `SQLiteExecutor.open_blob`) are available too.'''
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._executor, name)
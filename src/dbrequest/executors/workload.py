@@ -0,0 +1,263 @@
+__all__ = ['RecordingExecutor', 'TraceRecord', 'ReplayReport', 'read_trace', 'replay_trace']
+
+import io
+import math
+import gzip
+import json
+import time
+import base64
+import logging
+import threading
+from typing import Any, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+from ..config import config
+from ..interfaces import ITypeConverter, ISQLRequest, IDatabaseExecutor
+from ..sql import SQLCustom, SQLScript
+
+
+# Trace file is JSON lines (gzip-compressed if the filename ends with ".gz").
+# Every line: [start offset in seconds, duration in seconds, thread id, kind, SQL, values, is error]
+# Kinds: "q" - single statement, "s" - script.
+# Bytes values are tagged: {"__bytes__": base64}. Other values not supported by JSON (e.g. `datetime`
+# of `SQLiteExecutor` native types) are recorded as converted by the executor type converters,
+# requests with values without a converter are not recorded.
+
+class TraceRecord:
+    '''One `ISQLRequest` captured by `RecordingExecutor`.'''
+    def __init__(self, offset: float, duration: float, thread_id: int, is_script: bool, sql: str, values: tuple[Any, ...] | None, is_error: bool) -> None:
+        self.offset = offset
+        self.duration = duration
+        self.thread_id = thread_id
+        self.is_script = is_script
+        self.sql = sql
+        self.values = values
+        self.is_error = is_error
+
+    def to_sql_request(self) -> ISQLRequest:
+        if self.is_script:
+            return SQLScript(self.sql)
+        return SQLCustom(self.sql, self.values if self.values else None)
+
+    def to_line(self) -> str:
+        values = None if self.values is None else [_encode_value(value) for value in self.values]
+        data = [round(self.offset, 6), round(self.duration, 6), self.thread_id, 's' if self.is_script else 'q', self.sql, values, int(self.is_error)]
+        return json.dumps(data, separators=(',', ':')) + '\n'
+
+    @classmethod
+    def from_line(cls, line: str) -> 'TraceRecord':
+        offset, duration, thread_id, kind, sql, values, is_error = json.loads(line)
+        if values is not None:
+            values = tuple(_decode_value(value) for value in values)
+        return cls(offset, duration, thread_id, kind == 's', sql, values, bool(is_error))
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, bytes):
+        return {'__bytes__': base64.b64encode(value).decode('ascii')}
+    return value
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and len(value) == 1 and '__bytes__' in value:
+        return base64.b64decode(value['__bytes__'])
+    return value
+
+def _open_trace(filename: str, mode: str) -> io.TextIOBase:
+    if filename.endswith('.gz'):
+        return gzip.open(filename, mode + 't', encoding='utf-8')
+    return open(filename, mode, encoding='utf-8')
+
+
+class RecordingExecutor(IDatabaseExecutor):
+    '''
+    `IDatabaseExecutor` wrapper that writes every request passed to `start` with timing and thread id to a trace file.
+
+    Usage:
+    ```
+    recorder = RecordingExecutor(SQLiteExecutor(), 'workload.trace.gz')
+    dbrequest.init(executor=recorder)
+    ...
+    recorder.close()
+    ```
+    The trace can be replayed by `replay_trace`.
+    Errors of trace writing are logged and don't fail requests. Requests with values that have no type converter
+    of the executor (e.g. custom native types) are logged and not recorded: replay would send other values.
+    '''
+    def __init__(self, executor: IDatabaseExecutor, trace_filename: str) -> None:
+        self._logger = logging.getLogger(config.LOGGER_NAME)
+        self._executor = executor
+        self._trace_filename = trace_filename
+        self._lock = threading.Lock()
+        self._file: io.TextIOBase | None = None
+        self._start_time = time.perf_counter()
+
+    @property
+    def supported_types(self) -> tuple[type, ...]:
+        return self._executor.supported_types
+
+    @property
+    def default_type_converters(self) -> tuple[ITypeConverter, ...]:
+        return self._executor.default_type_converters
+
+    @property
+    def internal_row_id_name(self) -> str | None:
+        return self._executor.internal_row_id_name
+
+    def start(self, sql_request: ISQLRequest) -> list[tuple[Any]]:
+        start_time = time.perf_counter()
+        is_error = True
+        try:
+            response = self._executor.start(sql_request)
+            is_error = False
+        finally:
+            duration = time.perf_counter() - start_time
+            try:
+                self._write(sql_request, start_time - self._start_time, duration, is_error)
+            except Exception:
+                # The request is already done (and committed), its result is more important than the trace
+                self._logger.exception(f'Request is not written to trace "{self._trace_filename}"')
+
+        return response
+
+    def close(self) -> None:
+        '''Flush and close the trace file. Next request opens it again in append mode.'''
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> 'RecordingExecutor':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _write(self, sql_request: ISQLRequest, offset: float, duration: float, is_error: bool) -> None:
+        request = sql_request.get_request()
+        values = None
+        if len(request) > 1:
+            try:
+                values = tuple(self._to_database(value) for value in request[1])
+            except TypeError as error:
+                # A lossy value would replay other parameter types than the recorded workload
+                self._logger.warning(f'Request is not written to trace "{self._trace_filename}": {error}')
+                return
+        record = TraceRecord(offset, duration, threading.get_ident(), isinstance(sql_request, SQLScript), request[0], values, is_error)
+        line = record.to_line()
+
+        with self._lock:
+            if self._file is None:
+                self._file = _open_trace(self._trace_filename, 'a')
+            self._file.write(line)
+
+    def _to_database(self, value: Any) -> Any:
+        if value is None or type(value) in (str, int, float, bool, bytes):
+            return value
+
+        converters = self._executor.default_type_converters
+        # Exact type first: `datetime` is a subclass of `date`
+        for converter in converters:
+            if type(value) is converter.source_type:
+                return converter.to_database(value)
+        for converter in converters:
+            if isinstance(value, converter.source_type):
+                return converter.to_database(value)
+        raise TypeError(f'Value of type {type(value)} has no type converter of the executor.')
+
+
+def read_trace(trace_filename: str) -> Iterator[TraceRecord]:
+    with _open_trace(trace_filename, 'r') as file:
+        for line in file:
+            if line.strip():
+                yield TraceRecord.from_line(line)
+
+
+class ReplayReport:
+    '''Result of `replay_trace`. Latencies are in seconds.'''
+    def __init__(self, latencies: list[float], lags: list[float], errors: int, wall_time: float) -> None:
+        self.latencies = sorted(latencies)
+        self.lags = sorted(lags)
+        self.errors = errors
+        self.wall_time = wall_time
+
+    @property
+    def count(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        '''Requests per second.'''
+        return self.count / self.wall_time if self.wall_time > 0 else 0.0
+
+    def percentile(self, percent: float, *, lags: bool = False) -> float:
+        '''Nearest-rank percentile of request latency (or of start lag behind the schedule if `lags`).'''
+        values = self.lags if lags else self.latencies
+        if not values:
+            return 0.0
+        index = max(0, min(len(values) - 1, math.ceil(percent / 100 * len(values)) - 1))
+        return values[index]
+
+    def __str__(self) -> str:
+        lines = [
+            f'Requests:   {self.count} ({self.errors} errors) in {self.wall_time:.3f} s',
+            f'Throughput: {self.throughput:.1f} req/s',
+            'Latency:    ' + ', '.join(f'p{percent} {self.percentile(percent) * 1000:.3f} ms' for percent in (50, 90, 99)),
+            f'            max {self.latencies[-1] * 1000 if self.latencies else 0.0:.3f} ms',
+            'Start lag:  ' + ', '.join(f'p{percent} {self.percentile(percent, lags=True) * 1000:.3f} ms' for percent in (50, 99)),
+        ]
+        return '\n'.join(lines)
+
+
+def replay_trace(trace_filename: str, executor: IDatabaseExecutor, *, speed: float | None = 1.0, concurrency: int = 1) -> ReplayReport:
+    '''
+    Replay requests recorded by `RecordingExecutor`. Use a copy of the database: write requests are replayed too.
+
+    Args:
+        `trace_filename`: Trace file.
+        `executor`: Executor of the target database.
+        `speed`: 1.0 keeps the recorded pace, 2.0 is twice faster, `None` sends requests as fast as possible.
+        `concurrency`: Number of threads executing requests.
+    Returns:
+        `ReplayReport` with throughput and latency percentiles.
+    '''
+    if speed is not None and speed <= 0:
+        raise ValueError(f'`speed` must be positive or None, not {speed}.')
+    if concurrency <= 0:
+        raise ValueError(f'`concurrency` must be positive int, not {concurrency}.')
+
+    latencies: list[float] = []
+    lags: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+
+    def run(record: TraceRecord, scheduled_time: float) -> None:
+        nonlocal errors
+        start_time = time.perf_counter()
+        is_error = False
+        try:
+            executor.start(record.to_sql_request())
+        except Exception:
+            is_error = True
+        latency = time.perf_counter() - start_time
+
+        with lock:
+            latencies.append(latency)
+            lags.append(max(0.0, start_time - scheduled_time))
+            errors += is_error
+
+    replay_start = time.perf_counter()
+    first_offset: float | None = None
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for record in read_trace(trace_filename):
+            if first_offset is None:
+                first_offset = record.offset
+
+            if speed is None:
+                scheduled_time = time.perf_counter()
+            else:
+                scheduled_time = replay_start + (record.offset - first_offset) / speed
+                delay = scheduled_time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            pool.submit(run, record, scheduled_time)
+
+    return ReplayReport(latencies, lags, errors, time.perf_counter() - replay_start)
@@ -4,6 +4,7 @@ __all__ = [
     'IDatabaseExecutor',
     'IField',
     'IDBRequest',
+    'ICacheValidator',
     'SOURCE_TYPE',
     'DB_TYPE',
     'MODEL',
@@ -107,6 +108,30 @@ class IField(ABC, Generic[MODEL, FIELD_TYPE]):
     def set_value_to_object(self, object:MODEL) -> None:
         '''Write value to model object.'''
 
+    @property
+    def deferred(self) -> bool:
+        '''
+        Deferred column is not read by `load` and `load_all` and not written while the value is `None`.
+        It is used for large values read and written separately (e.g. `BlobField`).
+        '''
+        return False
+
+    @property
+    def lazy(self) -> bool:
+        '''
+        Lazy `list` or `dict` column is decoded by its `ITypeConverter` on first access to the value
+        (see `LazyDict` and `LazyList`), unmodified values are written back without encoding.
+        '''
+        return False
+
+    @property
+    def full_text(self) -> bool:
+        '''
+        Full-text indexed `str` column: it is added to the FTS5 table of `BaseDBRequest.create_full_text_index`
+        and searched by `BaseDBRequest.search`.
+        '''
+        return False
+
 
 class IDBRequest(ABC, Generic[MODEL]):
     '''
@@ -167,4 +192,11 @@ class IDBRequest(ABC, Generic[MODEL]):
         Returns:
             List of new model objects.
         '''
-    
+
+
+class ICacheValidator(ABC):
+    '''Detect database changes made bypassing the cache (e.g. by other processes) for `QueryCache`.'''
+
+    @abstractmethod
+    def get_stale_tables(self, tables: set[str]) -> set[str]:
+        '''Return tables from `tables` that may have been changed since the previous call.'''
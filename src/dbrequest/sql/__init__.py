@@ -1 +1 @@
-from .requests import SQLInsert, SQLSelect, SQLUpdate, SQLDelete, SQLCustom, SQLFile
+from .requests import SQLInsert, SQLSelect, SQLJoin, SQLUpdate, SQLDelete, SQLCreateIndex, SQLCustom, SQLScript, SQLFile
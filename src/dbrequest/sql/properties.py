@@ -1,3 +1,4 @@
+import re
 from typing import Any, Literal, TypeAlias
 
 from ..exceptions import SQLArgsError
@@ -5,6 +6,8 @@ from ..exceptions import SQLArgsError
 
 EMPTY_STRING_ERROR = '`{param}` parameter can not be empty string.'
 All: TypeAlias = Literal['*', 'all']
+JoinKind: TypeAlias = Literal['INNER', 'LEFT', 'CROSS']
+_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
 
 class TableProp:
     '''Component for database table name class property'''
@@ -16,6 +19,76 @@ class TableProp:
     def table(self) -> str:
         return self._table
 
+class AliasProp:
+    '''Component for table alias class property'''
+    def __init__(self, alias:str | None) -> None:
+        if alias is not None and not _IDENTIFIER.match(alias):
+            raise SQLArgsError(f'Invalid table alias "{alias}".')
+        self._alias = alias
+
+    @property
+    def alias(self) -> str | None:
+        return self._alias
+
+    @property
+    def _alias_str(self) -> str:
+        return f' AS {self._alias}' if self._alias is not None else ''
+
+class SQLJoin(TableProp, AliasProp):
+    '''
+    `JOIN` clause of `SQLSelect`.
+
+    Example:
+    ```
+    SQLSelect(
+        'orders', alias='o',
+        columns=('o.id', 'u.name AS user_name'),
+        joins=(SQLJoin('users', alias='u', on='o.user_id = u.id'), ),
+    )
+    ```
+    '''
+    def __init__(self, table:str, *, on:str | None = None, alias:str | None = None, kind:JoinKind = 'LEFT') -> None:
+        TableProp.__init__(self, table)
+        AliasProp.__init__(self, alias)
+
+        if kind not in ('INNER', 'LEFT', 'CROSS'):
+            raise SQLArgsError(f'Unknown join kind "{kind}".')
+        if on == '': raise SQLArgsError(EMPTY_STRING_ERROR.format(param='on'))
+        if on is None and kind != 'CROSS':
+            raise SQLArgsError(f'`on` condition is required for {kind} JOIN.')
+
+        self._on = on
+        self._kind = kind
+
+    @property
+    def on(self) -> str | None:
+        return self._on
+
+    @property
+    def kind(self) -> JoinKind:
+        return self._kind
+
+    @property
+    def _join_str(self) -> str:
+        on_str = f' ON {self._on}' if self._on is not None else ''
+        return f' {self._kind} JOIN {self._table}{self._alias_str}{on_str}'
+
+class JoinsProp:
+    '''Component for SQL `JOIN` clauses class property'''
+    def __init__(self, joins:tuple[SQLJoin, ...]) -> None:
+        for join in joins:
+            if not isinstance(join, SQLJoin):
+                raise SQLArgsError(f'Every join must be `SQLJoin`, not {type(join)}.')
+        self._joins = joins
+
+    @property
+    def joins(self) -> tuple[SQLJoin, ...]:
+        return self._joins
+
+    @property
+    def _joins_str(self) -> str:
+        return ''.join(join._join_str for join in self._joins)
+
 class ColumnsProp:
     '''Component for table column names class property'''
     def __init__(self, columns:tuple[str, ...] | All, *, allow_all:bool) -> None:
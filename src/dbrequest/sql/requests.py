@@ -1,10 +1,10 @@
-__all__ = ['SQLInsert', 'SQLSelect', 'SQLUpdate', 'SQLDelete', 'SQLCustom', 'SQLFile']
+__all__ = ['SQLInsert', 'SQLSelect', 'SQLJoin', 'SQLUpdate', 'SQLDelete', 'SQLCreateIndex', 'SQLCustom', 'SQLScript', 'SQLFile']
 
 from typing import Any, override
 
 from ..exceptions import SQLArgsError
 from ..interfaces import ISQLRequest
-from .properties import TableProp, ColumnsProp, ValuesProp, WhereProp, OrderByProp, LimitProp, All
+from .properties import _IDENTIFIER, TableProp, AliasProp, JoinsProp, SQLJoin, ColumnsProp, ValuesProp, WhereProp, OrderByProp, LimitProp, All
 
 
 class SQLInsert(ISQLRequest, TableProp, ColumnsProp, ValuesProp):
@@ -43,7 +43,7 @@ class SQLInsert(ISQLRequest, TableProp, ColumnsProp, ValuesProp):
 
         return request
     
-class SQLSelect(ISQLRequest, TableProp, ColumnsProp, WhereProp, OrderByProp, LimitProp):
+class SQLSelect(ISQLRequest, TableProp, AliasProp, JoinsProp, ColumnsProp, WhereProp, OrderByProp, LimitProp):
     def __init__(
             self,
             table: str,
@@ -54,8 +54,12 @@ class SQLSelect(ISQLRequest, TableProp, ColumnsProp, WhereProp, OrderByProp, Lim
             is_distinct: bool = False,
             order_by: str | None = None,
             limit: int | str | None = None,
+            alias: str | None = None,
+            joins: tuple[SQLJoin, ...] = (),
         ) -> None:
         TableProp.__init__(self, table)
+        AliasProp.__init__(self, alias)
+        JoinsProp.__init__(self, joins)
         ColumnsProp.__init__(self, columns, allow_all=True)
         WhereProp.__init__(self, where, where_values)
         OrderByProp.__init__(self, order_by)
@@ -70,7 +74,10 @@ class SQLSelect(ISQLRequest, TableProp, ColumnsProp, WhereProp, OrderByProp, Lim
         if self._is_distinct:
             distinct = ' DISTINCT'
 
-        request_str = f'SELECT{distinct} {self._columns_str} FROM {self._table}{self._where_str}{self._order_str}{self._limit_str};'
+        request_str = (
+            f'SELECT{distinct} {self._columns_str} FROM {self._table}{self._alias_str}{self._joins_str}'
+            f'{self._where_str}{self._order_str}{self._limit_str};'
+        )
 
         if self.where_values is None:
             request = (request_str, )
@@ -109,14 +116,28 @@ class SQLUpdate(ISQLRequest, TableProp, ColumnsProp, ValuesProp, WhereProp):
         return request
 
 class SQLDelete(ISQLRequest, TableProp, WhereProp):
-    def __init__(self, table:str, where:str | None = None, where_values: tuple[Any, ...] | None = None) -> None:
+    '''`DELETE`. `returning` columns of deleted rows are returned by the executor (`RETURNING`, SQLite 3.35+).'''
+    def __init__(
+            self,
+            table:str,
+            where:str | None = None,
+            where_values: tuple[Any, ...] | None = None,
+            *,
+            returning: tuple[str, ...] = (),
+        ) -> None:
         TableProp.__init__(self, table)
         WhereProp.__init__(self, where, where_values)
 
+        for column in returning:
+            if not _IDENTIFIER.match(column):
+                raise SQLArgsError(f'Invalid column name "{column}" in `returning`.')
+        self._returning = returning
+
     @override
     def get_request(self) -> tuple[str, tuple[Any]] | tuple[str]:
         request: tuple[str, tuple[Any]] | tuple[str]
-        request_str = f'DELETE FROM {self._table}{self._where_str};'
+        returning_str = f' RETURNING {", ".join(self._returning)}' if self._returning else ''
+        request_str = f'DELETE FROM {self._table}{self._where_str}{returning_str};'
 
         if self.where_values is None:
             request = (request_str, )
@@ -125,6 +146,45 @@ class SQLDelete(ISQLRequest, TableProp, WhereProp):
         
         return request
 
+class SQLCreateIndex(ISQLRequest, TableProp, ColumnsProp):
+    '''
+    `CREATE [UNIQUE] INDEX IF NOT EXISTS`.
+
+    `where` makes a partial index. SQLite doesn't allow parameters in index definitions,
+    so `where` is inserted as is: never build it from user input.
+    '''
+    def __init__(
+            self,
+            name: str,
+            table: str,
+            *,
+            columns: tuple[str, ...],
+            unique: bool = False,
+            where: str | None = None,
+        ) -> None:
+        if not _IDENTIFIER.match(name):
+            raise SQLArgsError(f'Invalid index name "{name}".')
+        if not columns:
+            raise SQLArgsError('`columns` of index can not be empty.')
+        if where == '':
+            raise SQLArgsError('`where` parameter can not be empty string.')
+
+        TableProp.__init__(self, table)
+        ColumnsProp.__init__(self, columns, allow_all=False)
+        self._name = name
+        self._unique = unique
+        self._where = where
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @override
+    def get_request(self) -> tuple[str]:
+        unique = ' UNIQUE' if self._unique else ''
+        where = f' WHERE {self._where}' if self._where is not None else ''
+        return (f'CREATE{unique} INDEX IF NOT EXISTS {self._name} ON {self._table} ({self._columns_str}){where};', )
+
 class SQLCustom(ISQLRequest):
     def __init__(self, request:str, values:tuple[Any, ...] | None) -> None:
         if request == '':
@@ -145,15 +205,25 @@ class SQLCustom(ISQLRequest):
 
         return request
 
-class SQLFile(ISQLRequest):
-    def __init__(self, file_name:str) -> None:
-        with open(file_name, 'r') as file:
-            self._request_str = file.read()  
+class SQLScript(ISQLRequest):
+    '''Several SQL statements separated by ";" executed as one script.'''
+    def __init__(self, script:str) -> None:
+        if ';' not in script:
+            raise SQLArgsError('`script` doesn\'t contains complete SQL request because ";" not in script.')
 
-        if ';' not in self._request_str:
-            raise SQLArgsError(f'`{file_name}` file doesn\'t contains complete SQL request because ";" not in file.')      
+        self._request_str = script
 
     @override                
     def get_request(self) -> tuple[str]:
         return (self._request_str, )
 
+class SQLFile(SQLScript):
+    def __init__(self, file_name:str) -> None:
+        with open(file_name, 'r') as file:
+            request_str = file.read()  
+
+        if ';' not in request_str:
+            raise SQLArgsError(f'`{file_name}` file doesn\'t contains complete SQL request because ";" not in file.')      
+
+        super().__init__(request_str)
+
@@ -0,0 +1,121 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
+
+import pickle
+import sqlite3
+import tempfile
+import threading
+from unittest import TestCase, main
+
+import dbrequest
+from dbrequest import BaseDBRequest, AutoField
+from dbrequest.config import config
+from dbrequest.executors import SQLiteExecutor, SQLiteSnapshot, UniversalExecutor
+from dbrequest.sql import SQLScript, SQLCustom
+
+
+class Note:
+    def __init__(self, id: int | None = None, text: str = '') -> None:
+        self.id = id
+        self.text = text
+
+ROWS = 2000
+
+class Test_Backup(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._directory.name, 'database.db')
+        self._backup_filename = os.path.join(self._directory.name, 'backup.db')
+        self._executor = SQLiteExecutor(self._filename)
+        self._executor.start(SQLScript(
+            'CREATE TABLE notes (id INTEGER PRIMARY KEY, text TEXT);'
+            f'WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < {ROWS}) '
+            "INSERT INTO notes (text) SELECT printf('note %d %s', i, hex(randomblob(100))) FROM n;"
+        ))
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _create_request(self, executor: SQLiteExecutor) -> BaseDBRequest[Note]:
+        id_field = AutoField[Note, int]('id', int, allowed_none=True)
+        return BaseDBRequest[Note](Note, 'notes', (id_field, AutoField[Note, str]('text', str)), (id_field, ), executor=executor)
+
+    def _count(self, filename: str) -> int:
+        with sqlite3.connect(filename) as connection:
+            return connection.execute('SELECT COUNT(*) FROM notes;').fetchone()[0]
+
+    def test__backup_progress(self) -> None:
+        steps: list[tuple[int, int]] = []
+        self._executor.backup(self._backup_filename, pages=10, sleep=0, progress=lambda copied, total: steps.append((copied, total)))
+
+        self.assertEqual(self._count(self._backup_filename), ROWS)
+        self.assertGreater(len(steps), 5)
+        self.assertEqual(steps[0][0], 10)
+        self.assertEqual(steps[-1][0], steps[-1][1])
+
+    def test__backup_under_writes(self) -> None:
+        stop = threading.Event()
+        notes = self._create_request(self._executor)
+
+        def write() -> None:
+            while not stop.is_set():
+                notes.save(Note(text='new'))
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            self._executor.backup(self._backup_filename, pages=5, sleep=0.001)
+        finally:
+            stop.set()
+            writer.join()
+
+        with sqlite3.connect(self._backup_filename) as connection:
+            self.assertEqual(connection.execute('PRAGMA integrity_check;').fetchone(), ('ok', ))
+            count, max_id = connection.execute('SELECT COUNT(*), MAX(id) FROM notes;').fetchone()
+        # Consistent state: no gaps between saved rows
+        self.assertEqual(count, max_id)
+        self.assertGreaterEqual(count, ROWS)
+
+    def test__restore(self) -> None:
+        self._executor.backup(self._backup_filename)
+        self._executor.start(SQLCustom('DELETE FROM notes WHERE id > 10;', None))
+        self.assertEqual(self._count(self._filename), 10)
+
+        self._executor.restore(self._backup_filename, pages=100)
+        self.assertEqual(self._count(self._filename), ROWS)
+
+        with self.assertRaises(FileNotFoundError):
+            self._executor.restore(os.path.join(self._directory.name, 'missing.db'))
+
+    def test__snapshot(self) -> None:
+        with self._executor.snapshot() as snapshot:
+            self.assertIsInstance(snapshot, SQLiteSnapshot)
+            self._executor.start(SQLCustom('DELETE FROM notes;', None))
+
+            notes = self._create_request(snapshot)
+            self.assertEqual(len(notes.load_all(Note())), ROWS)
+            # Changes of the snapshot are not written back
+            notes.save(Note(text='snapshot only'))
+            self.assertEqual(len(notes.load_all(Note())), ROWS + 1)
+            self.assertEqual(self._count(self._filename), 0)
+
+            with self.assertRaises(TypeError):
+                pickle.dumps(snapshot)
+
+        self.assertTrue(snapshot.closed)
+        with self.assertRaises(sqlite3.OperationalError):
+            snapshot.start(SQLCustom('SELECT COUNT(*) FROM notes;', None))
+
+    def test__configured_executor(self) -> None:
+        dbrequest.init(database_filename=self._filename)
+        try:
+            UniversalExecutor().backup(self._backup_filename)
+        finally:
+            dbrequest.init()
+
+        self.assertEqual(config.DATABASE_FILENAME, 'database.db')
+        self.assertEqual(self._count(self._backup_filename), ROWS)
+
+
+if __name__ == '__main__':
+    main()
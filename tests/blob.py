@@ -0,0 +1,77 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
+
+import io
+import tempfile
+from unittest import TestCase, main
+
+from dbrequest import BaseDBRequest, AutoField, BlobField
+from dbrequest.exceptions import NotFoundError
+from dbrequest.executors import SQLiteExecutor
+from dbrequest.sql import SQLScript
+
+
+class Attachment():
+    def __init__(self, id: int | None = None, name: str | None = None) -> None:
+        self.id = id
+        self.name = name
+        self.content: bytes | None = None
+
+class Test_Blob(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        executor = SQLiteExecutor(os.path.join(self._directory.name, 'database.db'))
+        executor.start(SQLScript('CREATE TABLE attachments (id INTEGER PRIMARY KEY, name TEXT, content BLOB);'))
+
+        id_field = AutoField[Attachment, int]('id', int, allowed_none=True)
+        self._content_field = BlobField[Attachment]('content')
+        self._database = BaseDBRequest[Attachment](
+            model_type = Attachment,
+            table_name = 'attachments',
+            fields = (id_field, AutoField[Attachment, str]('name', str), self._content_field),
+            key_fields = (id_field, ),
+            executor = executor,
+        )
+        self._data = bytes(range(256)) * 1000
+
+    def test__deferred_load(self) -> None:
+        attachment = Attachment(name='small')
+        attachment.content = b'abc'
+        self._database.save(attachment)
+
+        attachment = self._database.load_all(Attachment())[0]
+        self.assertEqual(attachment.name, 'small')
+        self.assertIsNone(attachment.content)
+
+        attachment.name = 'renamed'
+        self._database.update(attachment)
+
+        buffer = io.BytesIO()
+        self.assertEqual(self._database.read_blob(attachment, self._content_field, buffer), 3)
+        self.assertEqual(buffer.getvalue(), b'abc')
+
+    def test__stream_write_and_read(self) -> None:
+        attachment = Attachment(id=1, name='big')
+        self._database.save(attachment)
+
+        written = self._database.write_blob(attachment, self._content_field, io.BytesIO(self._data), chunk_size=4096)
+        self.assertEqual(written, len(self._data))
+
+        target = bytearray(len(self._data))
+        self._database.read_blob(attachment, self._content_field, target, chunk_size=10_000)
+        self.assertEqual(bytes(target), self._data)
+
+        self._database.write_blob(attachment, self._content_field, memoryview(b'xyz'))
+        with self._database.open_blob(attachment, self._content_field) as stream:
+            self.assertEqual(stream.read(), b'xyz')
+
+    def test__not_found(self) -> None:
+        with self.assertRaises(NotFoundError):
+            self._database.open_blob(Attachment(id=100), self._content_field)
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+
+if __name__ == '__main__':
+    main()
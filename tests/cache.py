@@ -0,0 +1,174 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
+
+import sqlite3
+import tempfile
+from unittest import TestCase, main
+from typing import Any
+
+from dbrequest import BaseDBRequest, AutoField, QueryCache
+from dbrequest.interfaces import IDatabaseExecutor, ISQLRequest, ITypeConverter
+from dbrequest.executors import SQLiteExecutor, SQLiteCacheValidator
+
+
+class User():
+    def __init__(self, id: int | None = None, username: str | None = None) -> None:
+        self.id = id
+        self.username = username
+
+class FakeExecutor(IDatabaseExecutor):
+    def __init__(self, database_filename: str | None = None) -> None:
+        self.rows: list[tuple[Any]] = [(1, 'one'), (2, 'two')]
+        self.selects = 0
+
+    def start(self, sql_request:ISQLRequest) -> list[tuple[Any]]:
+        if sql_request.get_request()[0].startswith('SELECT'):
+            self.selects += 1
+            return list(self.rows)
+        return []
+
+    @property
+    def supported_types(self) -> tuple[type, ...]:
+        return (int, str)
+
+    @property
+    def default_type_converters(self) -> tuple[ITypeConverter, ...]:
+        return ()
+
+    @property
+    def internal_row_id_name(self) -> str | None:
+        return 'rowid'
+
+class Test_QueryCache(TestCase):
+    def test__lru_eviction(self) -> None:
+        cache = QueryCache(max_entries=2, max_rows=3)
+
+        cache.put('t', 'a', [(1, )], version=cache.get_version('t'))
+        cache.put('t', 'b', [(2, )], version=cache.get_version('t'))
+        cache.get('t', 'a')
+        cache.put('t', 'c', [(3, )], version=cache.get_version('t'))
+
+        self.assertEqual(cache.get('t', 'b'), None)
+        self.assertEqual(cache.get('t', 'a'), [(1, )])
+
+        cache.put('t', 'd', [(4, ), (5, )], version=cache.get_version('t'))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get('t', 'c'), None)
+
+    def test__stale_version_rejected(self) -> None:
+        cache = QueryCache()
+        version = cache.get_version('t')
+        cache.invalidate('t')
+        cache.put('t', 'a', [(1, )], version=version)
+        self.assertEqual(cache.get('t', 'a'), None)
+
+        # Writes of other tables don't change the version
+        version = cache.get_version('t')
+        cache.invalidate('other')
+        cache.put('t', 'a', [(2, )], version=version)
+        self.assertEqual(cache.get('t', 'a'), [(2, )])
+
+        version = cache.get_version('t')
+        cache.clear()
+        cache.put('t', 'b', [(3, )], version=version)
+        self.assertEqual(cache.get('t', 'b'), None)
+
+class Test_BaseDBRequest_Cache(TestCase):
+    def setUp(self) -> None:
+        self._executor = FakeExecutor()
+        self._cache = QueryCache()
+        id_field = AutoField[User, int]('id', int, allowed_none=True)
+
+        self._database = BaseDBRequest[User](
+            model_type = User,
+            table_name = 'users',
+            fields = (id_field, AutoField[User, str]('username', str)),
+            key_fields = (id_field, ),
+            executor = self._executor,
+            cache = self._cache,
+        )
+
+    def test__hit_returns_new_objects(self) -> None:
+        users = self._database.load_all(User(), sort_by='id', limit=50, reverse=True)
+        users[0].username = 'corrupted'
+        same_users = self._database.load_all(User(), sort_by='id', limit=50, reverse=True)
+
+        self.assertEqual(self._executor.selects, 1)
+        self.assertEqual(same_users[0].username, 'one')
+        self.assertIsNot(users[0], same_users[0])
+
+        self._database.load_all(User(), sort_by='id', limit=10)
+        self.assertEqual(self._executor.selects, 2)
+
+    def test__write_invalidates(self) -> None:
+        self._database.load_all(User())
+        self._database.update(User(id=1, username='new'))
+        self._database.load_all(User())
+
+        self.assertEqual(self._executor.selects, 2)
+
+
+class Test_SQLiteCacheValidator(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._directory.name, 'database.db')
+        # Connection of "another process"
+        self._connection = sqlite3.connect(self._filename)
+        self._connection.executescript('''
+            CREATE TABLE users (id INTEGER PRIMARY KEY, username TEXT);
+            CREATE TABLE logs (id INTEGER PRIMARY KEY, username TEXT);
+            INSERT INTO users (username) VALUES ('one');
+        ''')
+
+    def _create_request(self, cache: QueryCache, table_name: str = 'users') -> BaseDBRequest[User]:
+        id_field = AutoField[User, int]('id', int, allowed_none=True)
+        return BaseDBRequest[User](
+            model_type = User,
+            table_name = table_name,
+            fields = (id_field, AutoField[User, str]('username', str)),
+            key_fields = (id_field, ),
+            executor = SQLiteExecutor(self._filename),
+            cache = cache,
+        )
+
+    def test__external_write_detected(self) -> None:
+        validator = SQLiteCacheValidator(self._filename)
+        cache = QueryCache(validator=validator)
+        users = self._create_request(cache)
+
+        self.assertEqual(len(users.load_all(User())), 1)
+        self.assertEqual(len(users.load_all(User())), 1)
+        self.assertEqual(cache.hits, 1)
+
+        self._connection.execute("INSERT INTO users (username) VALUES ('two');")
+        self._connection.commit()
+
+        self.assertEqual(len(users.load_all(User())), 2)
+        validator.close()
+
+    def test__tracked_tables(self) -> None:
+        validator = SQLiteCacheValidator(self._filename, tracked_tables=('users', 'logs'))
+        validator.install()
+        cache = QueryCache(validator=validator)
+        users = self._create_request(cache)
+
+        users.load_all(User())
+        users.load_all(User())
+        self._connection.execute("INSERT INTO logs (username) VALUES ('two');")
+        self._connection.commit()
+        users.load_all(User())
+
+        self.assertEqual(cache.hits, 2)
+
+        self._connection.execute("UPDATE users SET username = 'new';")
+        self._connection.commit()
+        self.assertEqual(users.load_all(User())[0].username, 'new')
+        validator.close()
+
+    def tearDown(self) -> None:
+        self._connection.close()
+        self._directory.cleanup()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
+
+import sqlite3
+import tempfile
+from typing import Any
+from datetime import datetime as Datetime, date as Date, timedelta as Timedelta
+from unittest import TestCase, main
+
+from dbrequest import BaseDBRequest, UniversalDBRequest, AutoField, Column, JsonIndex
+from dbrequest.exceptions import SchemaError, SQLArgsError
+from dbrequest.executors import SQLiteExecutor
+from dbrequest.interfaces import ISQLRequest
+from dbrequest.sql import SQLScript
+
+
+NOW = Datetime(2024, 6, 1, 12, 0, 0)
+
+class RecordingExecutor(SQLiteExecutor):
+    def __init__(self, database_filename: str) -> None:
+        super().__init__(database_filename)
+        self.requests: list[tuple[Any, ...]] = []
+
+    def start(self, sql_request: ISQLRequest) -> list[tuple[Any]]:
+        self.requests.append(sql_request.get_request())
+        return super().start(sql_request)
+
+class Event:
+    def __init__(self, id: int | None = None) -> None:
+        self.id = id
+        self.created: Datetime | None = None
+        self.day: Date | None = None
+        self.duration: Timedelta | None = None
+
+
+class Test_Conditions(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._directory.name, 'database.db')
+        self._executor = RecordingExecutor(self._filename)
+        self._executor.start(SQLScript(
+            'CREATE TABLE events (id INTEGER PRIMARY KEY, created INTEGER, day INTEGER, duration INTEGER);'
+            'CREATE INDEX events_created ON events (created);'
+        ))
+
+        self._id = AutoField[Event, int]('id', int, allowed_none=True)
+        self._created = AutoField[Event, Datetime]('created', Datetime, allowed_none=True)
+        fields = (
+            self._id, self._created,
+            AutoField[Event, Date]('day', Date, allowed_none=True),
+            AutoField[Event, Timedelta]('duration', Timedelta, allowed_none=True),
+        )
+        self._events = BaseDBRequest[Event](Event, 'events', fields, (self._id, ), executor=self._executor)
+
+        for hours in range(48):
+            event = Event()
+            event.created = NOW - Timedelta(hours=hours)
+            event.day = event.created.date()
+            event.duration = Timedelta(minutes=hours)
+            self._events.save(event)
+        # Row without values
+        self._events.save(Event())
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _load_ids(self, condition: Any, **kwargs: Any) -> list[int]:
+        ids = [event.id for event in self._events.load_all(Event(), where=condition, **kwargs)]
+        # Without `sort_by` rows come in order of the used index
+        return ids if 'sort_by' in kwargs else sorted(ids)
+
+    def test__datetime_range(self) -> None:
+        created = Column(self._created)
+        self.assertEqual(self._load_ids(created.within_last(Timedelta(hours=24), now=NOW)), list(range(1, 26)))
+        self.assertEqual(self._load_ids(created.between(NOW - Timedelta(hours=2), NOW)), [1, 2, 3])
+        self.assertEqual(self._load_ids(created > NOW - Timedelta(hours=2)), [1, 2])
+        self.assertEqual(self._load_ids(created == NOW), [1])
+        self.assertEqual(len(self._load_ids(created != NOW)), 47)
+
+    def test__bounds_are_converted(self) -> None:
+        self._executor.requests.clear()
+        self._load_ids(Column('created').between(NOW - Timedelta(hours=1), NOW))
+
+        sql, values = self._executor.requests[-1]
+        self.assertIn('WHERE created BETWEEN ? AND ?', sql)
+        self.assertEqual(values, (int((NOW - Timedelta(hours=1)).timestamp()), int(NOW.timestamp())))
+
+    def test__index_range_scan(self) -> None:
+        self._executor.requests.clear()
+        self._load_ids(Column('created').within_last(Timedelta(hours=3), now=NOW))
+        sql, values = self._executor.requests[-1]
+
+        with sqlite3.connect(self._filename) as connection:
+            plan = ' '.join(str(row[-1]) for row in connection.execute(f'EXPLAIN QUERY PLAN {sql}', values))
+        self.assertIn('USING INDEX events_created (created>?)', plan)
+
+    def test__date_and_timedelta(self) -> None:
+        day = Column('day')
+        self.assertEqual(len(self._load_ids(day == NOW.date())), 13)
+        self.assertEqual(len(self._load_ids(day.within_last(Timedelta(days=1), now=NOW.date()))), 37)
+        self.assertEqual(self._load_ids(Column('duration') <= Timedelta(minutes=1)), [1, 2])
+        self.assertEqual(self._load_ids(Column('duration').in_((Timedelta(minutes=3), Timedelta(minutes=5)))), [4, 6])
+
+    def test__within_last_now(self) -> None:
+        event = Event()
+        event.created = Datetime.now() - Timedelta(minutes=1)
+        self._events.save(event)
+        self.assertEqual(self._load_ids(Column('created').within_last(Timedelta(hours=1))), [50])
+
+        with self.assertRaises(SQLArgsError):
+            self._load_ids(Column('id').within_last(Timedelta(hours=1)))
+        with self.assertRaises(SQLArgsError):
+            Column('created').within_last(1)  # type: ignore[arg-type]
+
+    def test__combined(self) -> None:
+        created = Column('created')
+        recent = created.within_last(Timedelta(hours=4), now=NOW)
+        self.assertEqual(self._load_ids(recent & (Column('id') > 2)), [3, 4, 5])
+        self.assertEqual(self._load_ids(recent & ~(Column('id') > 2)), [1, 2])
+        self.assertEqual(self._load_ids((created == NOW) | (Column('id') == 48)), [1, 48])
+        self.assertEqual(self._load_ids(recent, sort_by='created', limit=2), [5, 4])
+        self.assertEqual(self._load_ids(recent, sort_by='created', reverse=True, limit=2), [1, 2])
+
+    def test__null(self) -> None:
+        self.assertEqual(self._load_ids(Column('created') == None), [49])
+        self.assertEqual(self._load_ids(Column('created').is_null()), [49])
+        self.assertEqual(len(self._load_ids(Column('created').is_null(False))), 48)
+        with self.assertRaises(SQLArgsError):
+            self._load_ids(Column('created').between(None, NOW))
+
+    def test__universal_request(self) -> None:
+        universal = UniversalDBRequest((self._events, ))
+        result = universal.load_all(Event(), where=Column('created') >= NOW)
+        self.assertEqual([event.id for event in result], [1])
+
+    def test__errors(self) -> None:
+        with self.assertRaises(SchemaError):
+            self._load_ids(Column('unknown') == 1)
+        with self.assertRaises(TypeError):
+            self._load_ids('created > 0')
+        with self.assertRaises(SQLArgsError):
+            Column('id').in_(())
+
+
+class Profile:
+    def __init__(self, id: int | None = None, settings: dict | None = None, tags: list | None = None) -> None:
+        self.id = id
+        self.settings = settings if settings is not None else {}
+        self.tags = tags if tags is not None else []
+
+class Test_JsonConditions(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._directory.name, 'database.db')
+        self._executor = RecordingExecutor(self._filename)
+        self._executor.start(SQLScript('CREATE TABLE profiles (id INTEGER PRIMARY KEY, settings TEXT, tags TEXT);'))
+
+        id_field = AutoField[Profile, int]('id', int, allowed_none=True)
+        self._fields = (id_field, AutoField[Profile, dict]('settings', dict), AutoField[Profile, list]('tags', list))
+        self._key_fields = (id_field, )
+        self._profiles = self._create_request()
+
+        self._profiles.save(Profile(settings={'lang': 'ru', 'theme': {'dark': True}, 'size': 12}, tags=['admin', 'dev']))
+        self._profiles.save(Profile(settings={'lang': 'en', 'theme': {'dark': False}, 'size': 14}, tags=['dev']))
+        self._profiles.save(Profile(settings={'my key': 'x', 'sizes': [1, 2]}, tags=[]))
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _create_request(self, json_indexes: tuple[JsonIndex, ...] = ()) -> BaseDBRequest[Profile]:
+        return BaseDBRequest[Profile](Profile, 'profiles', self._fields, self._key_fields, executor=self._executor, json_indexes=json_indexes)
+
+    def _load_ids(self, condition: Any, database: BaseDBRequest[Profile] | None = None) -> list[int]:
+        database = database if database is not None else self._profiles
+        return sorted(profile.id for profile in database.load_all(Profile(), where=condition))
+
+    def _get_plan(self) -> str:
+        sql, values = self._executor.requests[-1]
+        with sqlite3.connect(self._filename) as connection:
+            return ' '.join(str(row[-1]) for row in connection.execute(f'EXPLAIN QUERY PLAN {sql}', values))
+
+    def test__json_extract(self) -> None:
+        settings = Column('settings')
+        self.assertEqual(self._load_ids(settings['lang'] == 'ru'), [1])
+        self.assertEqual(self._executor.requests[-1][0], "SELECT id, settings, tags FROM profiles WHERE json_extract(settings, '$.lang') = ?;")
+
+        self.assertEqual(self._load_ids(settings['theme']['dark'] == True), [1])
+        self.assertEqual(self._load_ids(settings.json('theme.dark') == False), [2])
+        self.assertEqual(self._load_ids(settings['size'].between(10, 13)), [1])
+        self.assertEqual(self._load_ids(settings.json('$.size') > 12), [2])
+        self.assertEqual(self._load_ids(settings['lang'].in_(('en', 'de'))), [2])
+        self.assertEqual(self._load_ids(settings['lang'] == None), [3])
+        self.assertEqual(self._load_ids(settings['my key'] == 'x'), [3])
+        self.assertEqual(self._load_ids(settings['sizes'][1] == 2), [3])
+
+    def test__contains(self) -> None:
+        self.assertEqual(self._load_ids(Column('tags').contains('dev')), [1, 2])
+        self.assertEqual(self._load_ids(Column('tags').contains('admin') & (Column('settings')['lang'] == 'ru')), [1])
+        self.assertEqual(self._load_ids(Column('settings')['sizes'].contains(1)), [3])
+        self.assertEqual(self._load_ids(~Column('tags').contains('dev')), [3])
+
+    def test__generated_column_index(self) -> None:
+        profiles = self._create_request(json_indexes=(JsonIndex('settings', 'lang'), JsonIndex('settings', '$.theme.dark', column='dark')))
+        profiles.create_json_indexes()
+        profiles.create_json_indexes()
+
+        self.assertEqual(self._load_ids(Column('settings')['lang'] == 'en', profiles), [2])
+        self.assertIn('WHERE settings_lang = ?', self._executor.requests[-1][0])
+        self.assertIn('USING INDEX ix_profiles_settings_lang', self._get_plan())
+
+        self.assertEqual(self._load_ids(Column('settings')['theme']['dark'] == True, profiles), [1])
+        self.assertIn('USING INDEX ix_profiles_dark', self._get_plan())
+
+        # Generated columns are not read or written by requests
+        profiles.save(Profile(settings={'lang': 'de'}))
+        self.assertEqual(self._load_ids(Column('settings')['lang'] == 'de', profiles), [4])
+        self.assertEqual(self._load_ids(Column('settings')['lang'] == 'de'), [4])
+
+    def test__errors(self) -> None:
+        with self.assertRaises(SQLArgsError):
+            Column('settings').json("$.a') OR 1=1 --")
+        with self.assertRaises(SQLArgsError):
+            Column('settings')['a{}'] == 1
+        with self.assertRaises(SQLArgsError):
+            self._load_ids(Column('settings')['lang'] == ['ru'])
+        with self.assertRaises(SQLArgsError):
+            Column('settings')['created'].within_last(Timedelta(days=1))
+        with self.assertRaises(SchemaError):
+            self._create_request(json_indexes=(JsonIndex('unknown', 'lang'), ))
+        with self.assertRaises(SchemaError):
+            JsonIndex('settings', 'lang', column='bad name')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
+
+import time
+import logging
+import tempfile
+import threading
+from datetime import datetime as Datetime, timedelta as Timedelta
+from unittest import TestCase, main
+
+from dbrequest import BaseDBRequest, UniversalDBRequest, ShardedDBRequest, AutoField, Column, QueryCache, ExpiryPolicy, ExpiryPurger
+from dbrequest.config import config
+from dbrequest.exceptions import SchemaError, SQLArgsError
+from dbrequest.executors import SQLiteExecutor
+from dbrequest.sql import SQLScript, SQLDelete
+
+
+class Session:
+    def __init__(self, id: int | None = None, token: str = '', created: Datetime | None = None) -> None:
+        self.id = id
+        self.token = token
+        self.created = created
+
+
+class NoRowIdExecutor(SQLiteExecutor):
+    @property
+    def internal_row_id_name(self) -> None:
+        return None
+
+
+TABLE_SCRIPT = 'CREATE TABLE sessions (id INTEGER PRIMARY KEY, token TEXT, created INTEGER);'
+
+class Test_Expiry(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._executor = SQLiteExecutor(os.path.join(self._directory.name, 'database.db'))
+        self._executor.start(SQLScript(TABLE_SCRIPT))
+
+        self._id_field = AutoField[Session, int]('id', int, allowed_none=True)
+        self._fields = (self._id_field, AutoField[Session, str]('token', str), AutoField[Session, Datetime]('created', Datetime, allowed_none=True))
+        self._cache = QueryCache()
+        self._sessions = self._create_request(self._executor, cache=self._cache)
+
+        now = Datetime.now()
+        for index in range(250):
+            # Every fifth session is fresh
+            created = now - Timedelta(hours=1 if index % 5 == 0 else 48)
+            self._sessions.save(Session(token=f't{index}', created=created))
+        self._sessions.save(Session(token='no date'))
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _create_request(self, executor: SQLiteExecutor, **kwargs) -> BaseDBRequest[Session]:
+        return BaseDBRequest[Session](Session, 'sessions', self._fields, (self._id_field, ), executor=executor, **kwargs)
+
+    def test__delete_where_in_chunks(self) -> None:
+        self.assertEqual(len(self._sessions.load_all(Session())), 251)
+
+        steps: list[int] = []
+        deleted = self._sessions.delete_where(Session(), Column('created').older_than(Timedelta(days=1)), chunk_size=30, pause=0, progress=steps.append)
+        self.assertEqual(deleted, 200)
+        self.assertEqual(steps, [30, 60, 90, 120, 150, 180, 200])
+
+        # The cache is invalidated
+        self.assertEqual(len(self._sessions.load_all(Session())), 51)
+
+    def test__delete_where_at_once(self) -> None:
+        steps: list[int] = []
+        deleted = self._sessions.delete_where(Session(), Column('token').in_(('t1', 't2', 'x')), chunk_size=None, progress=steps.append)
+        self.assertEqual((deleted, steps), (2, [2]))
+        self.assertEqual(self._sessions.delete_where(Session(), Column('token') == 'x'), 0)
+
+        with self.assertRaises(TypeError):
+            self._sessions.delete_where(Session(), None)  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            self._sessions.delete_where(Session(), Column('token') == 'x', chunk_size=0)
+
+    def test__delete_where_by_key_field(self) -> None:
+        executor = NoRowIdExecutor(self._executor._database_filename)
+        sessions = self._create_request(executor)
+        self.assertEqual(sessions.delete_where(Session(), Column('created').older_than(Timedelta(days=1)), chunk_size=30, pause=0), 200)
+
+        composite = BaseDBRequest[Session](Session, 'sessions', self._fields, (self._id_field, self._fields[1]), executor=executor)
+        with self.assertRaises(SchemaError):
+            composite.delete_where(Session(), Column('token') == 't0', chunk_size=10)
+        self.assertEqual(composite.delete_where(Session(), Column('token') == 't0', chunk_size=None), 1)
+
+    def test__universal_request(self) -> None:
+        universal = UniversalDBRequest((self._sessions, ))
+        self.assertEqual(universal.delete_where(Session(), Column('token') == 't3', pause=0), 1)
+
+    def test__purge_expired(self) -> None:
+        sessions = self._create_request(self._executor, expiry=ExpiryPolicy('created', Timedelta(days=1), chunk_size=50, pause=0))
+        self.assertEqual(sessions.purge_expired(), 200)
+        self.assertEqual(sessions.purge_expired(), 0)
+        # Rows without date never expire
+        self.assertEqual(len(sessions.load_all(Session(), where=Column('created').is_null())), 1)
+
+        with self.assertRaises(SchemaError):
+            self._sessions.purge_expired()
+        with self.assertRaises(SchemaError):
+            self._create_request(self._executor, expiry=ExpiryPolicy('updated', Timedelta(days=1)))
+
+    def test__purger(self) -> None:
+        sessions = self._create_request(self._executor, expiry=ExpiryPolicy(self._fields[2], Timedelta(days=1), interval=3600.0, pause=0))
+        purger = ExpiryPurger(sessions)
+
+        with self.assertLogs(config.LOGGER_NAME, logging.INFO) as logs:
+            self.assertEqual(purger.run_pending(), 200)
+        self.assertIn('Expired Session rows deleted: 200', logs.output[0])
+        # The next purge is due after the interval
+        self.assertEqual(purger.run_pending(), 0)
+
+        with purger:
+            self.assertTrue(purger.running)
+        self.assertFalse(purger.running)
+
+        with self.assertRaises(ValueError):
+            ExpiryPurger(self._sessions)
+
+    def test__stop(self) -> None:
+        stop = threading.Event()
+        stop.set()
+        # One chunk is deleted
+        self.assertEqual(self._sessions.delete_where(Session(), Column('created').older_than(Timedelta(days=1)), chunk_size=30, stop=stop), 30)
+
+        sessions = self._create_request(self._executor, expiry=ExpiryPolicy('created', Timedelta(days=1), chunk_size=10, pause=1.0))
+        purger = ExpiryPurger(sessions, poll_interval=0.01)
+        purger.start()
+        deadline = time.monotonic() + 5.0
+        while len(sessions.load_all(Session())) == 221 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        start_time = time.monotonic()
+        purger.stop()
+        self.assertLess(time.monotonic() - start_time, 0.5)
+        self.assertFalse(purger.running)
+        self.assertGreater(len(sessions.load_all(Session())), 51)
+
+    def test__sharded_request(self) -> None:
+        executors = tuple(SQLiteExecutor(os.path.join(self._directory.name, f'shard_{index}.db')) for index in range(2))
+        for executor in executors:
+            executor.start(SQLScript(TABLE_SCRIPT))
+
+        sessions = ShardedDBRequest[Session](
+            Session, 'sessions', self._fields, (self._id_field, ),
+            shard_key=self._fields[1], executors=executors, expiry=ExpiryPolicy('created', Timedelta(days=1), pause=0),
+        )
+        for index in range(20):
+            sessions.save(Session(token=f't{index}', created=Datetime.now() - Timedelta(days=index % 2 * 2)))
+
+        self.assertEqual(sessions.purge_expired(), 10)
+        self.assertEqual(len(sessions.load_all(Session())), 10)
+
+    def test__sql_delete_returning(self) -> None:
+        request = SQLDelete('sessions', where='id = ?', where_values=(1, ), returning=('id', 'token'))
+        self.assertEqual(request.get_request(), ('DELETE FROM sessions WHERE id = ? RETURNING id, token;', (1, )))
+        self.assertEqual(self._executor.start(request), [(1, 't0')])
+
+        with self.assertRaises(SQLArgsError):
+            SQLDelete('sessions', returning=('id; DROP TABLE sessions', ))
+
+
+if __name__ == '__main__':
+    main()
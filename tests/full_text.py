@@ -0,0 +1,114 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
+
+import tempfile
+from unittest import TestCase, main
+
+from dbrequest import BaseDBRequest, AutoField, QueryCache
+from dbrequest.core.full_text import build_match_query
+from dbrequest.exceptions import SchemaError
+from dbrequest.executors import SQLiteExecutor
+from dbrequest.sql import SQLScript, SQLCustom
+
+
+class Article:
+    def __init__(self, id: int | None = None, title: str = '', body: str = '', views: int = 0) -> None:
+        self.id = id
+        self.title = title
+        self.body = body
+        self.views = views
+
+ARTICLES = (
+    ('SQLite full-text search', 'FTS5 is a virtual table module that provides full-text search.'),
+    ('Python databases', 'The sqlite3 module of Python works with SQLite databases.'),
+    ('Cooking', 'Search the fridge for eggs, then boil the eggs for ten minutes.'),
+)
+
+class Test_FullText(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._executor = SQLiteExecutor(os.path.join(self._directory.name, 'database.db'))
+        self._executor.start(SQLScript('CREATE TABLE articles (id INTEGER PRIMARY KEY, title TEXT, body TEXT, views INTEGER);'))
+
+        id_field = AutoField[Article, int]('id', int, allowed_none=True)
+        self._fields = (
+            id_field,
+            AutoField[Article, str]('title', str, full_text=True),
+            AutoField[Article, str]('body', str, full_text=True),
+            AutoField[Article, int]('views', int),
+        )
+        self._cache = QueryCache()
+        self._articles = BaseDBRequest[Article](Article, 'articles', self._fields, (id_field, ), executor=self._executor, cache=self._cache)
+
+        # Rows saved before the index is created are indexed by rebuild
+        self._articles.save(Article(title=ARTICLES[0][0], body=ARTICLES[0][1]))
+        self._articles.create_full_text_index(tokenize='porter unicode61')
+        for title, body in ARTICLES[1:]:
+            self._articles.save(Article(title=title, body=body))
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _search_ids(self, query: str, **kwargs) -> list[int]:
+        return [article.id for article in self._articles.search(Article(), query, **kwargs)]
+
+    def test__search(self) -> None:
+        self.assertEqual(sorted(self._search_ids('sqlite')), [1, 2])
+        self.assertEqual(self._search_ids('full-text search'), [1])
+        self.assertEqual(self._search_ids('database'), [2])
+        self.assertEqual(self._search_ids('databa*'), [2])
+        self.assertEqual(self._search_ids('unknown'), [])
+        self.assertEqual(self._search_ids('  '), [])
+
+        result = self._articles.search(Article(), 'eggs')
+        self.assertEqual((result[0].title, result[0].views), ('Cooking', 0))
+
+    def test__rank_and_limit(self) -> None:
+        # "search" is in the title and the body of the first article
+        self.assertEqual(self._search_ids('search'), [1, 3])
+        self.assertEqual(self._search_ids('search', limit=1), [1])
+
+    def test__syntax(self) -> None:
+        self.assertEqual(sorted(self._search_ids('eggs OR python', syntax=True)), [2, 3])
+        self.assertEqual(self._search_ids('title: cooking', syntax=True), [3])
+        # Operators and quotes of user input are plain words
+        self.assertEqual(self._search_ids('eggs OR "python'), [])
+        self.assertEqual(build_match_query('full-text sea* "x"'), '"full" "text" "sea"* "x"')
+
+    def test__triggers(self) -> None:
+        article = Article(2)
+        self._articles.load(article)
+        article.body = 'Nothing about it.'
+        self._articles.update(article)
+        self.assertEqual(self._search_ids('module'), [1])
+
+        self._articles.delete(Article(3))
+        self.assertEqual(self._search_ids('eggs'), [])
+
+        # Writes bypassing `BaseDBRequest` are indexed too
+        self._executor.start(SQLCustom('INSERT INTO articles (title, body, views) VALUES (?, ?, ?);', ('Eggs', 'Omelette', 1)))
+        self._cache.clear()
+        self.assertEqual([article.title for article in self._articles.search(Article(), 'omelette')], ['Eggs'])
+
+    def test__snippets(self) -> None:
+        results = self._articles.search_snippets(Article(), 'eggs', 'body', tokens=4, markers=('[', ']'), ellipsis='~')
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0][0].id, 3)
+        self.assertIn('[eggs]', results[0][1])
+        self.assertTrue(results[0][1].endswith('~'))
+
+        results = self._articles.search_snippets(Article(), 'python', self._fields[1], highlight=True)
+        self.assertEqual(results[0][1], '<b>Python</b> databases')
+
+    def test__errors(self) -> None:
+        with self.assertRaises(SchemaError):
+            self._articles.search_snippets(Article(), 'eggs', 'views')
+        with self.assertRaises(SchemaError):
+            fields = (self._fields[0], AutoField[Article, int]('views', int, full_text=True))
+            BaseDBRequest[Article](Article, 'articles', fields, (self._fields[0], ))
+        with self.assertRaises(SchemaError):
+            BaseDBRequest[Article](Article, 'articles', (self._fields[0], ), (self._fields[0], ), executor=self._executor).search(Article(), 'x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
+
+import subprocess
+from unittest import TestCase, main
+from typing import Any
+
+import dbrequest
+from dbrequest import BaseDBRequest, AutoField
+from dbrequest.interfaces import IDatabaseExecutor, ISQLRequest, ITypeConverter
+
+
+SRC_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src')
+HEAVY_MODULES = (
+    'sqlite3',
+    'json',
+    'dbrequest.executors',
+    'dbrequest.core.requests',
+    'dbrequest.core.type_converters',
+)
+
+class User():
+    def __init__(self, id: int | None = None) -> None:
+        self.id = id
+
+class FakeExecutor(IDatabaseExecutor):
+    def __init__(self, database_filename: str | None = None) -> None:
+        self.requests: list[tuple] = []
+
+    def start(self, sql_request:ISQLRequest) -> list[tuple[Any]]:
+        self.requests.append(sql_request.get_request())
+        return []
+
+    @property
+    def supported_types(self) -> tuple[type, ...]:
+        return (int, str)
+
+    @property
+    def default_type_converters(self) -> tuple[ITypeConverter, ...]:
+        return ()
+
+    @property
+    def internal_row_id_name(self) -> str | None:
+        return None
+
+class Test_LazyImport(TestCase):
+    def test__import__heavy_modules_not_loaded(self) -> None:
+        code = (
+            'import sys, dbrequest; '
+            f'print(",".join(name for name in {HEAVY_MODULES!r} if name in sys.modules))'
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            env = dict(os.environ, PYTHONPATH=SRC_PATH),
+            capture_output = True,
+            text = True,
+            check = True,
+        )
+
+        self.assertEqual(result.stdout.strip(), '')
+
+    def test__lazy_attribute__ok(self) -> None:
+        from dbrequest.core.requests import BaseDBRequest as Original
+
+        self.assertIs(dbrequest.BaseDBRequest, Original)
+        with self.assertRaises(AttributeError):
+            dbrequest.UnknownName
+
+
+class Test_DeferredExecutor(TestCase):
+    def setUp(self) -> None:
+        id_field = AutoField[User, int]('id', int)
+
+        self._database = BaseDBRequest[User](
+            model_type = User,
+            table_name = 'users',
+            fields = (id_field, ),
+            key_fields = (id_field, ),
+        )
+
+    def test__executor_resolved_on_first_use(self) -> None:
+        executor = FakeExecutor()
+        dbrequest.init(executor=executor)
+
+        self._database.save(User(id=1))
+
+        self.assertEqual(executor.requests, [('INSERT INTO users (id) VALUES (?);', (1, ))])
+
+    def tearDown(self) -> None:
+        dbrequest.init()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
+
+import io
+import sqlite3
+import logging
+import tempfile
+from datetime import datetime as Datetime, timedelta as Timedelta
+from contextlib import redirect_stdout
+from unittest import TestCase, main
+
+from dbrequest import BaseDBRequest, AutoField, Column
+from dbrequest.config import config
+from dbrequest.core.indexes import IndexAdvisor, IndexSuggestion, main as indexes_main
+from dbrequest.exceptions import SQLArgsError
+from dbrequest.executors import SQLiteExecutor, RecordingExecutor
+from dbrequest.sql import SQLScript, SQLCustom, SQLCreateIndex
+
+
+class User:
+    def __init__(self, id: int | None = None, email: str | None = None) -> None:
+        self.id = id
+        self.email = email
+        self.created = Datetime(2024, 1, 1)
+        self.team = 1
+
+
+class Test_IndexAdvisor(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._directory.name, 'database.db')
+        self._executor = SQLiteExecutor(self._filename)
+        self._executor.start(SQLScript(
+            'CREATE TABLE users (id INTEGER PRIMARY KEY, email TEXT, created INTEGER, team INTEGER);'
+            'CREATE TABLE tags (name TEXT PRIMARY KEY, user_id INTEGER);'
+        ))
+
+        id_field = AutoField[User, int]('id', int, allowed_none=True)
+        self._email = AutoField[User, str]('email', str)
+        fields = (id_field, self._email, AutoField[User, Datetime]('created', Datetime), AutoField[User, int]('team', int))
+        self._users = BaseDBRequest[User](User, 'users', fields, (id_field, self._email), executor=self._executor)
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _get_plan(self, sql: str) -> str:
+        with sqlite3.connect(self._filename) as connection:
+            return ' '.join(str(row[-1]) for row in connection.execute(f'EXPLAIN QUERY PLAN {sql}'))
+
+    def test__key_and_sort_fields(self) -> None:
+        advisor = IndexAdvisor(self._executor)
+        advisor.add_request(self._users, sort_by=('created', ))
+
+        suggestions = advisor.analyze()
+        self.assertEqual([(suggestion.columns, suggestion.reasons) for suggestion in suggestions], [
+            (('email', ), ('key field', )),
+            (('created', ), ('sort field', )),
+        ])
+
+    def test__existing_indexes(self) -> None:
+        self._executor.start(SQLScript(
+            'CREATE UNIQUE INDEX users_email ON users (email);'
+            'CREATE INDEX users_created ON users (created) WHERE team = 1;'
+        ))
+        advisor = IndexAdvisor(self._executor)
+        advisor.add_request(self._users, sort_by=('created', ))
+
+        names = {index.name: index for index in advisor.get_indexes('users')}
+        self.assertEqual(names['users_email'].columns, ('email', ))
+        self.assertTrue(names['users_email'].unique)
+        self.assertTrue(names['users_created'].partial)
+        self.assertEqual(advisor.get_indexes('tags')[0].origin, 'pk')
+        # Partial index doesn't help queries without its condition
+        self.assertEqual([suggestion.columns for suggestion in advisor.analyze()], [('created', )])
+
+    def test__create(self) -> None:
+        self.assertIn('SCAN users', self._get_plan("SELECT * FROM users WHERE email = 'a';"))
+        self.assertEqual(len(self._users.check_indexes(create=True)), 1)
+        self.assertIn('USING INDEX ix_users_email', self._get_plan("SELECT * FROM users WHERE email = 'a';"))
+        self.assertEqual(self._users.check_indexes(), [])
+
+    def test__covering_and_partial(self) -> None:
+        advisor = IndexAdvisor(self._executor)
+        suggestion = IndexSuggestion('users', ('team', ), ('filter', ))
+
+        name = advisor.create(suggestion, include=('email', ))
+        self.assertEqual(name, 'ix_users_team_email')
+        self.assertIn('USING COVERING INDEX ix_users_team_email', self._get_plan('SELECT email FROM users WHERE team = 1;'))
+
+        name = advisor.create(suggestion, where='created > 0')
+        self.assertRegex(name, r'^ix_users_team_p[0-9a-f]{8}$')
+        self.assertTrue([index for index in advisor.get_indexes('users') if index.name == name][0].partial)
+
+    def test__history(self) -> None:
+        advisor = IndexAdvisor(self._executor)
+        for _ in range(3):
+            advisor.record('SELECT id, email FROM users WHERE team = ? AND created >= ? ORDER BY created LIMIT 10;')
+        advisor.record('SELECT * FROM users AS t0 LEFT JOIN tags AS t1 ON t0.id = t1.user_id WHERE t0.created BETWEEN ? AND ?;')
+        advisor.record('UPDATE users SET team = ? WHERE id = ?;')
+        advisor.record('DELETE FROM tags WHERE user_id IN (?, ?);')
+        advisor.record('PRAGMA optimize;')
+
+        suggestions = {suggestion.columns: suggestion for suggestion in advisor.analyze()}
+        self.assertEqual(set(suggestions), {('team', 'created'), ('created', ), ('user_id', )})
+        self.assertEqual(suggestions[('team', 'created')].count, 3)
+        self.assertEqual(suggestions[('created', )].reasons, ('filter', 'ORDER BY'))
+
+        self.assertEqual([suggestion.columns for suggestion in advisor.analyze(min_count=3)], [('team', 'created'), ('created', )])
+
+    def test__prefix_suggestions_are_merged(self) -> None:
+        advisor = IndexAdvisor(self._executor)
+        advisor.record('SELECT * FROM users WHERE team = ?;')
+        advisor.record('SELECT * FROM users WHERE team = ? AND email = ?;')
+
+        suggestions = advisor.analyze()
+        self.assertEqual([(suggestion.columns, suggestion.count) for suggestion in suggestions], [(('team', 'email'), 2)])
+
+    def test__trace_and_cli(self) -> None:
+        trace_filename = os.path.join(self._directory.name, 'workload.trace')
+        with RecordingExecutor(self._executor, trace_filename) as recorder:
+            users = BaseDBRequest[User](User, 'users', self._users._fields, self._users._key_fields, executor=recorder)
+            users.save(User(email='a'))
+            users.load_all(User(), where=Column('created').within_last(Timedelta(days=1)))
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            indexes_main([self._filename, '--trace', trace_filename, '--create'])
+        self.assertIn('users (created): filter, 1 queries', output.getvalue())
+        self.assertIn('Created indexes: 1', output.getvalue())
+        self.assertIn('ix_users_created', [index.name for index in IndexAdvisor(self._executor).get_indexes('users')])
+
+    def test__check_logs_warnings(self) -> None:
+        with self.assertLogs(config.LOGGER_NAME, logging.WARNING) as logs:
+            self._users.check_indexes()
+        self.assertIn('Missing index: users (email): key field', logs.output[0])
+
+    def test__pragma_results(self) -> None:
+        self.assertEqual(self._executor.start(SQLCustom('PRAGMA user_version;', None)), [(0, )])
+
+    def test__sql_create_index(self) -> None:
+        request = SQLCreateIndex('ix', 'users', columns=('a', 'b'), unique=True, where='a > 0')
+        self.assertEqual(request.get_request(), ('CREATE UNIQUE INDEX IF NOT EXISTS ix ON users (a, b) WHERE a > 0;', ))
+        with self.assertRaises(SQLArgsError):
+            SQLCreateIndex('ix; DROP TABLE users', 'users', columns=('a', ))
+        with self.assertRaises(SQLArgsError):
+            SQLCreateIndex('ix', 'users', columns=())
+
+
+if __name__ == '__main__':
+    main()
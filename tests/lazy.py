@@ -0,0 +1,149 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
+
+import copy
+import json
+import pickle
+import tempfile
+from unittest import TestCase, main
+from unittest.mock import MagicMock
+
+from dbrequest import BaseDBRequest, AutoField
+from dbrequest.core.lazy import LazyValue, LazyDict, LazyList
+from dbrequest.core.type_converters import DictTypeConverter, ListTypeConverter, TupleTypeConverter
+from dbrequest.exceptions import TypeConverterError
+from dbrequest.executors import SQLiteExecutor
+from dbrequest.sql import SQLScript
+
+
+class Test_LazyValues(TestCase):
+    def test__dict__load_on_access(self) -> None:
+        loader = MagicMock(side_effect=json.loads)
+        value = LazyDict('{"a": 1, "b": 2}', loader)
+        self.assertIsInstance(value, dict)
+        loader.assert_not_called()
+
+        self.assertEqual(value['a'], 1)
+        self.assertEqual(len(value), 2)
+        self.assertEqual(value, {'a': 1, 'b': 2})
+        loader.assert_called_once_with('{"a": 1, "b": 2}')
+        self.assertTrue(value.reusable)
+
+    def test__dict__modified(self) -> None:
+        value = LazyDict('{"a": 1}', json.loads)
+        value['b'] = 2
+        self.assertTrue(value.modified)
+        self.assertFalse(value.reusable)
+        self.assertEqual(dict(value), {'a': 1, 'b': 2})
+
+    def test__list__load_on_access(self) -> None:
+        value = LazyList('[1, 2, 3]', json.loads)
+        self.assertFalse(value.loaded)
+        self.assertEqual(list(value), [1, 2, 3])
+        self.assertEqual(value + [4], [1, 2, 3, 4])
+        self.assertEqual({1, 2, 3}, set(value))
+        self.assertTrue(value.reusable)
+
+        value.append(4)
+        self.assertFalse(value.reusable)
+        self.assertEqual(value, [1, 2, 3, 4])
+
+    def test__nested__not_reusable_after_load(self) -> None:
+        value = LazyDict('{"items": [1]}', json.loads)
+        self.assertTrue(value.reusable)
+        value['items'].append(2)
+        self.assertFalse(value.reusable)
+
+    def test__copy_and_pickle__plain(self) -> None:
+        for value, expected in ((LazyDict('{"a": 1}', json.loads), {'a': 1}), (LazyList('[1]', json.loads), [1])):
+            with self.subTest(type=type(value).__name__):
+                self.assertEqual(copy.copy(value), expected)
+                self.assertIs(type(copy.deepcopy(value)), type(expected))
+                self.assertEqual(pickle.loads(pickle.dumps(value)), expected)
+
+    def test__incomplete_subclass__type_error(self) -> None:
+        class LazySet(LazyValue, set):
+            __slots__ = ('_raw', '_loader', '_modified')
+
+            def _fill(self, value: set) -> None:
+                set.update(self, value)
+
+        with self.assertRaises(TypeError):
+            LazySet()
+
+    def test__converter__lazy(self) -> None:
+        converter = DictTypeConverter(lazy=True)
+        value = converter.from_database('{"a":1}')
+        self.assertIsInstance(value, LazyDict)
+        self.assertEqual(converter.to_database(value), '{"a":1}')
+
+        value['a'] = 2
+        self.assertEqual(converter.to_database(value), '{"a": 2}')
+
+        value = ListTypeConverter(lazy=True).from_database('[1]')
+        value.load()
+        value.append(2)
+        self.assertEqual(ListTypeConverter().to_database(value), '[1, 2]')
+
+        with self.assertRaises(TypeConverterError):
+            TupleTypeConverter(lazy=True)  # type: ignore[call-arg]
+
+
+class Document:
+    def __init__(self, id: int | None = None, data: dict | None = None, tags: list | None = None) -> None:
+        self.id = id
+        self.data = data
+        self.tags = tags
+
+class Test_LazyField(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        executor = SQLiteExecutor(os.path.join(self._directory.name, 'database.db'))
+        executor.start(SQLScript('CREATE TABLE documents (id INTEGER PRIMARY KEY, data TEXT, tags TEXT);'))
+        self._executor = executor
+        id_field = AutoField[Document, int]('id', int, allowed_none=True)
+        self._database = BaseDBRequest[Document](
+            model_type = Document,
+            table_name = 'documents',
+            fields = (
+                id_field,
+                AutoField[Document, dict]('data', dict, lazy=True),
+                AutoField[Document, list]('tags', list),
+            ),
+            key_fields = (id_field, ),
+            executor = executor,
+        )
+
+    def test__lazy_field(self) -> None:
+        database = self._database
+        database.save(Document(data={'a': 1}, tags=['x']))
+
+        document = database.load_all(Document())[0]
+        self.assertIsInstance(document.data, LazyDict)
+        self.assertFalse(document.data.loaded)
+        self.assertNotIsInstance(document.tags, LazyList)
+
+        # Unmodified value is written back as stored
+        document.tags.append('y')
+        database.update(document)
+        self.assertFalse(document.data.loaded)
+
+        document = database.load_all(Document())[0]
+        document.data['b'] = 2
+        database.update(document)
+        document = database.load_all(Document())[0]
+        self.assertEqual(document.data, {'a': 1, 'b': 2})
+        self.assertEqual(document.tags, ['x', 'y'])
+
+    def test__wrong_type__type_error(self) -> None:
+        id_field = AutoField[Document, int]('id', int, lazy=True)
+        database = BaseDBRequest[Document](Document, 'documents', (id_field, ), (id_field, ), executor=self._executor)
+        with self.assertRaises(TypeError):
+            database.load_all(Document())
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+
+if __name__ == '__main__':
+    main()
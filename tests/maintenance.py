@@ -0,0 +1,106 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
+
+import time
+import pickle
+import sqlite3
+import logging
+import tempfile
+import threading
+from unittest import TestCase, main
+
+from dbrequest.config import config
+from dbrequest.executors import SQLiteExecutor, MaintenanceScheduler
+from dbrequest.sql import SQLScript, SQLCustom
+
+
+class Test_Maintenance(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._directory.name, 'database.db')
+        self._executor = SQLiteExecutor(self._filename)
+        self._executor.start(SQLScript(
+            'PRAGMA auto_vacuum = INCREMENTAL;'
+            'PRAGMA journal_mode = WAL;'
+            'CREATE TABLE notes (id INTEGER PRIMARY KEY, text TEXT);'
+            'WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 2000) '
+            'INSERT INTO notes (text) SELECT hex(randomblob(200)) FROM n;'
+        ))
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _query(self, sql: str) -> int:
+        with sqlite3.connect(self._filename) as connection:
+            return connection.execute(sql).fetchone()[0]
+
+    def test__idle_time(self) -> None:
+        time.sleep(0.02)
+        self.assertGreaterEqual(self._executor.idle_time, 0.02)
+        self._executor.start(SQLCustom('SELECT 1;', None))
+        self.assertLess(self._executor.idle_time, 0.02)
+
+        restored = pickle.loads(pickle.dumps(self._executor))
+        self.assertEqual(restored.start(SQLCustom('SELECT COUNT(*) FROM notes;', None)), [(2000, )])
+
+    def test__run_pending(self) -> None:
+        scheduler = MaintenanceScheduler(self._executor, idle=0.0, analyze_every=1.0, vacuum_pages=100, passes=2, pause=0)
+        self._executor.start(SQLCustom('DELETE FROM notes;', None))
+        free_pages = self._query('PRAGMA freelist_count;')
+        self.assertGreater(free_pages, 200)
+
+        with self.assertLogs(config.LOGGER_NAME, logging.INFO) as logs:
+            results = scheduler.run_pending(force=True)
+        self.assertEqual(set(results), {'optimize', 'analyze', 'checkpoint', 'vacuum'})
+        # Two passes of 100 pages
+        self.assertEqual(results['vacuum'], f'200 pages freed, {self._query("PRAGMA freelist_count;")} left')
+        self.assertGreater(self._query('PRAGMA freelist_count;'), 0)
+        self.assertRegex(results['checkpoint'], r'^\d+ frames copied, WAL truncated$')
+        self.assertEqual(os.path.getsize(self._filename + '-wal'), 0)
+        self.assertEqual(len(logs.output), 4)
+
+        # Nothing is due until the periods pass
+        self.assertEqual(scheduler.run_pending(), {})
+
+    def test__waits_for_idle(self) -> None:
+        scheduler = MaintenanceScheduler(self._executor, idle=0.2, optimize_every=0.01, checkpoint_every=None, vacuum_every=None)
+        time.sleep(0.02)
+        self._executor.start(SQLCustom('SELECT 1;', None))
+        self.assertEqual(scheduler.run_pending(), {})
+
+        late = MaintenanceScheduler(self._executor, idle=0.2, max_delay=0.0, optimize_every=0.01, checkpoint_every=None, vacuum_every=None)
+        time.sleep(0.02)
+        self.assertEqual(late.run_pending(), {'optimize': 'done'})
+
+    def test__skipped_tasks(self) -> None:
+        executor = SQLiteExecutor(os.path.join(self._directory.name, 'plain.db'))
+        executor.start(SQLScript('CREATE TABLE t (id INTEGER);'))
+
+        results = MaintenanceScheduler(executor).run_pending(force=True)
+        self.assertEqual(results['checkpoint'], 'skipped, not in WAL mode')
+        self.assertEqual(results['vacuum'], 'skipped, auto_vacuum is not INCREMENTAL')
+
+    def test__thread(self) -> None:
+        ran = threading.Event()
+        scheduler = MaintenanceScheduler(self._executor, poll_interval=0.01, idle=0.0, optimize_every=0.01, checkpoint_every=None, vacuum_every=None)
+        original = scheduler.run_pending
+
+        def run_pending(**kwargs) -> dict[str, str]:
+            results = original(**kwargs)
+            if results:
+                ran.set()
+            return results
+
+        scheduler.run_pending = run_pending
+        with self.assertLogs(config.LOGGER_NAME, logging.INFO):
+            with scheduler:
+                self.assertTrue(scheduler.running)
+                with self.assertRaises(RuntimeError):
+                    scheduler.start()
+                self.assertTrue(ran.wait(2.0))
+
+        self.assertFalse(scheduler.running)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
+
+import sqlite3
+import tempfile
+from datetime import datetime as Datetime, date as Date, timedelta as Timedelta
+from unittest import TestCase, main
+
+from dbrequest import BaseDBRequest, AutoField, QueryCache
+from dbrequest.core.type_converters import BaseTypeConverter, DictTypeConverter
+from dbrequest.core.compressed_type_converters import CompressedDictTypeConverter
+from dbrequest.executors import SQLiteExecutor
+from dbrequest.sql import SQLScript, SQLCustom
+
+
+class Event:
+    def __init__(self, id: int | None = None) -> None:
+        self.id = id
+        self.active = True
+        self.tags = ['a', 'b']
+        self.point = (1, 2)
+        self.data = {'key': 'value'}
+        self.created = Datetime(2024, 1, 2, 3, 4, 5)
+        self.day = Date(2024, 1, 2)
+        self.duration = Timedelta(seconds=90)
+
+FIELD_TYPES = (
+    ('active', bool), ('tags', list), ('point', tuple), ('data', dict),
+    ('created', Datetime), ('day', Date), ('duration', Timedelta),
+)
+
+class Test_NativeTypes(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._directory.name, 'database.db')
+        self._executor = SQLiteExecutor(self._filename, native_types=True)
+        self._executor.start(SQLScript(
+            'CREATE TABLE native_events (id INTEGER PRIMARY KEY, active BOOLEAN, tags JSON_LIST, point JSON_TUPLE, '
+            'data JSON_DICT, created DATETIME_TS, day DATE_ORDINAL, duration TIMEDELTA_SECONDS);'
+            'CREATE TABLE plain_events (id INTEGER PRIMARY KEY, active INTEGER, tags TEXT, point TEXT, '
+            'data TEXT, created INTEGER, day INTEGER, duration INTEGER);'
+        ))
+
+    def _create_request(self, table_name: str, executor: SQLiteExecutor, **kwargs) -> BaseDBRequest[Event]:
+        id_field = AutoField[Event, int]('id', int, allowed_none=True)
+        fields = (id_field, ) + tuple(AutoField[Event, field_type](name, field_type) for name, field_type in FIELD_TYPES)
+        return BaseDBRequest[Event](Event, table_name, fields, (id_field, ), executor=executor, **kwargs)
+
+    def test__supported_types(self) -> None:
+        self.assertIn(dict, self._executor.supported_types)
+        self.assertNotIn(dict, SQLiteExecutor(self._filename).supported_types)
+
+    def test__round_trip(self) -> None:
+        for table_name in ('native_events', 'plain_events'):
+            with self.subTest(table_name=table_name):
+                database = self._create_request(table_name, self._executor)
+                database.save(Event())
+
+                event = Event(1)
+                for name, _ in FIELD_TYPES:
+                    setattr(event, name, None)
+                self.assertTrue(database.load(event))
+                for name, _ in FIELD_TYPES:
+                    self.assertEqual(getattr(event, name), getattr(Event(), name))
+
+    def test__stored_format_compatible(self) -> None:
+        self._create_request('native_events', self._executor).save(Event())
+        self._create_request('plain_events', SQLiteExecutor(self._filename)).save(Event())
+
+        rows = SQLiteExecutor(self._filename).start(SQLCustom(
+            'SELECT active, tags, point, data, created, day, duration FROM native_events '
+            'UNION ALL SELECT active, tags, point, data, created, day, duration FROM plain_events;', None
+        ))
+        self.assertEqual(rows[0], rows[1])
+
+        # Rows written natively are readable by the Python conversion path
+        event = Event(1)
+        self._create_request('native_events', SQLiteExecutor(self._filename)).load(event)
+        self.assertEqual(event.data, {'key': 'value'})
+
+    def test__custom_converter(self) -> None:
+        converter = BaseTypeConverter[complex, str](complex, str)
+        executor = SQLiteExecutor(self._filename, native_types={'complex_text': converter})
+        executor.start(SQLScript('CREATE TABLE numbers (value COMPLEX_TEXT);'))
+        executor.start(SQLCustom('INSERT INTO numbers (value) VALUES (?);', (1 + 2j, )))
+        self.assertEqual(executor.start(SQLCustom('SELECT value FROM numbers;', None)), [(1 + 2j, )])
+
+    def test__converter_without_db_type__type_error(self) -> None:
+        with self.assertRaises(TypeError):
+            SQLiteExecutor(self._filename, native_types={'X': object()})  # type: ignore[dict-item]
+
+    def test__cached_values_not_shared(self) -> None:
+        database = self._create_request('native_events', self._executor, cache=QueryCache())
+        database.save(Event())
+
+        for _ in range(2):
+            event = database.load_all(Event())[0]
+            self.assertEqual(event.data, {'key': 'value'})
+            event.data['key'] = 'changed'
+            event.tags.append('c')
+        self.assertEqual(database.load_all(Event())[0].tags, ['a', 'b'])
+
+    def test__adapter_conflicts__type_error(self) -> None:
+        with self.assertRaises(TypeError):
+            SQLiteExecutor(self._filename, native_types={'JSON_DICT': DictTypeConverter(), 'ZDICT': CompressedDictTypeConverter()})
+
+        # `dict` is adapted for "JSON_DICT" by the executor of `setUp`
+        with self.assertRaises(TypeError):
+            SQLiteExecutor(self._filename, native_types={'ZDICT': CompressedDictTypeConverter()})
+        SQLiteExecutor(self._filename, native_types={'JSON_DICT': DictTypeConverter()})
+
+        sqlite3.register_adapter(Event, repr)
+        self.addCleanup(sqlite3.adapters.pop, (Event, sqlite3.PrepareProtocol))
+        with self.assertRaises(TypeError):
+            SQLiteExecutor(self._filename, native_types={'EVENT': BaseTypeConverter[Event, str](Event, str)})
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
+
+import pickle
+import tempfile
+from unittest import TestCase, main
+from datetime import datetime as Datetime
+
+from dbrequest import init, BaseDBRequest, AutoField
+from dbrequest.core.parallel import split_range
+from dbrequest.exceptions import SchemaError
+from dbrequest.sql import SQLCustom
+from dbrequest.executors import UniversalExecutor, SQLiteExecutor
+
+
+class Item():
+    def __init__(self, id: int | None = None) -> None:
+        self.id = id
+        self.payload: dict = {}
+        self.created: Datetime = Datetime(2000, 1, 1)
+
+class Test_SplitRange(TestCase):
+    def test__ok(self) -> None:
+        self.assertEqual(split_range(1, 10, 3), [(1, 5), (5, 9), (9, 11)])
+        self.assertEqual(split_range(5, 5, 4), [(5, 6)])
+        self.assertEqual(split_range(1, 3, 10), [(1, 2), (2, 3), (3, 4)])
+
+    def test__not_int__type_error(self) -> None:
+        with self.assertRaises(TypeError):
+            split_range(0.5, 10.5, 3)  # type: ignore[arg-type]
+
+class NoRowIdExecutor(SQLiteExecutor):
+    @property
+    def internal_row_id_name(self) -> None:
+        return None
+
+class Test_LoadAllParallel(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        init(database_filename=os.path.join(self._directory.name, 'parallel.db'))
+        UniversalExecutor().start(SQLCustom('CREATE TABLE items (id INTEGER PRIMARY KEY, payload TEXT, created INT);', None))
+
+        id_field = AutoField[Item, int]('id', int, allowed_none=True)
+        self._database = BaseDBRequest[Item](
+            model_type = Item,
+            table_name = 'items',
+            fields = (
+                id_field,
+                AutoField[Item, dict]('payload', dict),
+                AutoField[Item, Datetime]('created', Datetime),
+            ),
+            key_fields = (id_field, ),
+        )
+
+    def test__pickle__ok(self) -> None:
+        self._database.load_all(Item())
+        database = pickle.loads(pickle.dumps(self._database))
+
+        self.assertEqual(database.load_all(Item()), [])
+
+    def test__empty_table(self) -> None:
+        self.assertEqual(list(self._database.load_all_parallel(Item(), workers=2)), [])
+
+    def test__not_int_key__schema_error(self) -> None:
+        created_field = AutoField[Item, Datetime]('created', Datetime)
+        database = BaseDBRequest[Item](Item, 'items', (created_field, ), (created_field, ), executor=NoRowIdExecutor())
+        with self.assertRaises(SchemaError):
+            database.load_all_parallel(Item())
+
+    def test__ok(self) -> None:
+        for index in range(1, 101):
+            item = Item(id=index)
+            item.payload = {'index': index}
+            self._database.save(item)
+
+        items = list(self._database.load_all_parallel(Item(), workers=2, partitions=7))
+
+        self.assertEqual([item.id for item in items], list(range(1, 101)))
+        self.assertEqual(items[41].payload, {'index': 42})
+        self.assertEqual(items[0].created, Datetime(2000, 1, 1))
+
+        items = list(self._database.load_all_parallel(Item(), workers=2, ordered=False))
+        self.assertEqual(sorted(item.id for item in items), list(range(1, 101)))
+
+    def tearDown(self) -> None:
+        init()
+        self._directory.cleanup()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
+
+import time
+import tempfile
+import threading
+from typing import Any
+from unittest import TestCase, main
+
+from dbrequest import BaseDBRequest, AutoField
+from dbrequest.exceptions import OverloadedError
+from dbrequest.executors import SQLiteExecutor, PriorityExecutor, query_priority
+from dbrequest.interfaces import IDatabaseExecutor, ISQLRequest, ITypeConverter
+from dbrequest.sql import SQLScript, SQLCustom
+
+
+class GateExecutor(IDatabaseExecutor):
+    '''Records started requests, "BLOCK" requests wait for the gate.'''
+    def __init__(self, database_filename: str | None = None) -> None:
+        self.gate = threading.Event()
+        self.started: list[str] = []
+
+    @property
+    def supported_types(self) -> tuple[type, ...]:
+        return (int, str)
+
+    @property
+    def default_type_converters(self) -> tuple[ITypeConverter, ...]:
+        return ()
+
+    @property
+    def internal_row_id_name(self) -> str | None:
+        return None
+
+    def start(self, sql_request: ISQLRequest) -> list[tuple[Any]]:
+        sql = sql_request.get_request()[0]
+        self.started.append(sql)
+        if sql.startswith('BLOCK'):
+            self.gate.wait(5.0)
+        return []
+
+
+class Note:
+    def __init__(self, id: int | None = None, text: str = '') -> None:
+        self.id = id
+        self.text = text
+
+
+class Test_PriorityExecutor(TestCase):
+    def setUp(self) -> None:
+        self._inner = GateExecutor()
+        self._threads: list[threading.Thread] = []
+        self._errors: list[Exception] = []
+
+    def tearDown(self) -> None:
+        self._inner.gate.set()
+        for thread in self._threads:
+            thread.join()
+
+    def _start(self, executor: PriorityExecutor, sql: str, priority: Any = 'normal') -> None:
+        def run() -> None:
+            try:
+                executor.start_with_priority(SQLCustom(sql, None), priority)
+            except Exception as error:
+                self._errors.append(error)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        self._threads.append(thread)
+
+    def _wait_for(self, executor: PriorityExecutor, queued: int) -> None:
+        deadline = time.monotonic() + 5.0
+        while sum(stats.queued for stats in executor.stats().values()) < queued and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    def test__priority_order(self) -> None:
+        executor = PriorityExecutor(self._inner, max_concurrency=1, reserved=0)
+        self._start(executor, 'BLOCK', 'batch')
+        self._wait_for(executor, 0)
+        while not self._inner.started:
+            time.sleep(0.001)
+
+        for index, priority in enumerate(('batch', 'normal', 'interactive', 'normal')):
+            self._start(executor, f'{priority} {index}', priority)
+            self._wait_for(executor, index + 1)
+
+        self._inner.gate.set()
+        for thread in self._threads:
+            thread.join()
+        self.assertEqual(self._inner.started, ['BLOCK', 'interactive 2', 'normal 1', 'normal 3', 'batch 0'])
+
+        stats = executor.stats()
+        self.assertEqual((stats['normal'].completed, stats['batch'].completed, stats['batch'].running), (2, 2, 0))
+        self.assertGreater(stats['batch'].percentile(99), 0.0)
+        self.assertIn('interactive: 0 running, 0 queued, 1 completed, 0 shed', str(stats['interactive']))
+
+    def test__reserved_slots(self) -> None:
+        executor = PriorityExecutor(self._inner, max_concurrency=2, reserved=1)
+        self._start(executor, 'BLOCK 1', 'batch')
+        self._start(executor, 'BLOCK 2', 'batch')
+        self._wait_for(executor, 1)
+        self.assertEqual((executor.stats()['batch'].running, executor.stats()['batch'].queued), (1, 1))
+
+        # The reserved slot is free for interactive requests
+        executor.start_with_priority(SQLCustom('quick', None), 'interactive')
+        self.assertIn('quick', self._inner.started)
+
+    def test__load_shedding(self) -> None:
+        executor = PriorityExecutor(self._inner, max_concurrency=1, reserved=0, max_queue={'batch': 1}, max_wait={'interactive': 0.05})
+        self._start(executor, 'BLOCK', 'normal')
+        while not self._inner.started:
+            time.sleep(0.001)
+        self._start(executor, 'batch', 'batch')
+        self._wait_for(executor, 1)
+
+        with self.assertLogs('database', 'WARNING'):
+            with self.assertRaises(OverloadedError):
+                executor.start_with_priority(SQLCustom('batch 2', None), 'batch')
+            with self.assertRaises(OverloadedError):
+                executor.start_with_priority(SQLCustom('interactive', None), 'interactive')
+
+        stats = executor.stats()
+        self.assertEqual((stats['batch'].shed, stats['interactive'].shed, stats['interactive'].queued), (1, 1, 0))
+
+        with self.assertRaises(ValueError):
+            PriorityExecutor(self._inner, max_concurrency=2, reserved=2)
+        with self.assertRaises(ValueError):
+            executor.start_with_priority(SQLCustom('x', None), 'urgent')  # type: ignore[arg-type]
+
+    def test__requests(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        sqlite_executor = SQLiteExecutor(os.path.join(directory.name, 'database.db'))
+        sqlite_executor.start(SQLScript('CREATE TABLE notes (id INTEGER PRIMARY KEY, text TEXT);'))
+
+        executor = PriorityExecutor(sqlite_executor)
+        id_field = AutoField[Note, int]('id', int, allowed_none=True)
+        fields = (id_field, AutoField[Note, str]('text', str))
+        notes = BaseDBRequest[Note](Note, 'notes', fields, (id_field, ), executor=executor.for_priority('batch'))
+
+        notes.save(Note(text='a'))
+        with query_priority('interactive'):
+            self.assertEqual(len(notes.load_all(Note())), 1)
+
+        stats = executor.stats()
+        self.assertEqual((stats['batch'].completed, stats['interactive'].completed), (1, 1))
+        # Extra methods of the wrapped executor are available
+        self.assertGreater(executor.for_priority('batch').idle_time, 0.0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
+
+import sqlite3
+import tempfile
+from unittest import TestCase, main
+from unittest.mock import patch
+
+import dbrequest
+from dbrequest import BaseDBRequest, UniversalDBRequest, ShardedDBRequest, AutoField, QueryCache
+from dbrequest.exceptions import FactoryError
+from dbrequest.executors import SQLiteExecutor, RoutingExecutor, RecordingExecutor
+from dbrequest.sql import SQLScript
+
+
+class Order:
+    def __init__(self, id: int | None = None, total: int = 0) -> None:
+        self.id = id
+        self.total = total
+
+class Item:
+    def __init__(self, id: int | None = None, order_id: int = 0) -> None:
+        self.id = id
+        self.order_id = order_id
+
+
+TABLES_SCRIPT = (
+    'PRAGMA journal_mode = WAL;'
+    'CREATE TABLE orders (id INTEGER PRIMARY KEY, total INTEGER);'
+    'CREATE TABLE items (id INTEGER PRIMARY KEY, order_id INTEGER);'
+)
+# Not counted by the patched `sqlite3.connect`
+_connect = sqlite3.connect
+
+class Test_ReadSnapshot(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._directory.name, 'database.db')
+        SQLiteExecutor(self._filename).start(SQLScript(TABLES_SCRIPT))
+        dbrequest.init(database_filename=self._filename)
+
+        self._cache = QueryCache()
+        self._orders = self._create_orders(cache=self._cache)
+        self._items = self._create_items()
+        self._universal = UniversalDBRequest((self._orders, self._items))
+        self._add_order()
+
+    def tearDown(self) -> None:
+        dbrequest.init()
+        self._directory.cleanup()
+
+    def _create_orders(self, **kwargs) -> BaseDBRequest[Order]:
+        id_field = AutoField[Order, int]('id', int, allowed_none=True)
+        return BaseDBRequest[Order](Order, 'orders', (id_field, AutoField[Order, int]('total', int)), (id_field, ), **kwargs)
+
+    def _create_items(self, **kwargs) -> BaseDBRequest[Item]:
+        id_field = AutoField[Item, int]('id', int, allowed_none=True)
+        return BaseDBRequest[Item](Item, 'items', (id_field, AutoField[Item, int]('order_id', int)), (id_field, ), **kwargs)
+
+    def _add_order(self) -> None:
+        # Another connection, bypassing requests and the cache
+        with _connect(self._filename) as connection:
+            order_id = connection.execute('INSERT INTO orders (total) VALUES (10);').lastrowid
+            connection.execute('INSERT INTO items (order_id) VALUES (?);', (order_id, ))
+
+    def test__consistent_reads(self) -> None:
+        with patch('sqlite3.connect', wraps=sqlite3.connect) as connect:
+            with self._universal.read_snapshot():
+                orders = self._universal.load_all(Order())
+                self._add_order()
+                items = self._universal.load_all(Item())
+                self.assertTrue(self._universal.load(Order(1)))
+                # Nested scopes reuse the snapshot
+                with self._orders.read_snapshot():
+                    self.assertEqual(len(self._orders.load_all(Order())), 1)
+            # One connection for all reads of both requests
+            self.assertEqual(connect.call_count, 1)
+
+        self.assertEqual((len(orders), len(items)), (1, 1))
+        self.assertEqual(len(self._universal.load_all(Item())), 2)
+
+    def test__cache_is_bypassed(self) -> None:
+        self.assertEqual(len(self._orders.load_all(Order())), 1)
+        self._add_order()
+        self.assertEqual(len(self._orders.load_all(Order())), 1)
+
+        with self._orders.read_snapshot():
+            self.assertTrue(self._orders._executor.in_read_snapshot)
+            self.assertEqual(len(self._orders.load_all(Order())), 2)
+        self.assertFalse(self._orders._executor.in_read_snapshot)
+
+    def test__writes_in_scope(self) -> None:
+        with self._universal.read_snapshot():
+            self._universal.save(Order(total=5))
+            self.assertEqual(len(self._universal.load_all(Order())), 1)
+        self.assertEqual(len(self._universal.load_all(Order())), 2)
+
+    def test__routing_executor(self) -> None:
+        with RoutingExecutor(self._filename) as executor:
+            orders = self._create_orders(executor=executor)
+            with orders.read_snapshot():
+                self.assertEqual(len(orders.load_all(Order())), 1)
+                self._add_order()
+                self.assertEqual(len(orders.load_all(Order())), 1)
+
+    def test__sharded_request(self) -> None:
+        executors = tuple(SQLiteExecutor(os.path.join(self._directory.name, f'shard_{index}.db')) for index in range(2))
+        for executor in executors:
+            executor.start(SQLScript(TABLES_SCRIPT))
+        id_field = AutoField[Order, int]('id', int, allowed_none=True)
+        total_field = AutoField[Order, int]('total', int)
+        orders = ShardedDBRequest[Order](Order, 'orders', (id_field, total_field), (id_field, ), shard_key=total_field, executors=executors)
+        for total in range(4):
+            orders.save(Order(total=total))
+
+        with patch('sqlite3.connect', wraps=sqlite3.connect) as connect:
+            with orders.read_snapshot():
+                self.assertEqual(len(orders.load_all(Order())), 4)
+                self.assertEqual(len(orders.load_all(Order())), 4)
+            self.assertEqual(connect.call_count, 2)
+
+    def test__unsupported_executor(self) -> None:
+        recorder = RecordingExecutor(SQLiteExecutor(self._filename), os.path.join(self._directory.name, 'trace'))
+        self.addCleanup(recorder.close)
+        with self.assertRaises(FactoryError):
+            with self._create_orders(executor=recorder).read_snapshot():
+                pass
+        with self.assertRaises(FactoryError):
+            with UniversalDBRequest((self._create_items(executor=recorder), )).read_snapshot():
+                pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
+
+import tempfile
+from typing import Any
+from unittest import TestCase, main
+
+from dbrequest import BaseDBRequest, UniversalDBRequest, AutoField, RelationField
+from dbrequest.exceptions import SchemaError, SQLArgsError
+from dbrequest.interfaces import ISQLRequest
+from dbrequest.executors import SQLiteExecutor
+from dbrequest.sql import SQLScript, SQLSelect, SQLJoin
+
+
+class CountingExecutor(SQLiteExecutor):
+    def __init__(self, database_filename: str) -> None:
+        super().__init__(database_filename)
+        self.selects = 0
+
+    def start(self, sql_request: ISQLRequest) -> list[tuple[Any]]:
+        if sql_request.get_request()[0].startswith('SELECT'):
+            self.selects += 1
+        return super().start(sql_request)
+
+class User:
+    def __init__(self, id: int | None = None, name: str | None = None) -> None:
+        self.id = id
+        self.name = name
+
+class Team:
+    def __init__(self, id: int | None = None, name: str | None = None) -> None:
+        self.id = id
+        self.name = name
+
+class Order:
+    def __init__(self, id: int | None = None, user_id: int | None = None, team_id: int | None = None) -> None:
+        self.id = id
+        self.user_id = user_id
+        self.team_id = team_id
+        self.user: User | None = None
+        self.team: Team | None = None
+
+class Test_Relations(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._executor = CountingExecutor(os.path.join(self._directory.name, 'database.db'))
+        self._executor.start(SQLScript(
+            'CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT);'
+            'CREATE TABLE teams (id INTEGER PRIMARY KEY, name TEXT);'
+            'CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER, team_id INTEGER);'
+        ))
+
+        user_id = AutoField[User, int]('id', int, allowed_none=True)
+        self._users = BaseDBRequest[User](User, 'users', (user_id, AutoField[User, str]('name', str)), (user_id, ), executor=self._executor)
+        team_id = AutoField[Team, int]('id', int, allowed_none=True)
+        teams = BaseDBRequest[Team](Team, 'teams', (team_id, AutoField[Team, str]('name', str)), (team_id, ), executor=self._executor)
+        self._universal = UniversalDBRequest((self._users, teams))
+
+        order_id = AutoField[Order, int]('id', int, allowed_none=True)
+        self._user_field = RelationField[Order, int]('user_id', int, related_request=self._users, related_field=user_id, attribute='user')
+        self._team_field = RelationField[Order, int](
+            'team_id', int,
+            related_request = self._universal,
+            related_model = Team,
+            related_field = 'id',
+            attribute = 'team',
+        )
+        self._orders = BaseDBRequest[Order](
+            Order, 'orders', (order_id, self._user_field, self._team_field), (order_id, ), executor=self._executor,
+        )
+
+        for index in range(1, 6):
+            self._users.save(User(name=f'user{index}'))
+        teams.save(Team(name='team'))
+        for index in range(600):
+            self._orders.save(Order(user_id=index % 5 + 1, team_id=1 if index % 2 else None))
+        self._orders.save(Order(user_id=100))
+
+    def test__load_all_prefetch(self) -> None:
+        self._executor.selects = 0
+        orders = self._orders.load_all(Order(), prefetch=(self._user_field, 'team_id'))
+        self.assertEqual(self._executor.selects, 3)
+
+        self.assertEqual(orders[0].user.name, 'user1')
+        self.assertIs(orders[0].user, orders[5].user)
+        self.assertIsNone(orders[0].team)
+        self.assertEqual(orders[1].team.name, 'team')
+        self.assertIsNone(orders[-1].user)
+
+    def test__prefetch_after_load(self) -> None:
+        orders = self._orders.load_all(Order(), limit=10)
+        UniversalDBRequest((self._orders, self._users)).prefetch(orders, 'user_id')
+        self.assertEqual([order.user.id for order in orders], [order.user_id for order in orders])
+
+    def test__load_many_batches(self) -> None:
+        self._executor.selects = 0
+        orders = self._orders.load_many(Order(), 'id', range(1, 602))
+        self.assertEqual(len(orders), 601)
+        self.assertEqual(self._executor.selects, 2)
+        self.assertEqual(len(self._universal.load_many(User(), 'id', [2, 3])), 2)
+
+    def test__load_all_join(self) -> None:
+        self._executor.selects = 0
+        orders = self._orders.load_all(Order(), join=(self._user_field, 'team_id'), sort_by='id', reverse=True, limit=4)
+        self.assertEqual(self._executor.selects, 1)
+
+        self.assertEqual([order.id for order in orders], [601, 600, 599, 598])
+        self.assertIsNone(orders[0].user)
+        self.assertEqual(orders[1].user.name, 'user5')
+        self.assertEqual(orders[1].team.name, 'team')
+        self.assertIsNone(orders[2].team)
+        self.assertIs(orders[1].team, orders[3].team)
+
+    def test__load_join(self) -> None:
+        order = Order(id=2)
+        self.assertTrue(self._universal_orders().load(order, join=('user_id', )))
+        self.assertEqual(order.user_id, 2)
+        self.assertEqual(order.user.name, 'user2')
+        self.assertFalse(self._orders.load(Order(id=1000), join=('user_id', )))
+
+    def test__join_request_sql(self) -> None:
+        request = SQLSelect(
+            'orders', alias='o', columns=('o.id', 'u.name AS user_name'),
+            joins=(SQLJoin('users', alias='u', on='o.user_id = u.id', kind='INNER'), ),
+            where='u.name = {}', where_values=('user1', ), limit=2,
+        )
+        self.assertEqual(
+            request.get_request()[0],
+            'SELECT o.id, u.name AS user_name FROM orders AS o INNER JOIN users AS u ON o.user_id = u.id WHERE u.name = ? LIMIT 2;',
+        )
+        self.assertEqual(self._executor.start(request), [(1, 'user1'), (6, 'user1')])
+
+        with self.assertRaises(SQLArgsError):
+            SQLJoin('users', alias='u; DROP TABLE users')
+        with self.assertRaises(SQLArgsError):
+            SQLJoin('users', alias='u')
+
+    def _universal_orders(self) -> UniversalDBRequest:
+        return UniversalDBRequest((self._orders, self._users))
+
+    def test__wrong_relation__schema_error(self) -> None:
+        with self.assertRaises(SchemaError):
+            self._orders.load_all(Order(), prefetch=('id', ))
+        with self.assertRaises(SchemaError):
+            self._orders.load_all(Order(), prefetch=('unknown', ))
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+
+if __name__ == '__main__':
+    main()
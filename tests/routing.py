@@ -0,0 +1,127 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
+
+import pickle
+import sqlite3
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase, main
+
+from dbrequest import BaseDBRequest, AutoField
+from dbrequest.exceptions import QueryTimeoutError
+from dbrequest.executors import SQLiteExecutor, RoutingExecutor, read_your_writes, query_timeout
+from dbrequest.executors.sqlite_routing import get_read_only_uri
+from dbrequest.sql import SQLScript, SQLSelect, SQLCustom
+
+
+class Note:
+    def __init__(self, id: int | None = None, text: str = '') -> None:
+        self.id = id
+        self.text = text
+
+
+class Test_RoutingExecutor(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._directory.name, 'database.db')
+        SQLiteExecutor(self._filename).start(SQLScript('CREATE TABLE notes (id INTEGER PRIMARY KEY, text TEXT);'))
+
+        self._id_field = AutoField[Note, int]('id', int, allowed_none=True)
+        self._fields = (self._id_field, AutoField[Note, str]('text', str))
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _create_request(self, executor) -> BaseDBRequest[Note]:
+        return BaseDBRequest[Note](Note, 'notes', self._fields, (self._id_field, ), executor=executor)
+
+    def _texts(self, notes: BaseDBRequest[Note]) -> list[str]:
+        return [note.text for note in notes.load_all(Note())]
+
+    def test__reads_and_writes(self) -> None:
+        with RoutingExecutor(self._filename, readers=2) as executor:
+            notes = self._create_request(executor)
+            for index in range(20):
+                notes.save(Note(text=str(index)))
+
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                counts = list(pool.map(lambda _: len(notes.load_all(Note())), range(40)))
+            self.assertEqual(counts, [20] * 40)
+
+            with sqlite3.connect(self._filename) as connection:
+                self.assertEqual(connection.execute('PRAGMA journal_mode;').fetchone(), ('wal', ))
+
+            # Pooled connections keep working with time limits
+            with query_timeout(10.0):
+                self.assertEqual(len(notes.load_all(Note())), 20)
+
+        # Connections are opened again after `close`
+        self.assertEqual(len(notes.load_all(Note())), 20)
+        executor.close()
+
+    def test__read_before_write(self) -> None:
+        filename = os.path.join(self._directory.name, 'new.db')
+        with RoutingExecutor(filename) as executor:
+            self.assertEqual(executor.start(SQLSelect('sqlite_master', columns=('COUNT(*)', ))), [(0, )])
+            executor.start(SQLScript('CREATE TABLE notes (id INTEGER PRIMARY KEY, text TEXT);'))
+            self.assertEqual(executor.start(SQLSelect('sqlite_master', columns=('COUNT(*)', ))), [(1, )])
+
+    def test__read_only_connections(self) -> None:
+        uri = get_read_only_uri(self._filename)
+        self.assertTrue(uri.startswith('file:') and uri.endswith('?mode=ro'))
+        self.assertEqual(get_read_only_uri('file:db?cache=shared'), 'file:db?cache=shared&mode=ro')
+
+        with sqlite3.connect(uri, uri=True) as connection:
+            with self.assertRaises(sqlite3.OperationalError):
+                connection.execute("INSERT INTO notes (text) VALUES ('x');")
+
+    def test__replicas(self) -> None:
+        replicas = tuple(os.path.join(self._directory.name, f'replica_{index}.db') for index in range(2))
+        executor = RoutingExecutor(self._filename, replicas=replicas)
+        self.addCleanup(executor.close)
+        notes = self._create_request(executor)
+
+        notes.save(Note(text='a'))
+        # The first read creates replicas
+        self.assertEqual(self._texts(notes), ['a'])
+        self.assertTrue(all(os.path.exists(replica) for replica in replicas))
+
+        notes.save(Note(text='b'))
+        self.assertEqual(self._texts(notes), ['a'])
+        self.assertEqual(self._texts(self._create_request(executor.primary)), ['a', 'b'])
+        with read_your_writes():
+            self.assertEqual(self._texts(notes), ['a'])
+            notes.save(Note(text='c'))
+            self.assertEqual(self._texts(notes), ['a', 'b', 'c'])
+
+        executor.sync_replicas()
+        self.assertEqual(self._texts(notes), ['a', 'b', 'c'])
+        self.assertEqual(self._texts(notes), ['a', 'b', 'c'])
+
+    def test__max_lag(self) -> None:
+        replica = os.path.join(self._directory.name, 'replica.db')
+        executor = RoutingExecutor(self._filename, replicas=(replica, ), max_lag=0.0)
+        self.addCleanup(executor.close)
+        notes = self._create_request(executor)
+
+        for text in ('a', 'b'):
+            notes.save(Note(text=text))
+            self.assertEqual(self._texts(notes)[-1], text)
+
+    def test__errors(self) -> None:
+        executor = RoutingExecutor(self._filename)
+        self.addCleanup(executor.close)
+        with self.assertRaises(TypeError):
+            pickle.dumps(executor)
+        with self.assertRaises(ValueError):
+            RoutingExecutor(self._filename, readers=0)
+
+        executor.start(SQLCustom("INSERT INTO notes (text) VALUES ('a');", None))
+        with query_timeout(0.01):
+            with self.assertRaises(QueryTimeoutError):
+                executor.start(SQLSelect('notes', columns=('COUNT(*)', ), where='(WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) SELECT COUNT(*) FROM n) > 0'))
+        self.assertEqual(executor.start(SQLSelect('notes', columns=('COUNT(*)', ))), [(1, )])
+
+
+if __name__ == '__main__':
+    main()
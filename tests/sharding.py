@@ -0,0 +1,123 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
+
+import zlib
+import tempfile
+from unittest import TestCase, main
+
+from dbrequest import init, ShardedDBRequest, AutoField
+from dbrequest.core.type_converters import DictTypeConverter
+from dbrequest.exceptions import SchemaError
+from dbrequest.executors import SQLiteExecutor
+from dbrequest.sql import SQLScript
+
+
+SCHEMA = '''
+create table IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT NOT NULL UNIQUE,
+    ratio REAL DEFAULT 0
+);
+'''
+
+class User():
+    def __init__(self, id: int | None = None, username: str | None = None, ratio: float = 0.0) -> None:
+        self.id = id
+        self.username = username
+        self.ratio = ratio
+
+class Item():
+    def __init__(self, id: int | None = None, meta: dict | None = None) -> None:
+        self.id = id
+        self.meta = meta
+
+class Test_ShardedDBRequest(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        init_script = os.path.join(self._directory.name, 'init.sql')
+        with open(init_script, 'w') as file:
+            file.write(SCHEMA)
+
+        self._shard_filenames = tuple(os.path.join(self._directory.name, f'shard_{index}.db') for index in range(3))
+        init(shard_filenames=self._shard_filenames, init_script=init_script)
+
+        id_field = AutoField[User, int]('id', int, allowed_none=True)
+        self._username_field = AutoField[User, str]('username', str)
+        ratio_field = AutoField[User, float]('ratio', float)
+
+        self._database = ShardedDBRequest[User](
+            model_type = User,
+            table_name = 'users',
+            fields = (id_field, self._username_field, ratio_field),
+            key_fields = (self._username_field, id_field),
+            shard_key = self._username_field,
+        )
+
+        for index in range(30):
+            self._database.save(User(username=f'user_{index}', ratio=float(index)))
+
+    def test__rows_distributed(self) -> None:
+        counts = [len(shard.load_all(User())) for shard in self._database.shards]
+
+        self.assertEqual(sum(counts), 30)
+        self.assertTrue(all(count > 0 for count in counts))
+
+    def test__load_update_delete(self) -> None:
+        user = User(username='user_7')
+        self.assertTrue(self._database.load(user))
+        self.assertEqual(user.ratio, 7.0)
+
+        user.ratio = 100.0
+        self._database.update(user)
+        same_user = User(username='user_7')
+        self._database.load(same_user)
+        self.assertEqual(same_user.ratio, 100.0)
+
+        self._database.delete(user)
+        self.assertFalse(self._database.load(User(username='user_7')))
+
+    def test__load_all_merge(self) -> None:
+        users = self._database.load_all(User(), sort_by='ratio', limit=5, reverse=True)
+
+        self.assertEqual([user.ratio for user in users], [29.0, 28.0, 27.0, 26.0, 25.0])
+
+        users = self._database.load_all(User(), sort_by=self._username_field)
+        self.assertEqual([user.username for user in users], sorted(f'user_{index}' for index in range(30)))
+
+    def test__database_values(self) -> None:
+        executors = tuple(SQLiteExecutor(os.path.join(self._directory.name, f'items_{index}.db')) for index in range(3))
+        for executor in executors:
+            executor.start(SQLScript('CREATE TABLE items (id INTEGER PRIMARY KEY, meta TEXT);'))
+        id_field = AutoField[Item, int]('id', int, allowed_none=True)
+        meta_field = AutoField[Item, dict]('meta', dict, allowed_none=True)
+        items = ShardedDBRequest[Item](Item, 'items', (id_field, meta_field), (id_field, ), shard_key=meta_field, executors=executors)
+
+        metas = [{'n': index} for index in range(10)]
+        for meta in metas:
+            items.save(Item(meta=meta))
+        # Dicts are merged by their JSON text, as shards sorted them
+        loaded = items.load_all(Item(), sort_by='meta')
+        self.assertEqual([item.meta for item in loaded], sorted(metas, key=lambda meta: str(meta['n'])))
+
+        # The shard is selected by the database value (JSON text), not by `repr` of the dict
+        shards = [items.shards.index(items._get_shard(Item(meta=meta))) for meta in metas]
+        self.assertEqual(shards, [zlib.crc32(repr(DictTypeConverter().to_database(meta)).encode()) % 3 for meta in metas])
+
+        native_items = ShardedDBRequest[Item](
+            Item, 'items', (id_field, meta_field), (id_field, ), shard_key=meta_field,
+            executors=tuple(SQLiteExecutor(executor._database_filename, native_types=True) for executor in executors),
+        )
+        with self.assertRaises(SchemaError):
+            native_items.save(Item(meta={'n': 1}))
+
+    def test__empty_shard_key__error(self) -> None:
+        with self.assertRaises(SchemaError):
+            self._database.save(User())
+
+    def tearDown(self) -> None:
+        init()
+        self._directory.cleanup()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
+
+import time
+import asyncio
+import tempfile
+import threading
+from unittest import TestCase, main
+
+from dbrequest.exceptions import QueryTimeoutError, QueryCancelledError
+from dbrequest.executors import SQLiteExecutor, CancellationToken, query_timeout, cancellation, run_async
+from dbrequest.sql import SQLScript, SQLCustom
+
+
+# Never finishes without interruption
+ENDLESS = SQLCustom('WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) SELECT COUNT(*) FROM n;', None)
+SHORT = SQLCustom('WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 100000) SELECT COUNT(*) FROM n;', None)
+
+class Test_Timeout(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._directory.name, 'database.db')
+        SQLiteExecutor(self._filename).start(SQLScript('CREATE TABLE t (id INTEGER PRIMARY KEY);'))
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def test__executor_timeout(self) -> None:
+        executor = SQLiteExecutor(self._filename, timeout=0.05)
+        start_time = time.monotonic()
+        with self.assertRaises(QueryTimeoutError) as context:
+            executor.start(ENDLESS)
+        self.assertLess(time.monotonic() - start_time, 1.0)
+        self.assertIsInstance(context.exception, TimeoutError)
+
+        self.assertEqual(executor.start(SQLCustom('SELECT COUNT(*) FROM t;', None)), [(0, )])
+        with self.assertRaises(ValueError):
+            SQLiteExecutor(self._filename, timeout=0)
+
+    def test__scope_timeout(self) -> None:
+        executor = SQLiteExecutor(self._filename)
+        with query_timeout(0.05):
+            with self.assertRaises(QueryTimeoutError):
+                executor.start(ENDLESS)
+
+        strict_executor = SQLiteExecutor(self._filename, timeout=0.000001)
+        with self.assertRaises(QueryTimeoutError):
+            strict_executor.start(SHORT)
+        # The scope overrides the executor budget
+        with query_timeout(None):
+            self.assertEqual(strict_executor.start(SHORT), [(100000, )])
+
+    def test__cancellation(self) -> None:
+        executor = SQLiteExecutor(self._filename)
+        token = CancellationToken()
+        timer = threading.Timer(0.05, token.cancel)
+        timer.start()
+
+        with cancellation(token):
+            with self.assertRaises(QueryCancelledError):
+                executor.start(ENDLESS)
+            # Later requests of the scope are cancelled too
+            with self.assertRaises(QueryCancelledError):
+                executor.start(SHORT)
+        self.assertEqual(executor.start(SHORT), [(100000, )])
+
+    def test__short_requests_checked(self) -> None:
+        executor = SQLiteExecutor(self._filename)
+        insert = SQLCustom('INSERT INTO t (id) VALUES (1);', None)
+        token = CancellationToken()
+        token.cancel()
+
+        with cancellation(token):
+            with self.assertRaises(QueryCancelledError):
+                executor.start(insert)
+        with query_timeout(0.000001):
+            time.sleep(0.001)
+            with self.assertRaises(QueryTimeoutError):
+                executor.start(insert)
+        self.assertEqual(executor.start(SQLCustom('SELECT COUNT(*) FROM t;', None)), [(0, )])
+
+    def test__run_async(self) -> None:
+        executor = SQLiteExecutor(self._filename)
+
+        async def abandon() -> None:
+            await asyncio.wait_for(run_async(executor.start, ENDLESS), 0.05)
+
+        with self.assertRaises(TimeoutError):
+            asyncio.run(abandon())
+
+        # The abandoned request is interrupted in its thread
+        deadline = time.monotonic() + 1.0
+        while executor.idle_time == 0.0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertGreater(executor.idle_time, 0.0)
+
+        with self.assertRaises(QueryTimeoutError):
+            asyncio.run(run_async(executor.start, ENDLESS, timeout=0.05))
+        self.assertEqual(asyncio.run(run_async(executor.start, SHORT)), [(100000, )])
+
+
+if __name__ == '__main__':
+    main()
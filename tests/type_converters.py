@@ -1,6 +1,9 @@
 import sys, os
 sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
 
+import struct
+import pickle
+from array import array
 from datetime import datetime as Datetime, date as Date, timedelta as Timedelta
 from unittest import TestCase, main
 from unittest.mock import MagicMock
@@ -17,6 +20,23 @@ from dbrequest.core.type_converters import (
     DateTypeConverter,
     TimedeltaTypeConverter,
 )
+from dbrequest.core.compressed_type_converters import (
+    CompressedTypeConverter,
+    CompressedDictTypeConverter,
+    build_zlib_dictionary,
+)
+from dbrequest.core import binary_type_converters
+from dbrequest.core.binary_type_converters import (
+    BinaryCodec,
+    register_binary_codec,
+    get_binary_codec,
+    BinaryListTypeConverter,
+    BinaryTupleTypeConverter,
+    BinaryDictTypeConverter,
+    PackedListTypeConverter,
+    ArrayTypeConverter,
+    StructTupleTypeConverter,
+)
 
 
 class Test_BaseTypeConverter(TestCase):
@@ -188,7 +208,146 @@ class Test_TimedeltaTypeConverter(TestCase):
     def test__from_database__simple__ok(self) -> None:
         self.assertEqual(self.converter.from_database(self.converted_value), self.value)
 
+class Test_CompressedTypeConverter(TestCase):
+    def setUp(self) -> None:
+        self.value = {'name': 'value' * 100, 'items': list(range(50))}
+
+    def test__type__ok(self) -> None:
+        converter = CompressedDictTypeConverter()
+        self.assertEqual(converter.source_type, dict)
+        self.assertIsInstance(converter.to_database({}), bytes)
+
+    def test__codecs__ok(self) -> None:
+        for codec in ('zlib', 'lzma', 'bz2'):
+            with self.subTest(codec=codec):
+                converter = CompressedDictTypeConverter(codec=codec)
+                db_value = converter.to_database(self.value)
+                self.assertIsInstance(db_value, bytes)
+                self.assertLess(len(db_value), len(DictTypeConverter().to_database(self.value)))
+                self.assertEqual(converter.from_database(db_value), self.value)
+
+    def test__threshold__stored_raw(self) -> None:
+        converter = CompressedDictTypeConverter(threshold=1000)
+        db_value = converter.to_database({'a': 1})
+        self.assertEqual(db_value[1:], b'{"a": 1}')
+        self.assertEqual(converter.from_database(db_value), {'a': 1})
+
+    def test__legacy_text__ok(self) -> None:
+        converter = CompressedDictTypeConverter()
+        self.assertEqual(converter.from_database('{"a": 1}'), {'a': 1})
+
+    def test__codec_change__old_values_readable(self) -> None:
+        db_value = CompressedDictTypeConverter(codec='lzma').to_database(self.value)
+        self.assertEqual(CompressedDictTypeConverter(codec='zlib').from_database(db_value), self.value)
+
+    def test__bytes_converter__ok(self) -> None:
+        inner = BaseTypeConverter[bytes, bytes](bytes, bytes)
+        converter = CompressedTypeConverter[bytes](inner, threshold=0)
+        self.assertEqual(converter.from_database(converter.to_database(b'x' * 1000)), b'x' * 1000)
+
+    def test__zdict__ok(self) -> None:
+        samples = [DictTypeConverter().to_database({'user_name': f'user{i}', 'email_address': f'{i}@example.com'}) for i in range(100)]
+        zdict = build_zlib_dictionary(samples)
+        self.assertIn(b'"email_address": ', zdict)
+
+        value = {'user_name': 'someone', 'email_address': 'someone@example.com'}
+        plain = CompressedDictTypeConverter(threshold=0).to_database(value)
+        converter = CompressedDictTypeConverter(threshold=0, zdict=zdict)
+        db_value = converter.to_database(value)
+        self.assertLess(len(db_value), len(plain))
+        self.assertEqual(converter.from_database(db_value), value)
+
+        with self.assertRaises(TypeConverterError):
+            CompressedDictTypeConverter().from_database(db_value)
+
+    def test__wrong_args__type_converter_error(self) -> None:
+        with self.assertRaises(TypeConverterError):
+            CompressedDictTypeConverter(codec='zstd')  # type: ignore[arg-type]
+        with self.assertRaises(TypeConverterError):
+            CompressedDictTypeConverter(codec='lzma', zdict=b'abc')
+        with self.assertRaises(TypeConverterError):
+            CompressedDictTypeConverter().from_database(b'\xff')
+
+class Test_BinaryTypeConverters(TestCase):
+    def test__codecs__ok(self) -> None:
+        value = {'name': 'value', 'items': [1, 2.5, None, True]}
+        for codec in (None, 'json'):
+            with self.subTest(codec=codec):
+                converter = BinaryDictTypeConverter(codec=codec)
+                db_value = converter.to_database(value)
+                self.assertIsInstance(db_value, bytes)
+                self.assertEqual(converter.from_database(db_value), value)
+
+    def test__tuple__ok(self) -> None:
+        converter = BinaryTupleTypeConverter(codec='json')
+        self.assertEqual(converter.from_database(converter.to_database(('a', 1))), ('a', 1))
+
+    def test__json_tag__readable_as_text(self) -> None:
+        converter = BinaryListTypeConverter(codec='json')
+        self.assertEqual(converter.to_database([1, 'ы']), b'J[1,"\xd1\x8b"]')
+
+    def test__registered_codec__ok(self) -> None:
+        codec = BinaryCodec('repr', b'R', lambda value: repr(value).encode(), lambda value: eval(bytes(value)))
+        register_binary_codec(codec)
+        try:
+            self.assertIs(get_binary_codec(), codec)
+            converter = BinaryListTypeConverter()
+            db_value = converter.to_database([1, 2])
+            self.assertEqual(db_value, b'R[1, 2]')
+            self.assertEqual(BinaryListTypeConverter(codec='json').from_database(db_value), [1, 2])
+        finally:
+            binary_type_converters._preference.remove('repr')
+            del binary_type_converters._codecs['repr']
+
+        with self.assertRaises(TypeConverterError):
+            BinaryListTypeConverter().from_database(db_value)
+
+    def test__unknown_codec__type_converter_error(self) -> None:
+        with self.assertRaises(TypeConverterError):
+            BinaryListTypeConverter(codec='pickle')
+
+    def test__packed_list__ok(self) -> None:
+        converter = PackedListTypeConverter('d')
+        db_value = converter.to_database([1.5, -2.0, 3.25])
+        self.assertEqual(len(db_value), 24)
+        self.assertEqual(db_value[:8], struct.pack('<d', 1.5))
+        self.assertEqual(converter.from_database(db_value), [1.5, -2.0, 3.25])
+
+    def test__packed_list__wrong_values__type_converter_error(self) -> None:
+        with self.assertRaises(TypeConverterError):
+            PackedListTypeConverter('b').to_database([1000])
+        with self.assertRaises(TypeConverterError):
+            PackedListTypeConverter('q').to_database(['a'])
+        with self.assertRaises(TypeConverterError):
+            PackedListTypeConverter('q').from_database(b'123')
+        with self.assertRaises(TypeConverterError):
+            PackedListTypeConverter('X')
+
+    def test__array__ok(self) -> None:
+        converter = ArrayTypeConverter('q')
+        value = array('q', [1, -2, 1 << 40])
+        self.assertEqual(converter.to_database(value), struct.pack('<3q', 1, -2, 1 << 40))
+        self.assertEqual(converter.from_database(converter.to_database(value)), value)
+
+        with self.assertRaises(TypeConverterError):
+            converter.to_database(array('d', [1.0]))
+
+    def test__struct_tuple__ok(self) -> None:
+        converter = StructTupleTypeConverter('dd?')
+        db_value = converter.to_database((1.0, 2.0, True))
+        self.assertEqual(db_value, struct.pack('<dd?', 1.0, 2.0, True))
+        self.assertEqual(converter.from_database(db_value), (1.0, 2.0, True))
+
+        with self.assertRaises(TypeConverterError):
+            converter.to_database((1.0, ))
+        with self.assertRaises(TypeConverterError):
+            StructTupleTypeConverter('zz')
+
+    def test__pickle__ok(self) -> None:
+        for converter in (BinaryDictTypeConverter(codec='json'), PackedListTypeConverter('q'), ArrayTypeConverter('d'), StructTupleTypeConverter('ii')):
+            with self.subTest(converter=type(converter).__name__):
+                pickle.loads(pickle.dumps(converter))
+
 
 if __name__ == '__main__':
     main()
-
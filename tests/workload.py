@@ -0,0 +1,91 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
+
+import tempfile
+from datetime import datetime as Datetime
+from unittest import TestCase, main
+
+from dbrequest import init, BaseDBRequest, AutoField
+from dbrequest.core.type_converters import BaseTypeConverter
+from dbrequest.executors import SQLiteExecutor, RecordingExecutor, replay_trace
+from dbrequest.executors.workload import read_trace, TraceRecord
+from dbrequest.sql import SQLScript, SQLCustom
+
+
+class Item():
+    def __init__(self, id: int | None = None) -> None:
+        self.id = id
+        self.data: bytes = b''
+
+class Test_Workload(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._database_filename = os.path.join(self._directory.name, 'database.db')
+        self._trace_filename = os.path.join(self._directory.name, 'trace.jsonl.gz')
+
+        self._recorder = RecordingExecutor(SQLiteExecutor(), self._trace_filename)
+        init(database_filename=self._database_filename, executor=self._recorder)
+
+        self._recorder.start(SQLScript('CREATE TABLE items (id INTEGER PRIMARY KEY, data BLOB);'))
+        id_field = AutoField[Item, int]('id', int, allowed_none=True)
+        self._database = BaseDBRequest[Item](Item, 'items', (id_field, AutoField[Item, bytes]('data', bytes)), (id_field, ))
+
+    def test__record_and_replay(self) -> None:
+        for index in range(10):
+            item = Item()
+            item.data = bytes([index, 0, 255])
+            self._database.save(item)
+        self._database.load_all(Item())
+        self._recorder.close()
+
+        records = list(read_trace(self._trace_filename))
+        self.assertEqual(len(records), 12)
+        self.assertTrue(records[0].is_script)
+        self.assertEqual(records[5].values, (None, bytes([4, 0, 255])))
+
+        copy_filename = os.path.join(self._directory.name, 'copy.db')
+        report = replay_trace(self._trace_filename, SQLiteExecutor(copy_filename), speed=None, concurrency=1)
+
+        self.assertEqual(report.count, 12)
+        self.assertEqual(report.errors, 0)
+        self.assertGreater(report.throughput, 0)
+        self.assertLessEqual(report.percentile(50), report.percentile(99))
+        self.assertEqual(SQLiteExecutor(copy_filename).start(SQLCustom('SELECT COUNT(*) FROM items;', None)), [(10, )])
+
+    def test__unsupported_values(self) -> None:
+        executor = SQLiteExecutor(native_types=True)
+        with RecordingExecutor(executor, self._trace_filename) as recorder:
+            recorder.start(SQLScript('CREATE TABLE events (created DATETIME_TS);'))
+            recorder.start(SQLCustom('INSERT INTO events (created) VALUES (?);', (Datetime(2024, 1, 2), )))
+
+        # Recorded as stored in the database
+        record = list(read_trace(self._trace_filename))[-1]
+        self.assertEqual(record.values, SQLiteExecutor().start(SQLCustom('SELECT created FROM events;', None))[0])
+        self.assertFalse(record.is_error)
+
+        # Values without a converter are not recorded
+        executor = SQLiteExecutor(native_types={'COMPLEX_TEXT': BaseTypeConverter[complex, str](complex, str)})
+        with RecordingExecutor(executor, self._trace_filename) as recorder:
+            recorder.start(SQLScript('CREATE TABLE numbers (value COMPLEX_TEXT);'))
+            with self.assertLogs('database', 'WARNING'):
+                recorder.start(SQLCustom('INSERT INTO numbers (value) VALUES (?);', (1 + 2j, )))
+        self.assertEqual(list(read_trace(self._trace_filename))[-1].sql, 'CREATE TABLE numbers (value COMPLEX_TEXT);')
+
+        # Only exact markers are decoded
+        record = TraceRecord.from_line('[0,0,1,"q","SELECT ?, ?;",[{"b":"x"},{"__bytes__":"AQ=="}],0]')
+        self.assertEqual(record.values, ({'b': 'x'}, b'\x01'))
+
+    def test__trace_errors_not_raised(self) -> None:
+        recorder = RecordingExecutor(SQLiteExecutor(), self._directory.name)
+        with self.assertLogs('database', 'ERROR'):
+            recorder.start(SQLCustom('INSERT INTO items (data) VALUES (?);', (b'x', )))
+        self.assertEqual(SQLiteExecutor().start(SQLCustom('SELECT COUNT(*) FROM items;', None)), [(1, )])
+
+    def tearDown(self) -> None:
+        self._recorder.close()
+        init()
+        self._directory.cleanup()
+
+
+if __name__ == '__main__':
+    main()